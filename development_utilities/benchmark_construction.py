@@ -0,0 +1,133 @@
+"""Compare building a large FRBC.SystemDescription through the nested constructors and through `build()`.
+
+The nested constructors validate every component separately, each through the `catch_and_convert_exceptions` wrapper.
+`build()` lets pydantic-core build the whole tree in a single validation.
+
+Usage: PYTHONPATH=src python development_utilities/benchmark_construction.py [repetitions]
+"""
+
+import sys
+import timeit
+import uuid
+from typing import Any, Dict, List
+
+from s2python.common import CommodityQuantity, NumberRange, PowerRange
+from s2python.frbc import (
+    FRBCActuatorDescription,
+    FRBCOperationMode,
+    FRBCOperationModeElement,
+    FRBCStorageDescription,
+    FRBCSystemDescription,
+)
+
+VALID_FROM = "2024-01-01T00:00:00+00:00"
+ACTUATOR_ID = uuid.UUID("2bdec96b-be3b-4ba9-afa0-c4a0632cced3")
+
+
+def operation_mode_ids(count: int) -> List[uuid.UUID]:
+    return [uuid.uuid4() for _ in range(count)]
+
+
+def with_constructors(ids: List[uuid.UUID]) -> FRBCSystemDescription:
+    return FRBCSystemDescription(
+        message_id=uuid.uuid4(),
+        valid_from=VALID_FROM,
+        actuators=[
+            FRBCActuatorDescription(
+                id=ACTUATOR_ID,
+                supported_commodities=["ELECTRICITY"],
+                operation_modes=[
+                    FRBCOperationMode(
+                        id=operation_mode_id,
+                        elements=[
+                            FRBCOperationModeElement(
+                                fill_level_range=NumberRange(start_of_range=0, end_of_range=100),
+                                fill_rate=NumberRange(start_of_range=1, end_of_range=1),
+                                power_ranges=[
+                                    PowerRange(
+                                        start_of_range=index,
+                                        end_of_range=index,
+                                        commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1,
+                                    )
+                                ],
+                            )
+                        ],
+                        abnormal_condition_only=False,
+                    )
+                    for index, operation_mode_id in enumerate(ids)
+                ],
+                transitions=[],
+                timers=[],
+            )
+        ],
+        storage=FRBCStorageDescription(
+            provides_leakage_behaviour=False,
+            provides_fill_level_target_profile=False,
+            provides_usage_forecast=False,
+            fill_level_range=NumberRange(start_of_range=0, end_of_range=100),
+        ),
+    )
+
+
+def with_build(ids: List[uuid.UUID]) -> FRBCSystemDescription:
+    operation_modes: List[Dict[str, Any]] = [
+        {
+            "id": operation_mode_id,
+            "elements": [
+                {
+                    "fill_level_range": {"start_of_range": 0, "end_of_range": 100},
+                    "fill_rate": {"start_of_range": 1, "end_of_range": 1},
+                    "power_ranges": [
+                        {
+                            "start_of_range": index,
+                            "end_of_range": index,
+                            "commodity_quantity": CommodityQuantity.ELECTRIC_POWER_L1,
+                        }
+                    ],
+                }
+            ],
+            "abnormal_condition_only": False,
+        }
+        for index, operation_mode_id in enumerate(ids)
+    ]
+    return FRBCSystemDescription.build(
+        message_id=uuid.uuid4(),
+        valid_from=VALID_FROM,
+        actuators=[
+            {
+                "id": ACTUATOR_ID,
+                "supported_commodities": ["ELECTRICITY"],
+                "operation_modes": operation_modes,
+                "transitions": [],
+                "timers": [],
+            }
+        ],
+        storage={
+            "provides_leakage_behaviour": False,
+            "provides_fill_level_target_profile": False,
+            "provides_usage_forecast": False,
+            "fill_level_range": {"start_of_range": 0, "end_of_range": 100},
+        },
+    )
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print(f"{'modes':>6}{'constructors us':>17}{'build us':>10}{'speedup':>9}")
+    for count in (10, 50, 100):
+        ids = operation_mode_ids(count)
+        assert with_constructors(ids).model_dump(exclude={"message_id"}) == with_build(ids).model_dump(
+            exclude={"message_id"}
+        )
+
+        def measure(function) -> float:
+            return min(timeit.repeat(lambda: function(ids), number=repetitions, repeat=3)) / repetitions * 1e6
+
+        constructors_time = measure(with_constructors)
+        build_time = measure(with_build)
+        print(f"{count:>6}{constructors_time:>17.0f}{build_time:>10.0f}{constructors_time / build_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
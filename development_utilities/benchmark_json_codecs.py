@@ -0,0 +1,48 @@
+"""Compare parsing and serializing every S2 message type with pydantic-core and each registered JSON codec.
+
+Usage: PYTHONPATH=src python development_utilities/benchmark_json_codecs.py [size] [repetitions]
+"""
+
+import json
+import sys
+import timeit
+
+from example_s2_messages import example_messages
+
+from s2python.json_codec import JSON_CODECS
+from s2python.s2_parser import S2Parser, TYPE_TO_MESSAGE_CLASS
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    messages = example_messages(size)
+    codecs = sorted(JSON_CODECS.values(), key=lambda codec: codec.name)
+    parsers = [("pydantic", S2Parser())] + [(codec.name, S2Parser(json_codec=codec)) for codec in codecs]
+
+    def measure(function) -> float:
+        return min(timeit.repeat(function, number=repetitions, repeat=3)) / repetitions * 1e6
+
+    header = "".join(f"{name + ' us':>14}" for name, _ in parsers)
+    print(f"{'message type':<36} {'bytes':>9}  {'parse':<9}{header}")
+    print(f"{'':<36} {'':>9}  {'serialize':<9}{header}")
+    for message_type in sorted(TYPE_TO_MESSAGE_CLASS):
+        unparsed_message = json.dumps(messages[message_type])
+        message = S2Parser.parse_as_any_message(unparsed_message)
+
+        parse_times = [measure(lambda parser=parser: parser.parse(unparsed_message)) for _, parser in parsers]
+        serialize_times = [measure(message.to_json)] + [
+            measure(lambda codec=codec: message.to_json(codec)) for codec in codecs
+        ]
+        print(
+            f"{message_type:<36} {len(unparsed_message):>9}  {'parse':<9}"
+            + "".join(f"{parse_time:>14.1f}" for parse_time in parse_times)
+        )
+        print(
+            f"{'':<36} {'':>9}  {'serialize':<9}"
+            + "".join(f"{serialize_time:>14.1f}" for serialize_time in serialize_times)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Measure hashing and interning of the `NumberRange` and `PowerRange` instances of a large FRBC.SystemDescription.
+
+The system description has 100 operation modes of 40 elements each. The fill level ranges, fill rates, power ranges
+and running costs of the elements repeat across the operation modes, as they usually do.
+
+Usage: PYTHONPATH=src python development_utilities/benchmark_ranges.py [repetitions]
+"""
+
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+import uuid
+from typing import Any, Callable, Dict, List
+
+from s2python.common import NumberRange
+from s2python.frbc import FRBCSystemDescription
+from s2python.range_pool import RangePool
+
+OPERATION_MODES = 100
+ELEMENTS = 40
+
+
+def _range(start: float, end: float) -> Dict[str, Any]:
+    return {"start_of_range": start, "end_of_range": end}
+
+
+def system_description_json() -> str:
+    operation_modes: List[Dict[str, Any]] = [
+        {
+            "id": str(uuid.uuid4()),
+            "elements": [
+                {
+                    "fill_level_range": _range(index, index + 1),
+                    "fill_rate": _range(-1.0, 1.0),
+                    "power_ranges": [{**_range(0, 1000 * (mode % 4)), "commodity_quantity": "ELECTRIC.POWER.L1"}],
+                    "running_costs": _range(0.1, 0.2),
+                }
+                for index in range(ELEMENTS)
+            ],
+            "abnormal_condition_only": False,
+        }
+        for mode in range(OPERATION_MODES)
+    ]
+    return json.dumps(
+        {
+            "message_type": "FRBC.SystemDescription",
+            "message_id": str(uuid.uuid4()),
+            "valid_from": "2024-01-01T00:00:00+00:00",
+            "actuators": [
+                {
+                    "id": str(uuid.uuid4()),
+                    "supported_commodities": ["ELECTRICITY"],
+                    "operation_modes": operation_modes,
+                    "transitions": [],
+                    "timers": [],
+                }
+            ],
+            "storage": {
+                "provides_leakage_behaviour": False,
+                "provides_fill_level_target_profile": False,
+                "provides_usage_forecast": False,
+                "fill_level_range": _range(0, ELEMENTS),
+            },
+        }
+    )
+
+
+def formatted_hash(number_range: NumberRange) -> int:
+    # The previous implementation of `NumberRange.__hash__`.
+    return hash(f"{number_range.start_of_range}|{number_range.end_of_range}")
+
+
+def retained_bytes(function: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    message = system_description_json()
+
+    def measure(function: Callable[[], Any], number: int = repetitions) -> float:
+        return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e3
+
+    def parse() -> FRBCSystemDescription:
+        return FRBCSystemDescription.from_json(message)
+
+    def parse_and_intern() -> FRBCSystemDescription:
+        return RangePool().intern_ranges(parse())
+
+    system_description = parse()
+    ranges = [
+        element.fill_level_range
+        for operation_mode in system_description.actuators[0].operation_modes
+        for element in operation_mode.elements
+    ]
+    pool = RangePool()
+    interned = pool.intern_ranges(parse())
+    assert interned.to_json() == system_description.to_json()
+
+    parsed = [parse() for _ in range(repetitions)]
+    start = timeit.default_timer()
+    for each in parsed:
+        RangePool().intern_ranges(each)
+    intern_time = (timeit.default_timer() - start) / repetitions * 1e3
+
+    print(f"{OPERATION_MODES} operation modes of {ELEMENTS} elements, {len(pool)} distinct ranges")
+    print(f"parse                     {measure(parse):8.1f} ms")
+    print(f"intern                    {intern_time:8.1f} ms")
+    print(f"hash {len(ranges)} ranges, f-string {measure(lambda: [formatted_hash(r) for r in ranges], 100):8.3f} ms")
+    print(f"hash {len(ranges)} ranges, tuple    {measure(lambda: [hash(r) for r in ranges], 100):8.3f} ms")
+    print(f"retained, parsed          {retained_bytes(parse) / 1e6:8.2f} MB")
+    print(f"retained, interned        {retained_bytes(parse_and_intern) / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Compare sending the OK ReceptionStatus reply by building and serializing a message and from a template.
+
+Usage: PYTHONPATH=src python development_utilities/benchmark_reception_status.py [repetitions]
+"""
+
+import sys
+import timeit
+import uuid
+
+from s2python.common import ReceptionStatus, ReceptionStatusValues
+from s2python.reception_status_template import PROCESSED_OKAY_LABEL, ReceptionStatusTemplate
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    subject_message_id = uuid.uuid4()
+    template = ReceptionStatusTemplate(ReceptionStatusValues.OK, PROCESSED_OKAY_LABEL)
+
+    def from_message() -> str:
+        return ReceptionStatus(
+            subject_message_id=subject_message_id,
+            status=ReceptionStatusValues.OK,
+            diagnostic_label=PROCESSED_OKAY_LABEL,
+        ).to_json()
+
+    def from_template() -> str:
+        return template.render(subject_message_id)
+
+    assert from_message() == from_template()
+
+    def measure(function) -> float:
+        return min(timeit.repeat(function, number=repetitions, repeat=3)) / repetitions * 1e6
+
+    message_time = measure(from_message)
+    template_time = measure(from_template)
+    print(f"{'message us':>12}{'template us':>13}{'speedup':>9}")
+    print(f"{message_time:>12.2f}{template_time:>13.2f}{message_time / template_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare the validated and the trusted parse path of S2Parser for every S2 message type.
+
+Usage: PYTHONPATH=src python development_utilities/benchmark_trusted_parsing.py [size] [repetitions]
+"""
+
+import json
+import sys
+import timeit
+
+from example_s2_messages import example_messages
+
+from s2python.s2_parser import S2Parser, TYPE_TO_MESSAGE_CLASS
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    messages = example_messages(size)
+    validating_parser = S2Parser()
+    trusted_parser = S2Parser(trusted=True)
+
+    print(f"{'message type':<36} {'bytes':>9} {'validated us':>13} {'trusted us':>11} {'speedup':>8}")
+    for message_type in sorted(TYPE_TO_MESSAGE_CLASS):
+        unparsed_message = json.dumps(messages[message_type])
+        validated = min(
+            timeit.repeat(lambda: validating_parser.parse(unparsed_message), number=repetitions, repeat=3)
+        )
+        trusted = min(
+            timeit.repeat(lambda: trusted_parser.parse(unparsed_message), number=repetitions, repeat=3)
+        )
+        print(
+            f"{message_type:<36} {len(unparsed_message):>9} {validated / repetitions * 1e6:>13.1f} "
+            f"{trusted / repetitions * 1e6:>11.1f} {validated / trusted:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
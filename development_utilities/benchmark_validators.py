@@ -0,0 +1,76 @@
+"""Measure how the model validators of FRBC.ActuatorDescription scale with the number of operation modes.
+
+Each actuator description has as many timers as operation modes and four transitions per operation mode. The objects
+are built with `model_construct`, so only the validators of the actuator description itself are measured. Validators
+which scale linearly take about twice as long for every doubling of the number of operation modes.
+
+Usage: PYTHONPATH=src python development_utilities/benchmark_validators.py [repetitions]
+"""
+
+import sys
+import timeit
+import uuid
+
+from s2python.common import Commodity, CommodityQuantity, Duration, NumberRange, PowerRange, Timer, Transition
+from s2python.frbc import FRBCActuatorDescription, FRBCOperationMode, FRBCOperationModeElement
+
+OPERATION_MODE_COUNTS = (125, 250, 500, 1000)
+
+
+def actuator_description(operation_mode_count: int) -> FRBCActuatorDescription:
+    element = FRBCOperationModeElement.model_construct(
+        fill_level_range=NumberRange.model_construct(start_of_range=0.0, end_of_range=1.0),
+        fill_rate=NumberRange.model_construct(start_of_range=0.0, end_of_range=1.0),
+        power_ranges=[
+            PowerRange.model_construct(
+                start_of_range=0.0, end_of_range=1.0, commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1
+            )
+        ],
+    )
+    operation_modes = [
+        FRBCOperationMode.model_construct(id=uuid.uuid4(), elements=[element], abnormal_condition_only=False)
+        for _ in range(operation_mode_count)
+    ]
+    timers = [
+        Timer.model_construct(id=uuid.uuid4(), duration=Duration.from_milliseconds(1000))
+        for _ in range(operation_mode_count)
+    ]
+    transitions = [
+        Transition.model_construct(
+            id=uuid.uuid4(),
+            from_=operation_modes[index % operation_mode_count].id,
+            to=operation_modes[(index + 1) % operation_mode_count].id,
+            start_timers=[timers[index % operation_mode_count].id],
+            blocking_timers=[timers[(index + 1) % operation_mode_count].id],
+            transition_duration=Duration.from_milliseconds(0),
+            abnormal_condition_only=False,
+        )
+        for index in range(4 * operation_mode_count)
+    ]
+    return FRBCActuatorDescription.model_construct(
+        id=uuid.uuid4(),
+        operation_modes=operation_modes,
+        transitions=transitions,
+        timers=timers,
+        supported_commodities=[Commodity.ELECTRICITY],
+    )
+
+
+def main() -> None:
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    previous = None
+    for operation_mode_count in OPERATION_MODE_COUNTS:
+        # A new actuator description per run, as the reference index is built by the first validator which needs it.
+        descriptions = [actuator_description(operation_mode_count) for _ in range(repetitions)]
+        start = timeit.default_timer()
+        for description in descriptions:
+            for name in FRBCActuatorDescription.__pydantic_decorators__.model_validators:
+                getattr(description, name)()
+        duration = (timeit.default_timer() - start) / repetitions * 1e3
+        ratio = "" if previous is None else f" ({duration / previous:.1f}x)"
+        print(f"{operation_mode_count:5} operation modes {duration:8.2f} ms{ratio}")
+        previous = duration
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare the size and the encoding and parsing time of every S2 message type as JSON and with each wire codec.
+
+Parsing includes validating the decoded message into the S2 classes.
+
+Usage: PYTHONPATH=src python development_utilities/benchmark_wire_codecs.py [size] [repetitions]
+"""
+
+import json
+import sys
+import timeit
+
+from example_s2_messages import example_messages
+
+from s2python.s2_parser import S2Parser, TYPE_TO_MESSAGE_CLASS
+from s2python.wire_codec import WIRE_CODECS
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    messages = example_messages(size)
+    codecs = sorted(WIRE_CODECS.values(), key=lambda codec: codec.name)
+    json_parser = S2Parser()
+    codec_parsers = [S2Parser(wire_codec=codec) for codec in codecs]
+
+    def measure(function) -> float:
+        return min(timeit.repeat(function, number=repetitions, repeat=3)) / repetitions * 1e6
+
+    names = ["json"] + [codec.name for codec in codecs]
+    print(
+        f"{'message type':<36}"
+        + "".join(f"{name + ' bytes':>17}{name + ' enc us':>17}{name + ' parse us':>17}" for name in names)
+    )
+    for message_type in sorted(TYPE_TO_MESSAGE_CLASS):
+        message = S2Parser.parse_as_any_message(json.dumps(messages[message_type]))
+        json_bytes = message.to_json_bytes()
+        columns = [
+            (len(json_bytes), measure(message.to_json_bytes), measure(lambda: json_parser.parse(json_bytes)))
+        ]
+        for codec, parser in zip(codecs, codec_parsers):
+            encoded = codec.encode(message)
+            columns.append(
+                (
+                    len(encoded),
+                    measure(lambda codec=codec: codec.encode(message)),
+                    measure(lambda parser=parser, encoded=encoded: parser.parse(encoded)),
+                )
+            )
+        print(
+            f"{message_type:<36}"
+            + "".join(f"{size:>17}{encode_time:>17.1f}{parse_time:>17.1f}" for size, encode_time, parse_time in columns)
+        )
+
+
+if __name__ == "__main__":
+    main()
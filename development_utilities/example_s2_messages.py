@@ -0,0 +1,521 @@
+"""Example S2 messages for every message type, used by the benchmarks in this directory.
+
+The messages are returned as JSON-compatible dictionaries. `size` controls the length of the lists in the larger
+messages (operation modes, forecast elements, power sequences etc.) so the benchmarks can show how the cost scales
+with the message size. Each list is capped at the maximum length allowed by the S2 schema.
+"""
+
+import datetime
+import uuid
+from typing import Any, Dict, List
+
+START_TIME = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc).isoformat()
+END_TIME = datetime.datetime(2025, 1, 2, tzinfo=datetime.timezone.utc).isoformat()
+
+
+def _id() -> str:
+    return str(uuid.uuid4())
+
+
+def _power_forecast_value() -> Dict[str, Any]:
+    return {
+        "value_upper_limit": 4000.0,
+        "value_upper_95PPR": 3800.0,
+        "value_upper_68PPR": 3600.0,
+        "value_expected": 3500.0,
+        "value_lower_68PPR": 3400.0,
+        "value_lower_95PPR": 3200.0,
+        "value_lower_limit": 3000.0,
+        "commodity_quantity": "ELECTRIC.POWER.L1",
+    }
+
+
+def _frbc_operation_mode(size: int) -> Dict[str, Any]:
+    elements_count = min(size, 100)
+    step = 100.0 / elements_count
+    return {
+        "id": _id(),
+        "diagnostic_label": "operation mode",
+        "abnormal_condition_only": False,
+        "elements": [
+            {
+                "fill_level_range": {"start_of_range": i * step, "end_of_range": (i + 1) * step},
+                "fill_rate": {"start_of_range": 0.1, "end_of_range": 5.0},
+                "power_ranges": [
+                    {"start_of_range": 0.0, "end_of_range": 3000.0, "commodity_quantity": "ELECTRIC.POWER.L1"}
+                ],
+                "running_costs": {"start_of_range": 0.1, "end_of_range": 0.2},
+            }
+            for i in range(elements_count)
+        ],
+    }
+
+
+def _frbc_actuator_description(size: int) -> Dict[str, Any]:
+    operation_modes = [_frbc_operation_mode(size) for _ in range(min(size, 100))]
+    timers = [
+        {"id": _id(), "diagnostic_label": "timer", "duration": 60000}
+        for _ in range(min(size, 1000))
+    ]
+    transitions = [
+        {
+            "id": _id(),
+            "from": operation_modes[i]["id"],
+            "to": operation_modes[(i + 1) % len(operation_modes)]["id"],
+            "start_timers": [timers[i % len(timers)]["id"]],
+            "blocking_timers": [timers[(i + 1) % len(timers)]["id"]],
+            "transition_costs": 0.5,
+            "transition_duration": 1000,
+            "abnormal_condition_only": False,
+        }
+        for i in range(min(size, 1000))
+    ]
+    return {
+        "id": _id(),
+        "diagnostic_label": "actuator",
+        "supported_commodities": ["ELECTRICITY"],
+        "operation_modes": operation_modes,
+        "transitions": transitions,
+        "timers": timers,
+    }
+
+
+def _ombc_operation_mode() -> Dict[str, Any]:
+    return {
+        "id": _id(),
+        "diagnostic_label": "operation mode",
+        "power_ranges": [
+            {"start_of_range": 0.0, "end_of_range": 3000.0, "commodity_quantity": "ELECTRIC.POWER.L1"}
+        ],
+        "running_costs": {"start_of_range": 0.1, "end_of_range": 0.2},
+        "abnormal_condition_only": False,
+    }
+
+
+def _ddbc_actuator_description(size: int) -> Dict[str, Any]:
+    operation_modes = []
+    for _ in range(min(size, 100)):
+        operation_mode_id = _id()
+        operation_modes.append(
+            {
+                "Id": operation_mode_id,
+                "id": operation_mode_id,
+                "diagnostic_label": "operation mode",
+                "power_ranges": [
+                    {"start_of_range": 0.0, "end_of_range": 3000.0, "commodity_quantity": "ELECTRIC.POWER.L1"}
+                ],
+                "supply_range": [{"start_of_range": 0.0, "end_of_range": 10.0}],
+                "running_costs": {"start_of_range": 0.1, "end_of_range": 0.2},
+                "abnormal_condition_only": False,
+            }
+        )
+    timers = [{"id": _id(), "duration": 60000} for _ in range(min(size, 1000))]
+    transitions = [
+        {
+            "id": _id(),
+            "from": operation_modes[i]["id"],
+            "to": operation_modes[(i + 1) % len(operation_modes)]["id"],
+            "start_timers": [timers[i % len(timers)]["id"]],
+            "blocking_timers": [],
+            "abnormal_condition_only": False,
+        }
+        for i in range(min(size, 1000))
+    ]
+    return {
+        "id": _id(),
+        "diagnostic_label": "actuator",
+        "supported_commodites": ["ELECTRICITY"],
+        "operation_modes": operation_modes,
+        "transitions": transitions,
+        "timers": timers,
+    }
+
+
+def _ppbc_power_sequence_container(size: int) -> Dict[str, Any]:
+    return {
+        "id": _id(),
+        "power_sequences": [
+            {
+                "id": _id(),
+                "elements": [
+                    {"duration": 900000, "power_values": [_power_forecast_value()]}
+                    for _ in range(min(size, 288))
+                ],
+                "is_interruptible": False,
+                "max_pause_before": 0,
+                "abnormal_condition_only": False,
+            }
+            for _ in range(min(size, 288))
+        ],
+    }
+
+
+def example_messages(size: int = 10) -> Dict[str, Dict[str, Any]]:  # pylint: disable=too-many-locals
+    """Create a valid example message for every S2 message type.
+
+    :param size: The length of the lists within the larger messages.
+    :return: The example messages as JSON-compatible dictionaries by message type.
+    """
+    forecast_elements = min(size, 288)
+    ombc_operation_modes = [_ombc_operation_mode() for _ in range(min(size, 100))]
+    ombc_timers: List[Dict[str, Any]] = [{"id": _id(), "duration": 60000} for _ in range(min(size, 1000))]
+
+    messages: List[Dict[str, Any]] = [
+        {
+            "message_type": "DDBC.ActuatorStatus",
+            "message_id": _id(),
+            "actuator_id": _id(),
+            "active_operation_mode_id": _id(),
+            "operation_mode_factor": 0.5,
+            "previous_operation_mode_id": _id(),
+            "transition_timestamp": START_TIME,
+        },
+        {
+            "message_type": "DDBC.AverageDemandRateForecast",
+            "message_id": _id(),
+            "start_time": START_TIME,
+            "elements": [
+                {
+                    "duration": 900000,
+                    "demand_rate_upper_limit": 4.0,
+                    "demand_rate_upper_95PPR": 3.8,
+                    "demand_rate_upper_68PPR": 3.6,
+                    "demand_rate_expected": 3.5,
+                    "demand_rate_lower_68PPR": 3.4,
+                    "demand_rate_lower_95PPR": 3.2,
+                    "demand_rate_lower_limit": 3.0,
+                }
+                for _ in range(forecast_elements)
+            ],
+        },
+        {
+            "message_type": "DDBC.Instruction",
+            "message_id": _id(),
+            "id": _id(),
+            "execution_time": START_TIME,
+            "abnormal_condition": False,
+            "actuator_id": _id(),
+            "operation_mode_id": _id(),
+            "operation_mode_factor": 0.5,
+        },
+        {
+            "message_type": "DDBC.SystemDescription",
+            "message_id": _id(),
+            "valid_from": START_TIME,
+            "actuators": [_ddbc_actuator_description(size) for _ in range(min(size, 10))],
+            "present_demand_rate": {"start_of_range": 0.0, "end_of_range": 10.0},
+            "provides_average_demand_rate_forecast": True,
+        },
+        {
+            "message_type": "DDBC.TimerStatus",
+            "message_id": _id(),
+            "timer_id": _id(),
+            "actuator_id": _id(),
+            "finished_at": START_TIME,
+        },
+        {
+            "message_type": "FRBC.ActuatorStatus",
+            "message_id": _id(),
+            "actuator_id": _id(),
+            "active_operation_mode_id": _id(),
+            "operation_mode_factor": 0.5,
+            "previous_operation_mode_id": _id(),
+            "transition_timestamp": START_TIME,
+        },
+        {
+            "message_type": "FRBC.FillLevelTargetProfile",
+            "message_id": _id(),
+            "start_time": START_TIME,
+            "elements": [
+                {"duration": 900000, "fill_level_range": {"start_of_range": 10.0, "end_of_range": 90.0}}
+                for _ in range(forecast_elements)
+            ],
+        },
+        {
+            "message_type": "FRBC.Instruction",
+            "message_id": _id(),
+            "id": _id(),
+            "actuator_id": _id(),
+            "operation_mode": _id(),
+            "operation_mode_factor": 0.5,
+            "execution_time": START_TIME,
+            "abnormal_condition": False,
+        },
+        {
+            "message_type": "FRBC.LeakageBehaviour",
+            "message_id": _id(),
+            "valid_from": START_TIME,
+            "elements": [
+                {
+                    "fill_level_range": {
+                        "start_of_range": i * 100.0 / forecast_elements,
+                        "end_of_range": (i + 1) * 100.0 / forecast_elements,
+                    },
+                    "leakage_rate": 0.1,
+                }
+                for i in range(forecast_elements)
+            ],
+        },
+        {
+            "message_type": "FRBC.StorageStatus",
+            "message_id": _id(),
+            "present_fill_level": 42.0,
+        },
+        {
+            "message_type": "FRBC.SystemDescription",
+            "message_id": _id(),
+            "valid_from": START_TIME,
+            "actuators": [_frbc_actuator_description(size)],
+            "storage": {
+                "diagnostic_label": "storage",
+                "fill_level_label": "%",
+                "provides_leakage_behaviour": True,
+                "provides_fill_level_target_profile": True,
+                "provides_usage_forecast": True,
+                "fill_level_range": {"start_of_range": 0.0, "end_of_range": 100.0},
+            },
+        },
+        {
+            "message_type": "FRBC.TimerStatus",
+            "message_id": _id(),
+            "timer_id": _id(),
+            "actuator_id": _id(),
+            "finished_at": START_TIME,
+        },
+        {
+            "message_type": "FRBC.UsageForecast",
+            "message_id": _id(),
+            "start_time": START_TIME,
+            "elements": [
+                {
+                    "duration": 900000,
+                    "usage_rate_upper_limit": 4.0,
+                    "usage_rate_upper_95PPR": 3.8,
+                    "usage_rate_upper_68PPR": 3.6,
+                    "usage_rate_expected": 3.5,
+                    "usage_rate_lower_68PPR": 3.4,
+                    "usage_rate_lower_95PPR": 3.2,
+                    "usage_rate_lower_limit": 3.0,
+                }
+                for _ in range(forecast_elements)
+            ],
+        },
+        {
+            "message_type": "Handshake",
+            "message_id": _id(),
+            "role": "RM",
+            "supported_protocol_versions": ["0.0.2-beta"],
+        },
+        {
+            "message_type": "HandshakeResponse",
+            "message_id": _id(),
+            "selected_protocol_version": "0.0.2-beta",
+        },
+        {
+            "message_type": "InstructionStatusUpdate",
+            "message_id": _id(),
+            "instruction_id": _id(),
+            "status_type": "SUCCEEDED",
+            "timestamp": START_TIME,
+        },
+        {
+            "message_type": "OMBC.Instruction",
+            "message_id": _id(),
+            "id": _id(),
+            "execution_time": START_TIME,
+            "operation_mode_id": _id(),
+            "operation_mode_factor": 0.5,
+            "abnormal_condition": False,
+        },
+        {
+            "message_type": "OMBC.Status",
+            "message_id": _id(),
+            "active_operation_mode_id": _id(),
+            "operation_mode_factor": 0.5,
+            "previous_operation_mode_id": _id(),
+            "transition_timestamp": START_TIME,
+        },
+        {
+            "message_type": "OMBC.SystemDescription",
+            "message_id": _id(),
+            "valid_from": START_TIME,
+            "operation_modes": ombc_operation_modes,
+            "transitions": [
+                {
+                    "id": _id(),
+                    "from": ombc_operation_modes[i]["id"],
+                    "to": ombc_operation_modes[(i + 1) % len(ombc_operation_modes)]["id"],
+                    "start_timers": [ombc_timers[i % len(ombc_timers)]["id"]],
+                    "blocking_timers": [],
+                    "abnormal_condition_only": False,
+                }
+                for i in range(min(size, 1000))
+            ],
+            "timers": ombc_timers,
+        },
+        {
+            "message_type": "OMBC.TimerStatus",
+            "message_id": _id(),
+            "timer_id": _id(),
+            "finished_at": START_TIME,
+        },
+        {
+            "message_type": "PEBC.EnergyConstraint",
+            "message_id": _id(),
+            "id": _id(),
+            "valid_from": START_TIME,
+            "valid_until": END_TIME,
+            "upper_average_power": 4000.0,
+            "lower_average_power": 1000.0,
+            "commodity_quantity": "ELECTRIC.POWER.L1",
+        },
+        {
+            "message_type": "PEBC.Instruction",
+            "message_id": _id(),
+            "id": _id(),
+            "execution_time": START_TIME,
+            "abnormal_condition": False,
+            "power_constraints_id": _id(),
+            "power_envelopes": [
+                {
+                    "id": _id(),
+                    "commodity_quantity": "ELECTRIC.POWER.L1",
+                    "power_envelope_elements": [
+                        {"duration": 900000, "upper_limit": 4000.0, "lower_limit": 0.0}
+                        for _ in range(forecast_elements)
+                    ],
+                }
+            ],
+        },
+        {
+            "message_type": "PEBC.PowerConstraints",
+            "message_id": _id(),
+            "id": _id(),
+            "valid_from": START_TIME,
+            "valid_until": END_TIME,
+            "consequence_type": "DEFER",
+            "allowed_limit_ranges": [
+                {
+                    "commodity_quantity": "ELECTRIC.POWER.L1",
+                    "limit_type": "UPPER_LIMIT",
+                    "range_boundary": {"start_of_range": 0.0, "end_of_range": 4000.0},
+                    "abnormal_condition_only": False,
+                },
+                {
+                    "commodity_quantity": "ELECTRIC.POWER.L1",
+                    "limit_type": "LOWER_LIMIT",
+                    "range_boundary": {"start_of_range": 0.0, "end_of_range": 1000.0},
+                    "abnormal_condition_only": False,
+                },
+            ],
+        },
+        {
+            "message_type": "PPBC.EndInterruptionInstruction",
+            "message_id": _id(),
+            "id": _id(),
+            "power_profile_id": _id(),
+            "sequence_container_id": _id(),
+            "power_sequence_id": _id(),
+            "execution_time": START_TIME,
+            "abnormal_condition": False,
+        },
+        {
+            "message_type": "PPBC.PowerProfileDefinition",
+            "message_id": _id(),
+            "id": _id(),
+            "start_time": START_TIME,
+            "end_time": END_TIME,
+            "power_sequences_containers": [
+                _ppbc_power_sequence_container(size) for _ in range(min(size, 1000))
+            ],
+        },
+        {
+            "message_type": "PPBC.PowerProfileStatus",
+            "message_id": _id(),
+            "sequence_container_status": [
+                {
+                    "power_profile_id": _id(),
+                    "sequence_container_id": _id(),
+                    "selected_sequence_id": _id(),
+                    "status": "SCHEDULED",
+                }
+                for _ in range(min(size, 1000))
+            ],
+        },
+        {
+            "message_type": "PPBC.ScheduleInstruction",
+            "message_id": _id(),
+            "id": _id(),
+            "power_profile_id": _id(),
+            "sequence_container_id": _id(),
+            "power_sequence_id": _id(),
+            "execution_time": START_TIME,
+            "abnormal_condition": False,
+        },
+        {
+            "message_type": "PPBC.StartInterruptionInstruction",
+            "message_id": _id(),
+            "id": _id(),
+            "power_profile_id": _id(),
+            "sequence_container_id": _id(),
+            "power_sequence_id": _id(),
+            "execution_time": START_TIME,
+            "abnormal_condition": False,
+        },
+        {
+            "message_type": "PowerForecast",
+            "message_id": _id(),
+            "start_time": START_TIME,
+            "elements": [
+                {"duration": 900000, "power_values": [_power_forecast_value()]}
+                for _ in range(forecast_elements)
+            ],
+        },
+        {
+            "message_type": "PowerMeasurement",
+            "message_id": _id(),
+            "measurement_timestamp": START_TIME,
+            "values": [{"commodity_quantity": "ELECTRIC.POWER.L1", "value": 3500.0}],
+        },
+        {
+            "message_type": "ReceptionStatus",
+            "subject_message_id": _id(),
+            "status": "OK",
+            "diagnostic_label": "Processed okay.",
+        },
+        {
+            "message_type": "ResourceManagerDetails",
+            "message_id": _id(),
+            "resource_id": _id(),
+            "name": "battery",
+            "roles": [{"role": "ENERGY_STORAGE", "commodity": "ELECTRICITY"}],
+            "manufacturer": "manufacturer",
+            "model": "model",
+            "serial_number": "1234",
+            "firmware_version": "1.0",
+            "instruction_processing_delay": 100,
+            "available_control_types": ["FILL_RATE_BASED_CONTROL", "NOT_CONTROLABLE"],
+            "currency": "EUR",
+            "provides_forecast": True,
+            "provides_power_measurement_types": ["ELECTRIC.POWER.L1"],
+        },
+        {
+            "message_type": "RevokeObject",
+            "message_id": _id(),
+            "object_type": "FRBC.Instruction",
+            "object_id": _id(),
+        },
+        {
+            "message_type": "SelectControlType",
+            "message_id": _id(),
+            "control_type": "FILL_RATE_BASED_CONTROL",
+        },
+        {
+            "message_type": "SessionRequest",
+            "message_id": _id(),
+            "request": "RECONNECT",
+            "diagnostic_label": "reconnect",
+        },
+    ]
+
+    return {message["message_type"]: message for message in messages}
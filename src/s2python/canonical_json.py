@@ -0,0 +1,71 @@
+"""Canonical JSON serialization of S2 messages for hashing and comparison.
+
+Two S2 objects which are equal have the same canonical JSON, regardless of how they were created:
+
+- object keys are sorted and no whitespace is used;
+- fields which are None are left out;
+- UUIDs are lowercase and hyphenated;
+- aware datetimes are converted to UTC;
+- `-0.0` is written as `0.0` and floats use the shortest representation which round-trips;
+- enums are written as their value.
+"""
+
+import datetime
+import enum
+import hashlib
+import json
+import uuid
+from typing import Any
+
+from pydantic import BaseModel  # pylint: disable=no-name-in-module
+from pydantic_core import to_jsonable_python
+
+CONTENT_HASH_EXCLUDED_FIELDS = frozenset({"message_id"})
+
+_PLAIN_TYPES = (str, int, bool, type(None))
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def _canonical_value(value: Any) -> Any:  # pylint: disable=too-many-return-statements
+    # Dispatch on the exact type first, as almost all values are dicts, lists, strings and numbers.
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _canonical_value(item) for key, item in value.items()}
+    if value_type is list or value_type is tuple:
+        return [_canonical_value(item) for item in value]
+    if value_type in _PLAIN_TYPES:
+        return value
+    if value_type is float:
+        return value if value else 0.0
+    if isinstance(value, enum.Enum):
+        return _canonical_value(value.value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        return value.isoformat()
+    return to_jsonable_python(value)
+
+
+def canonical_json(model: BaseModel, exclude_message_id: bool = False) -> bytes:
+    """Serialize an S2 object to canonical JSON.
+
+    :param model: The S2 message or message component.
+    :param exclude_message_id: Leave out the `message_id` of the message itself (not of nested objects), so messages
+                               which are resent with a new message id have the same canonical JSON.
+    :return: The UTF-8 encoded canonical JSON.
+    """
+    exclude = CONTENT_HASH_EXCLUDED_FIELDS if exclude_message_id else None
+    data = model.model_dump(by_alias=True, exclude_none=True, exclude=exclude)  # type: ignore[arg-type]
+    return _CANONICAL_ENCODER.encode(_canonical_value(data)).encode("utf-8")
+
+
+def content_hash(model: BaseModel, exclude_message_id: bool = True) -> str:
+    """Compute a digest of the canonical JSON of an S2 object.
+
+    :param model: The S2 message or message component.
+    :param exclude_message_id: Leave out the `message_id` of the message itself, see `canonical_json`.
+    :return: The hexadecimal SHA-256 digest.
+    """
+    return hashlib.sha256(canonical_json(model, exclude_message_id)).hexdigest()
@@ -13,9 +13,11 @@ class NumberRange(GenNumberRange, S2MessageComponent):
     model_config["validate_assignment"] = True
 
     def __hash__(self) -> int:
-        return hash(f"{self.start_of_range}|{self.end_of_range}")
+        return hash((self.start_of_range, self.end_of_range))
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, NumberRange):
             return (
                 self.start_of_range == other.start_of_range
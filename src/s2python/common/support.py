@@ -1,27 +1,33 @@
+from typing import Dict, Optional
+
 from s2python.common import CommodityQuantity, Commodity
 
+_COMMODITY_BY_QUANTITY: Dict[CommodityQuantity, Commodity] = {
+    CommodityQuantity.HEAT_THERMAL_POWER: Commodity.HEAT,
+    CommodityQuantity.HEAT_TEMPERATURE: Commodity.HEAT,
+    CommodityQuantity.HEAT_FLOW_RATE: Commodity.HEAT,
+    CommodityQuantity.ELECTRIC_POWER_3_PHASE_SYMMETRIC: Commodity.ELECTRICITY,
+    CommodityQuantity.ELECTRIC_POWER_L1: Commodity.ELECTRICITY,
+    CommodityQuantity.ELECTRIC_POWER_L2: Commodity.ELECTRICITY,
+    CommodityQuantity.ELECTRIC_POWER_L3: Commodity.ELECTRICITY,
+    CommodityQuantity.NATURAL_GAS_FLOW_RATE: Commodity.GAS,
+    CommodityQuantity.OIL_FLOW_RATE: Commodity.OIL,
+}
+
+
+def commodity_of_quantity(quantity: CommodityQuantity) -> Optional[Commodity]:
+    """Look up the commodity which a commodity quantity is a quantity of.
+
+    :param quantity: The commodity quantity.
+    :return: The commodity or None if the quantity does not belong to any of the supported commodities.
+    """
+    return _COMMODITY_BY_QUANTITY.get(quantity)
+
 
 def commodity_has_quantity(commodity: "Commodity", quantity: CommodityQuantity) -> bool:
-    if commodity == Commodity.HEAT:
-        result = quantity in [
-            CommodityQuantity.HEAT_THERMAL_POWER,
-            CommodityQuantity.HEAT_TEMPERATURE,
-            CommodityQuantity.HEAT_FLOW_RATE,
-        ]
-    elif commodity == Commodity.ELECTRICITY:
-        result = quantity in [
-            CommodityQuantity.ELECTRIC_POWER_3_PHASE_SYMMETRIC,
-            CommodityQuantity.ELECTRIC_POWER_L1,
-            CommodityQuantity.ELECTRIC_POWER_L2,
-            CommodityQuantity.ELECTRIC_POWER_L3,
-        ]
-    elif commodity == Commodity.GAS:
-        result = quantity in [CommodityQuantity.NATURAL_GAS_FLOW_RATE]
-    elif commodity == Commodity.OIL:
-        result = quantity in [CommodityQuantity.OIL_FLOW_RATE]
-    else:
+    if commodity not in _COMMODITY_BY_QUANTITY.values():
         raise RuntimeError(
             f"Unsupported commodity {commodity}. Missing implementation."
         )
 
-    return result
+    return _COMMODITY_BY_QUANTITY.get(quantity) == commodity
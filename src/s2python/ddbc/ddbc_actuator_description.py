@@ -9,6 +9,7 @@ from s2python.ddbc.ddbc_operation_mode import DDBCOperationMode
 
 from s2python.common.timer import Timer
 
+from s2python.reference_index import ReferenceIndexMixin
 from s2python.validate_values_mixin import (
     catch_and_convert_exceptions,
     S2MessageComponent,
@@ -16,7 +17,11 @@ from s2python.validate_values_mixin import (
 
 
 @catch_and_convert_exceptions
-class DDBCActuatorDescription(GenDDBCActuatorDescription, S2MessageComponent):
+class DDBCActuatorDescription(
+    GenDDBCActuatorDescription,
+    S2MessageComponent,
+    ReferenceIndexMixin[DDBCOperationMode],
+):
     model_config = GenDDBCActuatorDescription.model_config
     model_config["validate_assignment"] = True
 
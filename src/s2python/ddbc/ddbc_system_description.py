@@ -6,6 +6,8 @@ from s2python.generated.gen_s2 import (
 )
 from s2python.common.number_range import NumberRange
 from s2python.ddbc.ddbc_actuator_description import DDBCActuatorDescription
+from s2python.ddbc.ddbc_operation_mode import DDBCOperationMode
+from s2python.reference_index import ActuatorIndexMixin, ReferenceIndexMixin
 from s2python.validate_values_mixin import (
     catch_and_convert_exceptions,
     S2MessageComponent,
@@ -13,7 +15,12 @@ from s2python.validate_values_mixin import (
 
 
 @catch_and_convert_exceptions
-class DDBCSystemDescription(GenDDBCSystemDescription, S2MessageComponent):
+class DDBCSystemDescription(
+    GenDDBCSystemDescription,
+    S2MessageComponent,
+    ReferenceIndexMixin[DDBCOperationMode],
+    ActuatorIndexMixin[DDBCActuatorDescription],
+):
     model_config = GenDDBCSystemDescription.model_config
     model_config["validate_assignment"] = True
 
@@ -0,0 +1,92 @@
+"""Defer the validation of assignments to an S2 object until a number of fields have been updated.
+
+The S2 classes validate every assignment, including all model validators of the object. When several fields are
+updated together, e.g. the `elements` and `start_time` of an `FRBCFillLevelTargetProfile`, the intermediate states
+are validated needlessly and may even be invalid on their own. Within `S2MessageComponent.deferred_validation()` the
+assignments to the object are stored without validation and the object is validated once, as a whole, on exit.
+
+If the final state is invalid, or an exception is raised within the context, the assigned fields are restored to their
+previous values. Assignments to nested objects are validated as usual. Validation is only deferred for the
+assignments within the context itself, i.e. in the same thread or asyncio task.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, TypeVar
+
+from pydantic import BaseModel, ValidationError  # pylint: disable=no-name-in-module
+
+from s2python import reference_index, sealed_json
+from s2python.s2_validation_error import S2ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+# The values of the fields which were assigned before they were assigned, per object with deferred validation. The
+# mapping itself is never changed but replaced, so that each thread and asyncio task has its own.
+_ORIGINAL_VALUES: ContextVar[Dict[int, Dict[str, Any]]] = ContextVar("deferred_original_values", default={})
+
+
+def assign_deferred(model: BaseModel, name: str, value: Any) -> bool:
+    """Assign a field without validation if validation of the object is deferred.
+
+    :param model: The S2 object which is assigned to.
+    :param name: The name of the field.
+    :param value: The new (unvalidated) value.
+    :return: True if the value was assigned, False if it has to be assigned and validated as usual.
+    """
+    original_values = _ORIGINAL_VALUES.get().get(id(model))
+    if original_values is None or name not in type(model).model_fields:
+        return False
+    original_values.setdefault(name, model.__dict__.get(name))
+    model.__dict__[name] = value
+    sealed_json.notify_assignment(model, name)
+    return True
+
+
+def _restore(model: BaseModel, original_values: Dict[str, Any]) -> None:
+    model.__dict__.update(original_values)
+    if not original_values.keys().isdisjoint(reference_index.REFERENCE_FIELDS):
+        reference_index.notify_assignment(model)
+    for name in original_values:
+        sealed_json.notify_assignment(model, name)
+
+
+@contextmanager
+def defer_validation(model: M) -> Iterator[M]:
+    """Defer the validation of assignments to an S2 object until the end of the context.
+
+    Nested contexts for the same object only validate when the outermost context exits.
+
+    :param model: The S2 message or message component.
+    :raises: S2ValidationError on exit if the object is invalid after the assignments.
+    :return: The context, which yields the object itself.
+    """
+    deferred = _ORIGINAL_VALUES.get()
+    if id(model) in deferred or model.model_config.get("frozen", False):
+        yield model
+        return
+
+    original_values: Dict[str, Any] = {}
+    token = _ORIGINAL_VALUES.set({**deferred, id(model): original_values})
+    try:
+        yield model
+    except BaseException:
+        _restore(model, original_values)
+        raise
+    finally:
+        _ORIGINAL_VALUES.reset(token)
+
+    if not original_values:
+        return
+    try:
+        validated = model.__pydantic_validator__.validate_python(dict(model.__dict__))
+    except (ValidationError, TypeError) as e:
+        _restore(model, original_values)
+        raise S2ValidationError(type(model), model, "Pydantic raised a validation error.") from e
+    # The model validators may have changed other fields than the assigned ones as well.
+    model.__dict__.update(validated.__dict__)
+    model.__pydantic_fields_set__.update(original_values)
+    if not original_values.keys().isdisjoint(reference_index.REFERENCE_FIELDS):
+        reference_index.notify_assignment(model)
+    for name in original_values:
+        sealed_json.notify_assignment(model, name)
@@ -0,0 +1,74 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class RejectedFrameCounters:
+    """Counts the incoming frames which were rejected by an S2 connection."""
+
+    oversized: int = 0
+    invalid_json: int = 0
+    invalid_message: int = 0
+    suppressed_replies: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.oversized + self.invalid_json + self.invalid_message
+
+
+class ErrorReplyLimiter:
+    """Token bucket which limits how many error replies (INVALID_DATA or INVALID_MESSAGE) are sent.
+
+    Replies which are not allowed are counted so the next allowed reply can mention how many were suppressed.
+    """
+
+    rate: Optional[float]
+    burst: int
+
+    _tokens: float
+    _last_refill: float
+    _suppressed: int
+    _clock: Callable[[], float]
+
+    def __init__(self, rate: Optional[float], burst: int = 10, clock: Callable[[], float] = time.monotonic):
+        """Create a new limiter.
+
+        :param rate: The number of replies per second which is allowed on average. None allows all replies.
+        :param burst: The number of replies which may be sent at once.
+        :param clock: The (monotonic) clock in seconds.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._clock = clock
+        self._last_refill = clock()
+        self._suppressed = 0
+
+    def try_acquire(self) -> bool:
+        """Try to acquire permission to send a single error reply.
+
+        :return: True if the reply may be sent. Otherwise the reply is counted as suppressed.
+        """
+        if self.rate is None:
+            return True
+
+        now = self._clock()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+
+        self._suppressed += 1
+        return False
+
+    def take_suppressed(self) -> int:
+        """Retrieve and reset the number of replies which were suppressed since the last call.
+
+        :return: The number of suppressed replies.
+        """
+        suppressed = self._suppressed
+        self._suppressed = 0
+        return suppressed
@@ -1,16 +1,18 @@
 import uuid
 
-from typing import List
+from collections import Counter
+from typing import List, Set
 from typing_extensions import Self
 
 from pydantic import model_validator
 
 from s2python.common import Transition, Timer, Commodity
-from s2python.common.support import commodity_has_quantity
+from s2python.common.support import commodity_of_quantity
 from s2python.frbc.frbc_operation_mode import FRBCOperationMode
 from s2python.generated.gen_s2 import (
     FRBCActuatorDescription as GenFRBCActuatorDescription,
 )
+from s2python.reference_index import ReferenceIndexMixin, reference_index
 from s2python.validate_values_mixin import (
     S2MessageComponent,
     catch_and_convert_exceptions,
@@ -18,7 +20,9 @@ from s2python.validate_values_mixin import (
 
 
 @catch_and_convert_exceptions
-class FRBCActuatorDescription(GenFRBCActuatorDescription, S2MessageComponent):
+class FRBCActuatorDescription(
+    GenFRBCActuatorDescription, S2MessageComponent, ReferenceIndexMixin[FRBCOperationMode]
+):
     model_config = GenFRBCActuatorDescription.model_config
     model_config["validate_assignment"] = True
 
@@ -34,7 +38,7 @@ class FRBCActuatorDescription(GenFRBCActuatorDescription, S2MessageComponent):
 
     @model_validator(mode="after")
     def validate_timers_in_transitions(self) -> Self:
-        timers_by_id = {timer.id: timer for timer in self.timers}
+        timers_by_id = reference_index(self).timers_by_id
         transition: Transition
         for transition in self.transitions:
             for start_timer_id in transition.start_timers:
@@ -57,22 +61,23 @@ class FRBCActuatorDescription(GenFRBCActuatorDescription, S2MessageComponent):
 
     @model_validator(mode="after")
     def validate_timers_unique_ids(self) -> Self:
-        ids = []
+        if len(reference_index(self).timers_by_id) == len(self.timers):
+            return self
+
+        ids: Set[uuid.UUID] = set()
         timer: Timer
         for timer in self.timers:
             if timer.id in ids:
                 raise ValueError(
                     self, f"Id {timer.id} was found multiple times in 'timers'."
                 )
-            ids.append(timer.id)
+            ids.add(timer.id)
 
         return self
 
     @model_validator(mode="after")
     def validate_operation_modes_in_transitions(self) -> Self:
-        operation_mode_by_id = {
-            operation_mode.id: operation_mode for operation_mode in self.operation_modes
-        }
+        operation_mode_by_id = reference_index(self).operation_modes_by_id
         transition: Transition
         for transition in self.transitions:
             if transition.from_ not in operation_mode_by_id:
@@ -93,7 +98,10 @@ class FRBCActuatorDescription(GenFRBCActuatorDescription, S2MessageComponent):
 
     @model_validator(mode="after")
     def validate_operation_modes_unique_ids(self) -> Self:
-        ids = []
+        if len(reference_index(self).operation_modes_by_id) == len(self.operation_modes):
+            return self
+
+        ids: Set[uuid.UUID] = set()
         operation_mode: FRBCOperationMode
         for operation_mode in self.operation_modes:
             if operation_mode.id in ids:
@@ -101,7 +109,7 @@ class FRBCActuatorDescription(GenFRBCActuatorDescription, S2MessageComponent):
                     self,
                     f"Id {operation_mode.id} was found multiple times in 'operation_modes'.",
                 )
-            ids.append(operation_mode.id)
+            ids.add(operation_mode.id)
 
         return self
 
@@ -111,23 +119,19 @@ class FRBCActuatorDescription(GenFRBCActuatorDescription, S2MessageComponent):
         operation_mode: FRBCOperationMode
         for operation_mode in self.operation_modes:
             for operation_mode_element in operation_mode.elements:
+                power_ranges_per_commodity = Counter(
+                    commodity_of_quantity(power_range.commodity_quantity)
+                    for power_range in operation_mode_element.power_ranges
+                )
                 for commodity in supported_commodities:
-                    power_ranges_for_commodity = [
-                        power_range
-                        for power_range in operation_mode_element.power_ranges
-                        if commodity_has_quantity(
-                            commodity, power_range.commodity_quantity
-                        )
-                    ]
-
-                    if len(power_ranges_for_commodity) > 1:
+                    if power_ranges_per_commodity[commodity] > 1:
                         raise ValueError(
                             self,
                             f"Multiple power ranges defined for commodity {commodity} in operation "
                             f"mode {operation_mode.id} and element with fill_level_range "
                             f"{operation_mode_element.fill_level_range}",
                         )
-                    if not power_ranges_for_commodity:
+                    if not power_ranges_per_commodity[commodity]:
                         raise ValueError(
                             self,
                             f"No power ranges defined for commodity {commodity} in operation "
@@ -138,12 +142,13 @@ class FRBCActuatorDescription(GenFRBCActuatorDescription, S2MessageComponent):
 
     @model_validator(mode="after")
     def validate_unique_supported_commodities(self) -> Self:
-        supported_commodities: List[Commodity] = self.supported_commodities
+        supported_commodities: Set[Commodity] = set()
 
-        for supported_commodity in supported_commodities:
-            if supported_commodities.count(supported_commodity) > 1:
+        for supported_commodity in self.supported_commodities:
+            if supported_commodity in supported_commodities:
                 raise ValueError(
                     self,
                     f"Found duplicate {supported_commodity} commodity in 'supported_commodities'",
                 )
+            supported_commodities.add(supported_commodity)
         return self
@@ -2,6 +2,8 @@ from typing import List
 import uuid
 
 from s2python.generated.gen_s2 import FRBCSystemDescription as GenFRBCSystemDescription
+from s2python.frbc.frbc_operation_mode import FRBCOperationMode
+from s2python.reference_index import ActuatorIndexMixin, ReferenceIndexMixin
 from s2python.validate_values_mixin import (
     catch_and_convert_exceptions,
     S2MessageComponent,
@@ -11,7 +13,12 @@ from s2python.frbc.frbc_storage_description import FRBCStorageDescription
 
 
 @catch_and_convert_exceptions
-class FRBCSystemDescription(GenFRBCSystemDescription, S2MessageComponent):
+class FRBCSystemDescription(
+    GenFRBCSystemDescription,
+    S2MessageComponent,
+    ReferenceIndexMixin[FRBCOperationMode],
+    ActuatorIndexMixin[FRBCActuatorDescription],
+):
     model_config = GenFRBCSystemDescription.model_config
     model_config["validate_assignment"] = True
 
@@ -0,0 +1,180 @@
+"""Frozen, hashable variants of S2 messages which share unchanged nested objects.
+
+`S2MessageComponent.frozen()` returns a deeply frozen copy of an S2 object. Its class is a frozen subclass of the
+original class, e.g. `FrozenFRBCSystemDescription` for `FRBCSystemDescription`, so it is still an instance of the
+original class and is serialized in the same way. Assigning to a field raises an `S2ValidationError` and lists are
+`FrozenList`s, so frozen objects may be shared between threads and used as dictionary keys. The hash is computed
+once and cached.
+
+`evolve(**changes)` creates a frozen copy with some fields changed. The copy is validated as a whole, as its model
+validators may depend on any field, but unchanged (frozen) nested objects are not validated again and are reused
+instead of being copied. Only the lists are rebuilt. A frozen object is equal to an unfrozen object of the original
+class with the same values.
+"""
+
+import threading
+from typing import Any, Dict, NoReturn, Optional, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, RootModel, ValidationError  # pylint: disable=no-name-in-module
+
+from s2python.s2_validation_error import S2ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+_FROZEN_CLASSES: Dict[Type[BaseModel], Type[BaseModel]] = {}
+_FROZEN_CLASSES_LOCK = threading.Lock()
+
+
+class FrozenList(list):
+    """A list which cannot be changed and is hashable."""
+
+    __slots__ = ("_hash",)
+    _hash: int
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("A FrozenList cannot be changed.")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable  # type: ignore[assignment]
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable  # type: ignore[assignment]
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(tuple(self))  # pylint: disable=attribute-defined-outside-init
+            return self._hash
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return FrozenList, (list(self),)
+
+
+def is_frozen(model: BaseModel) -> bool:
+    """Check whether an S2 object is frozen.
+
+    :param model: The S2 message or message component.
+    :return: True if the object is an instance of a frozen class.
+    """
+    return bool(type(model).model_config.get("frozen", False))
+
+
+def freeze(value: Any) -> Any:
+    """Create a deeply frozen copy of an S2 object, or of a list of S2 objects.
+
+    :param value: The S2 object or list. Frozen objects and other values are returned as they are.
+    :return: The frozen copy.
+    """
+    if isinstance(value, BaseModel):
+        if is_frozen(value):
+            return value
+        # Copied like `model_copy` does, as `model_construct` would apply defaults and aliases again.
+        frozen_model_class = frozen_class(type(value))
+        frozen_value = frozen_model_class.__new__(frozen_model_class)
+        object.__setattr__(frozen_value, "__dict__", dict(value.__dict__))
+        object.__setattr__(frozen_value, "__pydantic_fields_set__", set(value.__pydantic_fields_set__))
+        if not isinstance(value, RootModel):
+            object.__setattr__(frozen_value, "__pydantic_extra__", value.__pydantic_extra__)
+            object.__setattr__(frozen_value, "__pydantic_private__", value.__pydantic_private__)
+        _freeze_fields(frozen_value, None)
+        return frozen_value
+    if isinstance(value, list) and not isinstance(value, FrozenList):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def evolve(model: M, changes: Dict[str, Any]) -> M:
+    """Create a frozen copy of an S2 object with some fields changed.
+
+    The copy is validated (and the model validators run) as when the object is constructed, except that unchanged
+    nested objects are reused as they are instead of being validated and copied. Lists are rebuilt.
+
+    :param model: The S2 message or message component.
+    :param changes: The new values by field name. Nested objects may also be given as dictionaries.
+    :raises: S2ValidationError
+    :return: The frozen copy.
+    """
+    frozen_model = freeze(model)
+    frozen_model_class = type(frozen_model)
+    unknown_fields = changes.keys() - frozen_model_class.model_fields.keys()
+    if unknown_fields:
+        raise S2ValidationError(
+            frozen_model_class, changes, f"Unknown fields: {', '.join(sorted(unknown_fields))}."
+        )
+    try:
+        return frozen_model_class.__pydantic_validator__.validate_python({**frozen_model.__dict__, **changes})
+    except (ValidationError, TypeError) as e:
+        raise S2ValidationError(frozen_model_class, changes, "Pydantic raised a validation error.") from e
+
+
+def _freeze_fields(self: BaseModel, _context: Any) -> None:
+    # The post init hook of the frozen classes, so objects which are validated by `evolve` are frozen as well.
+    for name, value in self.__dict__.items():
+        if isinstance(value, (BaseModel, list)):
+            self.__dict__[name] = freeze(value)
+
+
+def _frozen_eq(self: BaseModel, other: Any) -> bool:
+    # Compared as instances of the original class, as pydantic only considers objects of the same class equal.
+    if self is other:
+        return True
+    if not isinstance(other, BaseModel):
+        return NotImplemented
+    other_class = type(other).__base__ if is_frozen(other) else type(other)
+    return (
+        type(self).__base__ is other_class
+        and self.__dict__ == other.__dict__
+        # Root models do not have private attributes or extra fields.
+        and getattr(self, "__pydantic_private__", None) == getattr(other, "__pydantic_private__", None)
+        and getattr(self, "__pydantic_extra__", None) == getattr(other, "__pydantic_extra__", None)
+    )
+
+
+def _cached_hash(self: BaseModel) -> int:
+    cached_hash: Optional[int] = getattr(self, "_s2_hash", None)
+    if cached_hash is None:
+        cached_hash = hash((type(self), tuple(self.__dict__.values())))
+        object.__setattr__(self, "_s2_hash", cached_hash)
+    return cached_hash
+
+
+def _unpickle_frozen(
+    model_class: Type[BaseModel], values: Dict[str, Any], fields_set: Optional[Set[str]]
+) -> BaseModel:
+    return frozen_class(model_class).model_construct(_fields_set=fields_set, **values)
+
+
+def _reduce_frozen(self: BaseModel) -> Tuple[Any, ...]:
+    # The frozen classes are created at runtime, so they cannot be found by name when unpickling.
+    return _unpickle_frozen, (type(self).__base__, dict(self.__dict__), self.__pydantic_fields_set__)
+
+
+def frozen_class(model_class: Type[M]) -> Type[M]:
+    """Retrieve the frozen subclass of an S2 class, which is created the first time it is needed.
+
+    :param model_class: The S2 class.
+    :return: The frozen subclass.
+    """
+    frozen_model_class = _FROZEN_CLASSES.get(model_class)
+    if frozen_model_class is None:
+        with _FROZEN_CLASSES_LOCK:
+            frozen_model_class = _FROZEN_CLASSES.get(model_class)
+            if frozen_model_class is None:
+                frozen_model_class = _create_frozen_class(model_class)
+                _FROZEN_CLASSES[model_class] = frozen_model_class
+    return frozen_model_class  # type: ignore[return-value]
+
+
+def _create_frozen_class(model_class: Type[BaseModel]) -> Type[BaseModel]:
+    namespace = {
+        "__module__": __name__,
+        "__qualname__": f"Frozen{model_class.__qualname__}",
+        "__slots__": ("_s2_hash",),
+        # Classes which define their own equality and hash, such as `NumberRange`, keep them, so they hash equal to
+        # their unfrozen copies.
+        "__eq__": _frozen_eq if model_class.__eq__ in (BaseModel.__eq__, RootModel.__eq__) else model_class.__eq__,
+        "__hash__": _cached_hash if model_class.__hash__ is None else model_class.__hash__,
+        "__reduce__": _reduce_frozen,
+        "model_config": {**model_class.model_config, "frozen": True, "validate_assignment": False},
+        "model_post_init": _freeze_fields,
+    }
+    model_metaclass: Any = type(model_class)
+    return model_metaclass(f"Frozen{model_class.__name__}", (model_class,), namespace)  # type: ignore[no-any-return]
@@ -0,0 +1,105 @@
+"""Pluggable JSON libraries for converting between JSON text and Python data structures.
+
+By default S2 messages are parsed from and serialized to JSON by pydantic-core directly, which is faster than first
+converting the JSON text to Python dictionaries with any JSON library (see
+`development_utilities/benchmark_json_codecs.py`). A `JsonCodec` is used wherever JSON text has to be converted from or
+to Python data structures, or when a specific JSON library is requested for S2 messages explicitly.
+
+`orjson` is used when it is installed (`pip install s2-python[fastjson]`), otherwise the `json` module from the
+standard library.
+"""
+
+import abc
+import json
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]  # pylint: disable=invalid-name
+
+
+class JsonCodec(abc.ABC):
+    name: str
+
+    @abc.abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Convert JSON text to Python data structures.
+
+        :param data: The JSON text.
+        :raises: json.JSONDecodeError
+        :return: The Python data structures.
+        """
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """Convert Python data structures to compact JSON text.
+
+        :param obj: The Python data structures which only contain JSON-compatible types.
+        :return: The JSON text.
+        """
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Convert Python data structures to compact UTF-8 encoded JSON text.
+
+        :param obj: The Python data structures which only contain JSON-compatible types.
+        :return: The UTF-8 encoded JSON text.
+        """
+        return self.dumps(obj).encode("utf-8")
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "stdlib"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+
+class OrjsonJsonCodec(JsonCodec):
+    name = "orjson"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError.
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+JSON_CODECS: Dict[str, JsonCodec] = {}
+_default_codec_name: Optional[str] = None  # pylint: disable=invalid-name
+
+
+def register_json_codec(codec: JsonCodec, make_default: bool = False) -> None:
+    """Register a JSON codec so it may be retrieved by its name.
+
+    :param codec: The JSON codec.
+    :param make_default: Use the codec when no codec is requested by name.
+    """
+    global _default_codec_name  # pylint: disable=global-statement
+    JSON_CODECS[codec.name] = codec
+    if make_default or _default_codec_name is None:
+        _default_codec_name = codec.name
+
+
+def get_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """Retrieve a registered JSON codec.
+
+    :param name: The name of the codec. None retrieves the default codec.
+    :raises: KeyError if no codec with the name is registered.
+    :return: The JSON codec.
+    """
+    if name is None:
+        name = _default_codec_name
+    return JSON_CODECS[str(name)]
+
+
+register_json_codec(StdlibJsonCodec())
+if orjson is not None:
+    register_json_codec(OrjsonJsonCodec(), make_default=True)
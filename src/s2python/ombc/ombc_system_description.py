@@ -6,6 +6,7 @@ from s2python.ombc.ombc_operation_mode import OMBCOperationMode
 from s2python.common.transition import Transition
 from s2python.common.timer import Timer
 
+from s2python.reference_index import ReferenceIndexMixin
 from s2python.validate_values_mixin import (
     catch_and_convert_exceptions,
     S2MessageComponent,
@@ -13,7 +14,11 @@ from s2python.validate_values_mixin import (
 
 
 @catch_and_convert_exceptions
-class OMBCSystemDescription(GenOMBCSystemDescription, S2MessageComponent):
+class OMBCSystemDescription(
+    GenOMBCSystemDescription,
+    S2MessageComponent,
+    ReferenceIndexMixin[OMBCOperationMode],
+):
     model_config = GenOMBCSystemDescription.model_config
     model_config["validate_assignment"] = True
 
@@ -0,0 +1,83 @@
+"""Share identical `NumberRange` and `PowerRange` instances between the S2 objects which use them.
+
+Operation modes, leakage behaviours and forecasts repeat the same few ranges over and over, e.g. a fill level range
+of 0 to 100 in every element of every operation mode. `RangePool.intern_ranges(message)` replaces every range in a
+message by a single shared instance per distinct value, so the duplicates can be freed. Comparing the shared ranges
+is cheap as well, as they are compared by identity first.
+
+The shared instances are frozen (see `s2python.frozen`), as an assignment to one of them would otherwise change all
+the objects which share it. Interning is therefore opt-in and is best applied to received messages which are only read:
+
+    pool = RangePool()
+    system_description = pool.intern_ranges(S2Parser.parse_as_message(message, FRBCSystemDescription))
+
+The shared instances are equal to the ranges they replace, so the messages are equal to their copies from before
+interning. Lists and objects which are frozen themselves are left as they are.
+"""
+
+from typing import Any, Dict, Tuple, TypeVar
+
+from pydantic import BaseModel  # pylint: disable=no-name-in-module
+
+from s2python import frozen
+from s2python.common import NumberRange, PowerRange
+
+M = TypeVar("M", bound=BaseModel)
+
+_RANGE_CLASSES = (NumberRange, PowerRange)
+
+
+class RangePool:
+    """A pool of shared, frozen `NumberRange` and `PowerRange` instances."""
+
+    def __init__(self) -> None:
+        self._ranges: Dict[Tuple[Any, ...], BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def intern(self, value: M) -> M:
+        """Retrieve the shared instance which is equal to a range, adding a frozen copy to the pool if there is none.
+
+        :param value: The `NumberRange` or `PowerRange`.
+        :return: The shared, frozen instance.
+        """
+        model_class = type(value).__base__ if frozen.is_frozen(value) else type(value)
+        key = (model_class, *value.__dict__.values())
+        shared = self._ranges.get(key)
+        if shared is None:
+            shared = self._ranges[key] = frozen.freeze(value)
+        return shared  # type: ignore[return-value]
+
+    def intern_ranges(self, message: M) -> M:
+        """Replace all ranges in an S2 message or message component by their shared instances, in place.
+
+        The ranges are replaced without (validated) assignment, as they are equal to the ranges they replace.
+
+        :param message: The S2 message or message component.
+        :return: The message itself.
+        """
+        self._intern_nested(message)
+        return message
+
+    def clear(self) -> None:
+        """Remove all ranges from the pool. The objects which share them keep them."""
+        self._ranges.clear()
+
+    def _intern_nested(self, value: Any) -> None:
+        if isinstance(value, BaseModel):
+            if frozen.is_frozen(value):
+                return
+            items: Any = value.__dict__
+            entries = items.items()
+        elif isinstance(value, list) and not isinstance(value, frozen.FrozenList):
+            items = value
+            entries = enumerate(value)
+        else:
+            return
+
+        for key, item in entries:
+            if isinstance(item, _RANGE_CLASSES):
+                items[key] = self.intern(item)
+            elif isinstance(item, (BaseModel, list)):
+                self._intern_nested(item)
@@ -0,0 +1,81 @@
+"""Precomputed JSON for the ReceptionStatus replies which are sent for (almost) every received message.
+
+A `ReceptionStatusTemplate` serializes a validated `ReceptionStatus` once with a placeholder subject message id and
+afterwards only splices in the actual subject message id. The result is identical to serializing a `ReceptionStatus`
+with the same status and diagnostic label, but avoids validating and serializing a new model for every reply (see
+`development_utilities/benchmark_reception_status.py`).
+"""
+
+import uuid
+from typing import Optional
+
+from s2python.common import ReceptionStatus, ReceptionStatusValues
+from s2python.json_codec import JsonCodec
+
+PROCESSED_OKAY_LABEL = "Processed okay."
+
+_PLACEHOLDER_ID = uuid.UUID(int=0)
+
+
+class ReceptionStatusTemplate:
+    status: ReceptionStatusValues
+    diagnostic_label: Optional[str]
+
+    _prefix: str
+    _suffix: str
+    _prefix_bytes: bytes
+    _suffix_bytes: bytes
+
+    def __init__(
+        self,
+        status: ReceptionStatusValues,
+        diagnostic_label: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ) -> None:
+        """Create a template for replies with a fixed status and diagnostic label.
+
+        :param status: The status of the replies.
+        :param diagnostic_label: The diagnostic label of the replies.
+        :param json_codec: Serialize with this JSON library. None lets pydantic-core serialize directly.
+        :raises: S2ValidationError if the status or diagnostic label is not valid, ValueError if the placeholder
+                 subject message id cannot be found unambiguously in the serialized reply.
+        """
+        message_json = ReceptionStatus(
+            subject_message_id=_PLACEHOLDER_ID, status=status, diagnostic_label=diagnostic_label
+        ).to_json(json_codec)
+        placeholder = f'"{_PLACEHOLDER_ID}"'
+        if message_json.count(placeholder) != 1:
+            raise ValueError(f"Unable to find the subject message id in {message_json}.")
+
+        start = message_json.index(placeholder) + 1
+        self.status = status
+        self.diagnostic_label = diagnostic_label
+        self._prefix = message_json[:start]
+        self._suffix = message_json[start + len(str(_PLACEHOLDER_ID)):]
+        self._prefix_bytes = self._prefix.encode("utf-8")
+        self._suffix_bytes = self._suffix.encode("utf-8")
+
+    def matches(self, status: ReceptionStatusValues, diagnostic_label: Optional[str]) -> bool:
+        """Check whether a reply with the status and diagnostic label may be rendered from this template.
+
+        :param status: The status of the reply.
+        :param diagnostic_label: The diagnostic label of the reply.
+        :return: True if the status and diagnostic label are those of the template.
+        """
+        return status == self.status and diagnostic_label == self.diagnostic_label
+
+    def render(self, subject_message_id: uuid.UUID) -> str:
+        """Serialize the reply to a message.
+
+        :param subject_message_id: The id of the message which is replied to.
+        :return: The JSON of the `ReceptionStatus`.
+        """
+        return f"{self._prefix}{subject_message_id}{self._suffix}"
+
+    def render_bytes(self, subject_message_id: uuid.UUID) -> bytes:
+        """Serialize the reply to a message as UTF-8 encoded JSON.
+
+        :param subject_message_id: The id of the message which is replied to.
+        :return: The UTF-8 encoded JSON of the `ReceptionStatus`.
+        """
+        return b"".join((self._prefix_bytes, str(subject_message_id).encode("ascii"), self._suffix_bytes))
@@ -0,0 +1,224 @@
+"""Lookups by id of the operation modes, transitions, timers and actuators of S2 system descriptions.
+
+Instructions and statuses refer to operation modes, timers and actuators by id, e.g. `FRBCInstruction.operation_mode`
+or `FRBCActuatorStatus.active_operation_mode_id`. The actuator descriptions and the FRBC, OMBC and DDBC system
+descriptions build an index of these ids the first time it is needed, so every following lookup is a dictionary lookup.
+The model validators of `FRBCActuatorDescription` build the same index, so it is usually ready once a system
+description has been received.
+
+An index is rebuilt when an id, a reference or one of the lists of an S2 object is changed through (validated)
+assignment, e.g. `transition.to = ...` or `actuator.timers = [...]`. Only the indexes which contain the changed object
+are rebuilt, which are found through a reverse table from each indexed object to the indexes containing it. Changes
+which bypass assignment, such as appending to a list in place, are not detected; assign the list
+again after such changes.
+
+The indexes are kept in a module-level table keyed by object identity instead of as pydantic private attributes,
+which would slow down the construction of every S2 object.
+"""
+
+import threading
+import uuid
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+from pydantic import BaseModel  # pylint: disable=no-name-in-module
+
+if TYPE_CHECKING:
+    from s2python.common.timer import Timer
+    from s2python.common.transition import Transition
+
+OperationModeT = TypeVar("OperationModeT")
+ActuatorT = TypeVar("ActuatorT")
+
+# Assigning to one of these fields of an S2 object may change the indexes which contain it.
+REFERENCE_FIELDS = frozenset({"id", "from_", "to", "operation_modes", "transitions", "timers", "actuators"})
+
+
+class ReferenceIndex:  # pylint: disable=too-many-instance-attributes
+    """The operation modes, transitions, timers and actuators of an S2 object by id."""
+
+    def __init__(self) -> None:
+        self.stale = False
+        # The `id()` of every indexed object, including those of the indexes of the actuators.
+        self.member_ids: Set[int] = set()
+        self.actuators_by_id: Dict[uuid.UUID, Any] = {}
+        self.operation_modes_by_id: Dict[uuid.UUID, Any] = {}
+        self.transitions: List["Transition"] = []
+        self.transitions_by_id: Dict[uuid.UUID, "Transition"] = {}
+        self.timers_by_id: Dict[uuid.UUID, "Timer"] = {}
+        # The transitions by the id of the operation mode they start in and end in, grouped when first needed.
+        self._transitions_by_end: Optional[Tuple[Dict[uuid.UUID, List["Transition"]], ...]] = None
+
+    def _grouped_transitions(self) -> Tuple[Dict[uuid.UUID, List["Transition"]], ...]:
+        if self._transitions_by_end is None:
+            transitions_from: Dict[uuid.UUID, List["Transition"]] = {}
+            transitions_to: Dict[uuid.UUID, List["Transition"]] = {}
+            for transition in self.transitions:
+                transitions_from.setdefault(transition.from_, []).append(transition)
+                transitions_to.setdefault(transition.to, []).append(transition)
+            self._transitions_by_end = (transitions_from, transitions_to)
+        return self._transitions_by_end
+
+    def transitions_from(self, operation_mode_id: uuid.UUID) -> List["Transition"]:
+        """Retrieve the transitions which start in an operation mode.
+
+        :param operation_mode_id: The id of the operation mode.
+        :return: The transitions, in the order in which they are described.
+        """
+        return list(self._grouped_transitions()[0].get(operation_mode_id, ()))
+
+    def transitions_to(self, operation_mode_id: uuid.UUID) -> List["Transition"]:
+        """Retrieve the transitions which end in an operation mode.
+
+        :param operation_mode_id: The id of the operation mode.
+        :return: The transitions, in the order in which they are described.
+        """
+        return list(self._grouped_transitions()[1].get(operation_mode_id, ()))
+
+
+_INDEXES: Dict[int, ReferenceIndex] = {}
+# The `id()` of the objects whose index contains an object, by the `id()` of that object.
+_CONTAINING_INDEXES: Dict[int, Set[int]] = {}
+# Guards both tables. Reentrant, as a finalizer may run (on garbage collection) while the lock is held.
+_INDEXES_LOCK = threading.RLock()
+
+
+def _build_index(model: BaseModel) -> ReferenceIndex:
+    index = ReferenceIndex()
+    actuators = model.__dict__.get("actuators")
+    if actuators is not None:
+        for actuator in actuators:
+            actuator_index = reference_index(actuator)
+            index.actuators_by_id[actuator.id] = actuator
+            index.member_ids.add(id(actuator))
+            index.member_ids.update(actuator_index.member_ids)
+            index.operation_modes_by_id.update(actuator_index.operation_modes_by_id)
+            index.transitions.extend(actuator_index.transitions)
+            index.transitions_by_id.update(actuator_index.transitions_by_id)
+            index.timers_by_id.update(actuator_index.timers_by_id)
+        return index
+
+    for operation_mode in model.__dict__.get("operation_modes", ()):
+        index.operation_modes_by_id[operation_mode.id] = operation_mode
+        index.member_ids.add(id(operation_mode))
+    index.transitions = list(model.__dict__.get("transitions", ()))
+    for transition in index.transitions:
+        index.transitions_by_id[transition.id] = transition
+        index.member_ids.add(id(transition))
+    for timer in model.__dict__.get("timers", ()):
+        index.timers_by_id[timer.id] = timer
+        index.member_ids.add(id(timer))
+    return index
+
+
+def _remove_memberships(model_id: int, index: ReferenceIndex) -> None:
+    for member_id in index.member_ids:
+        containing_indexes = _CONTAINING_INDEXES.get(member_id)
+        if containing_indexes is not None:
+            containing_indexes.discard(model_id)
+            if not containing_indexes:
+                _CONTAINING_INDEXES.pop(member_id, None)
+
+
+def _store_index(model_id: int, index: ReferenceIndex) -> None:
+    with _INDEXES_LOCK:
+        previous_index = _INDEXES.get(model_id)
+        if previous_index is not None:
+            _remove_memberships(model_id, previous_index)
+        _INDEXES[model_id] = index
+        for member_id in index.member_ids:
+            _CONTAINING_INDEXES.setdefault(member_id, set()).add(model_id)
+
+
+def _forget_index(model_id: int) -> None:
+    with _INDEXES_LOCK:
+        index = _INDEXES.pop(model_id, None)
+        if index is not None:
+            _remove_memberships(model_id, index)
+
+
+def reference_index(model: BaseModel) -> ReferenceIndex:
+    """Retrieve the index of an S2 object, which is built the first time it is needed or after it was invalidated.
+
+    :param model: The actuator description or system description.
+    :return: The index.
+    """
+    index = _INDEXES.get(id(model))
+    if index is None or index.stale:
+        if index is None:
+            weakref.finalize(model, _forget_index, id(model))
+        index = _build_index(model)
+        _store_index(id(model), index)
+    return index
+
+
+def notify_assignment(model: BaseModel) -> None:
+    """Invalidate the index of an S2 object and the indexes which contain it, after one of its `REFERENCE_FIELDS`
+    is assigned to.
+
+    The invalidated indexes are rebuilt when they are used next.
+
+    :param model: The S2 object which was assigned to.
+    """
+    model_id = id(model)
+    with _INDEXES_LOCK:
+        for index_id in (model_id, *_CONTAINING_INDEXES.get(model_id, ())):
+            index = _INDEXES.get(index_id)
+            if index is not None:
+                index.stale = True
+
+
+class ReferenceIndexMixin(Generic[OperationModeT]):
+    """Lookups of the operation modes, transitions and timers of an S2 object by id."""
+
+    def get_operation_mode(self, operation_mode_id: uuid.UUID) -> Optional[OperationModeT]:
+        """Look up an operation mode.
+
+        :param operation_mode_id: The id of the operation mode.
+        :return: The operation mode or None if it is not described.
+        """
+        return reference_index(self).operation_modes_by_id.get(operation_mode_id)  # type: ignore[arg-type]
+
+    def get_transition(self, transition_id: uuid.UUID) -> Optional["Transition"]:
+        """Look up a transition.
+
+        :param transition_id: The id of the transition.
+        :return: The transition or None if it is not described.
+        """
+        return reference_index(self).transitions_by_id.get(transition_id)  # type: ignore[arg-type]
+
+    def get_timer(self, timer_id: uuid.UUID) -> Optional["Timer"]:
+        """Look up a timer.
+
+        :param timer_id: The id of the timer.
+        :return: The timer or None if it is not described.
+        """
+        return reference_index(self).timers_by_id.get(timer_id)  # type: ignore[arg-type]
+
+    def transitions_from(self, operation_mode_id: uuid.UUID) -> List["Transition"]:
+        """Retrieve the transitions which start in an operation mode.
+
+        :param operation_mode_id: The id of the operation mode.
+        :return: The transitions, in the order in which they are described.
+        """
+        return reference_index(self).transitions_from(operation_mode_id)  # type: ignore[arg-type]
+
+    def transitions_to(self, operation_mode_id: uuid.UUID) -> List["Transition"]:
+        """Retrieve the transitions which end in an operation mode.
+
+        :param operation_mode_id: The id of the operation mode.
+        :return: The transitions, in the order in which they are described.
+        """
+        return reference_index(self).transitions_to(operation_mode_id)  # type: ignore[arg-type]
+
+
+class ActuatorIndexMixin(Generic[ActuatorT]):
+    """Lookups of the actuators of a system description by id."""
+
+    def get_actuator(self, actuator_id: uuid.UUID) -> Optional[ActuatorT]:
+        """Look up an actuator.
+
+        :param actuator_id: The id of the actuator.
+        :return: The actuator description or None if it is not described.
+        """
+        return reference_index(self).actuators_by_id.get(actuator_id)  # type: ignore[arg-type]
@@ -0,0 +1,94 @@
+"""Compression settings and a zlib preset dictionary for S2 messages.
+
+`DeflateOptions` tunes the permessage-deflate websocket extension (RFC 7692) which compresses all frames of a
+connection. With context takeover (the default) each message is compressed against the previous ones, which works well
+for the repetitive S2 messages.
+
+For transports which compress every message on its own, e.g. when the server disables context takeover or when a
+binary wire codec is used without permessage-deflate, `build_s2_dictionary` builds a zlib preset dictionary from the
+S2 schema: the field names of every S2 object in field order and all enum values. Small messages like
+`ReceptionStatus` then compress to about half the size they would without a dictionary. See
+`s2python.wire_codec.ZlibDictionaryWireCodec`.
+"""
+
+import enum
+import inspect
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Set, Union
+
+from pydantic import BaseModel  # pylint: disable=no-name-in-module
+
+from s2python.generated import gen_s2
+
+try:
+    from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+except ImportError:  # pragma: no cover
+    ClientPerMessageDeflateFactory = None  # type: ignore[assignment,misc]  # pylint: disable=invalid-name
+
+ZLIB_MAX_DICTIONARY_SIZE = 32768
+
+
+@dataclass(frozen=True)
+class DeflateOptions:
+    """Settings of the permessage-deflate websocket extension.
+
+    The window bits and no context takeover settings are negotiated with the server, see RFC 7692. `level` and
+    `memory_level` only apply to the frames which are sent.
+    """
+
+    level: int = 6
+    memory_level: int = 5
+    client_max_window_bits: Union[int, bool, None] = True
+    server_max_window_bits: Optional[int] = None
+    client_no_context_takeover: bool = False
+    server_no_context_takeover: bool = False
+
+    def client_extension_factory(self) -> "ClientPerMessageDeflateFactory":
+        """Create the websocket extension factory which offers these settings to the server.
+
+        :raises: ImportError if websockets is not installed.
+        :return: The extension factory for `websockets.connect`.
+        """
+        if ClientPerMessageDeflateFactory is None:
+            raise ImportError(
+                "The 'websockets' package is required. Run 'pip install s2-python[ws]' to use this feature."
+            )
+        return ClientPerMessageDeflateFactory(
+            server_no_context_takeover=self.server_no_context_takeover,
+            client_no_context_takeover=self.client_no_context_takeover,
+            server_max_window_bits=self.server_max_window_bits,
+            client_max_window_bits=self.client_max_window_bits,
+            compress_settings={"level": self.level, "memLevel": self.memory_level},
+        )
+
+
+def _schema_fragments() -> List[str]:
+    enum_values: Set[str] = set()
+    skeletons = []
+    for _, value in sorted(vars(gen_s2).items()):
+        if not inspect.isclass(value) or value.__module__ != gen_s2.__name__:
+            continue
+        if issubclass(value, BaseModel):
+            fields = []
+            for name, field_info in value.model_fields.items():
+                key = f'"{field_info.alias or name}":'
+                fields.append(f'{key}"{field_info.default}"' if isinstance(field_info.default, str) else key)
+            skeletons.append("{" + ",".join(fields) + "}")
+        elif issubclass(value, enum.Enum):
+            enum_values.update(f'"{member.value}"' for member in value if isinstance(member.value, str))
+    return sorted(enum_values) + skeletons
+
+
+def build_s2_dictionary(samples: Iterable[bytes] = (), max_size: int = ZLIB_MAX_DICTIONARY_SIZE) -> bytes:
+    """Build a zlib preset dictionary for S2 messages.
+
+    The dictionary consists of the enum values and the JSON keys of every S2 object in the S2 schema, followed by the
+    samples. zlib finds matches in later parts of the dictionary more cheaply, so the most typical samples should be
+    last. Only the last `max_size` bytes are kept. Both ends must use the exact same dictionary.
+
+    :param samples: Typical (serialized) messages, e.g. recorded from a live connection.
+    :param max_size: The maximum size of the dictionary. zlib does not use more than 32 KiB.
+    :return: The preset dictionary.
+    """
+    dictionary = "".join(_schema_fragments()).encode("utf-8") + b"".join(samples)
+    return dictionary[-max_size:]
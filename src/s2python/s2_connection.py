@@ -14,18 +14,23 @@ except ImportError as exc:
     ) from exc
 
 import asyncio
+import codecs
+import itertools
 import json
 import logging
 import time
 import threading
 import uuid
 import ssl
-from typing import Any, Optional, List, Dict, Awaitable
+from typing import Any, Optional, List, Dict, Awaitable, AsyncIterator, Iterator, Mapping, Sequence, Type, Union
 
 from websockets.asyncio.client import (
     ClientConnection as WSConnection,
     connect as ws_connect,
 )
+from websockets.typing import Subprotocol
+
+from pydantic import ValidationError  # pylint: disable=no-name-in-module
 
 from s2python.common import (
     ReceptionStatusValues,
@@ -35,18 +40,42 @@ from s2python.common import (
     HandshakeResponse,
     SelectControlType,
 )
+from s2python.error_reply_limiter import ErrorReplyLimiter, RejectedFrameCounters
+from s2python.json_codec import JsonCodec
 from s2python.reception_status_awaiter import ReceptionStatusAwaiter
+from s2python.reception_status_template import PROCESSED_OKAY_LABEL, ReceptionStatusTemplate
 from s2python.s2_control_type import S2ControlType
+from s2python.s2_compression import DeflateOptions
+from s2python.s2_envelope import scan_envelope
+from s2python.s2_lazy_message import model_class_of
+from s2python.s2_json_stream import iter_json_fragments
+from s2python.s2_message_registry import S2MessageRegistry
+from s2python.s2_parse_cache import S2ParseCache
 from s2python.s2_parser import S2Parser
+from s2python.s2_publisher import ChangeTolerance, S2Publisher
 from s2python.s2_validation_error import S2ValidationError
 from s2python.s2_asset_details import AssetDetails
 from s2python.s2_message_handlers import S2MessageHandler, SendOkay, MessageHandlers
 from s2python.message import S2Message
 from s2python.version import S2_VERSION
+from s2python.wire_codec import WireCodec, select_wire_codec
 
 logger = logging.getLogger("s2python")
 
 
+def _exceeds_size(frame: Union[str, bytes], max_size: int) -> bool:
+    """Check whether a (decoded) frame is larger than the maximum size in (UTF-8 encoded) bytes.
+
+    A character is encoded in 1 to 4 bytes, so a text frame is only encoded to measure it if its length alone does
+    not decide the check.
+    """
+    if isinstance(frame, bytes) or len(frame) > max_size:
+        return len(frame) > max_size
+    if len(frame) * 4 <= max_size:
+        return False
+    return len(frame.encode("utf-8")) > max_size
+
+
 class S2Connection:  # pylint: disable=too-many-instance-attributes
     url: str
     reconnect: bool
@@ -56,6 +85,7 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
     control_types: List[S2ControlType]
     role: EnergyManagementRole
     asset_details: AssetDetails
+    publisher: S2Publisher
 
     _thread: threading.Thread
 
@@ -68,8 +98,20 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
     _restart_connection_event: asyncio.Event
     _verify_certificate: bool
     _bearer_token: Optional[str]
-
-    def __init__(  # pylint: disable=too-many-arguments
+    _decode_frames: bool
+    _binary_frames: bool
+    _fragment_size: Optional[int]
+    _json_codec: Optional[JsonCodec]
+    _wire_codecs: List[WireCodec]
+    _wire_codec: Optional[WireCodec]
+    _compression: Union[bool, DeflateOptions]
+    _max_frame_size: Optional[int]
+    _max_diagnostic_length: int
+    _error_reply_limiter: ErrorReplyLimiter
+    rejected_frames: RejectedFrameCounters
+    _ok_reception_status: ReceptionStatusTemplate
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         url: str,
         role: EnergyManagementRole,
@@ -78,14 +120,88 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
         reconnect: bool = False,
         verify_certificate: bool = True,
         bearer_token: Optional[str] = None,
+        *,
+        decode_frames: bool = True,
+        trusted_peer: bool = False,
+        max_frame_size: Optional[int] = None,
+        max_diagnostic_length: int = 256,
+        error_reply_rate: Optional[float] = None,
+        error_reply_burst: int = 10,
+        parse_cache: Optional[S2ParseCache] = None,
+        json_codec: Optional[JsonCodec] = None,
+        lazy_validation: bool = False,
+        message_registry: Optional[S2MessageRegistry] = None,
+        binary_frames: bool = False,
+        wire_codecs: Sequence[WireCodec] = (),
+        compression: Union[bool, DeflateOptions] = True,
+        change_tolerances: Optional[Mapping[Type[S2Message], ChangeTolerance]] = None,
+        fragment_size: Optional[int] = None,
     ) -> None:
+        """Create a new S2 connection.
+
+        :param url: The websocket URL of the CEM to connect to, e.g. `wss://cem.example.com/s2`.
+        :param role: The role this party takes in the S2 session, sent in the handshake.
+        :param control_types: The control types the resource manager supports. The handlers of the control type the
+                              CEM selects are activated.
+        :param asset_details: The details of the asset, sent to the CEM as the resource manager details.
+        :param reconnect: If True, connect again after the connection is lost until the connection is stopped.
+        :param verify_certificate: If False, the TLS certificate of a `wss://` URL is not verified. Only use this
+                                   for testing.
+        :param bearer_token: Sent as bearer token in the Authorization header when connecting. None sends no
+                             Authorization header.
+        :param decode_frames: If False, incoming frames are received as raw bytes and passed to the parser without
+                              UTF-8 decoding them into an intermediate string first.
+        :param trusted_peer: If True, incoming messages are parsed without running any model validators. Only use this
+                             if the other party is known to send valid messages.
+        :param max_frame_size: The maximum size of incoming messages in (UTF-8 encoded) bytes. The limit is passed to
+                               the websocket library, which closes the connection (with code 1009, message too big)
+                               when a larger message arrives, so such a message is normally never parsed nor replied
+                               to. Any larger message the library still delivers is rejected with an error reply.
+                               None only applies the default limit of the websocket library.
+        :param max_diagnostic_length: The maximum length of the diagnostic label in error replies.
+        :param error_reply_rate: The average number of INVALID_DATA and INVALID_MESSAGE replies which is sent per
+                                 second. Rejected frames above this rate are counted but not answered individually.
+                                 None answers every rejected frame.
+        :param error_reply_burst: The number of error replies which may be sent at once.
+        :param parse_cache: Reuse parsed messages which are resent with only a new message id, e.g. system
+                            descriptions after a reconnect. Cached messages are passed to the handlers as frozen
+                            messages, which cannot be changed. See `S2ParseCache`.
+        :param json_codec: Parse and serialize messages with this JSON library. None lets pydantic-core handle JSON
+                           directly, which is the fastest option. See `s2python.json_codec`.
+        :param lazy_validation: Pass incoming messages to the handlers as proxies which only validate nested lists
+                                when they are accessed. See `s2python.s2_lazy_message`.
+        :param message_registry: The message classes which may be received and handled, e.g. the standard S2 messages
+                                 extended with vendor messages. None only allows the standard S2 messages.
+        :param binary_frames: Send messages as UTF-8 encoded JSON in binary frames. Messages are then serialized
+                              straight to bytes without an intermediate string. Only enable this if the other party
+                              accepts binary frames, as s2-python does.
+        :param wire_codecs: The binary formats (e.g. MessagePack) which are offered to the server as websocket
+                            subprotocols, in order of preference. Messages are exchanged as JSON if the server does
+                            not select any of them. See `s2python.wire_codec`.
+        :param compression: Offer the permessage-deflate extension to the server. True uses the defaults of the
+                            websocket library, `DeflateOptions` tunes the compression level, window bits and context
+                            takeover and False disables compression. See `s2python.s2_compression`.
+        :param change_tolerances: How much messages of these classes (e.g. forecasts) may change before
+                                  `publish_msg_sync` sends them again. See `s2python.s2_publisher`.
+        :param fragment_size: Serialize JSON messages in fragments of this many bytes and send messages which are
+                              larger than one fragment as a fragmented websocket message. Peak memory is then
+                              bounded by the fragment size instead of the message size. None sends every message in
+                              a single frame. See `s2python.s2_json_stream`.
+        """
         self.url = url
         self.reconnect = reconnect
         self.reception_status_awaiter = ReceptionStatusAwaiter()
         self.ws = None
-        self.s2_parser = S2Parser()
+        self.s2_parser = S2Parser(
+            trusted=trusted_peer,
+            cache=parse_cache,
+            json_codec=json_codec,
+            lazy=lazy_validation,
+            registry=message_registry,
+        )
 
-        self._handlers = MessageHandlers()
+        self.publisher = S2Publisher(change_tolerances)
+        self._handlers = MessageHandlers(self.s2_parser.registry)
         self._current_control_type = None
 
         self._eventloop = asyncio.new_event_loop()
@@ -101,6 +217,20 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
         self._handlers.register_handler(Handshake, self._handle_handshake)
         self._handlers.register_handler(HandshakeResponse, self._handle_handshake_response_as_rm)
         self._bearer_token = bearer_token
+        self._decode_frames = decode_frames
+        self._binary_frames = binary_frames
+        self._fragment_size = fragment_size
+        self._wire_codecs = list(wire_codecs)
+        self._wire_codec = None
+        self._compression = compression
+        self._json_codec = json_codec
+        self._ok_reception_status = ReceptionStatusTemplate(
+            ReceptionStatusValues.OK, PROCESSED_OKAY_LABEL, json_codec
+        )
+        self._max_frame_size = max_frame_size
+        self._max_diagnostic_length = max_diagnostic_length
+        self._error_reply_limiter = ErrorReplyLimiter(error_reply_rate, error_reply_burst)
+        self.rejected_frames = RejectedFrameCounters()
 
     def start_as_rm(self) -> None:
         self._run_eventloop(self._run_as_rm())
@@ -151,6 +281,8 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
 
     async def _connect_and_run(self) -> None:
         self._received_messages = asyncio.Queue()
+        # The other party may have lost all messages which were sent over a previous connection.
+        self.publisher.reset()
         await self._connect_ws()
         if self.ws:
 
@@ -209,10 +341,32 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
                     "Authorization": f"Bearer {self._bearer_token}"
                 }
 
+            if isinstance(self._compression, DeflateOptions):
+                connection_kwargs["extensions"] = [self._compression.client_extension_factory()]
+            elif not self._compression:
+                connection_kwargs["compression"] = None
+
+            if self._max_frame_size is not None:
+                connection_kwargs["max_size"] = self._max_frame_size
+
+            if self._wire_codecs:
+                connection_kwargs["subprotocols"] = [Subprotocol(codec.subprotocol) for codec in self._wire_codecs]
+
             self.ws = await ws_connect(uri=self.url, **connection_kwargs)
+            self._select_wire_codec(self.ws.subprotocol)
         except (EOFError, OSError) as e:
             logger.info("Could not connect due to: %s", str(e))
 
+    def _select_wire_codec(self, subprotocol: Optional[str]) -> None:
+        """Exchange messages in the format of the websocket subprotocol selected by the server.
+
+        :param subprotocol: The selected subprotocol. None (or any unknown subprotocol) selects JSON.
+        """
+        self._wire_codec = select_wire_codec([subprotocol], self._wire_codecs)
+        self.s2_parser.wire_codec = self._wire_codec
+        if self._wire_codec is not None:
+            logger.info("Exchanging messages as %s.", self._wire_codec.name)
+
     async def _connect_as_rm(self) -> None:
         await self._send_msg_and_await_reception_status_async(
             Handshake(
@@ -316,35 +470,31 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
 
         logger.info("S2 connection has started to receive messages.")
 
-        async for message in self.ws:
+        async for message in self._receive_frames():
+            if self._max_frame_size is not None and _exceeds_size(message, self._max_frame_size):
+                self.rejected_frames.oversized += 1
+                await self._reject_frame(
+                    S2Connection._parse_message_id(message),
+                    f"Message exceeds the maximum size of {self._max_frame_size}.",
+                )
+                continue
+
             try:
-                s2_msg: S2Message = self.s2_parser.parse_as_any_message(message)
+                s2_msg = self.s2_parser.parse(message)
             except json.JSONDecodeError:
-                await self._send_and_forget(
-                    ReceptionStatus(
-                        subject_message_id=uuid.UUID("00000000-0000-0000-0000-000000000000"),
-                        status=ReceptionStatusValues.INVALID_DATA,
-                        diagnostic_label="Not valid json.",
-                    )
-                )
+                self.rejected_frames.invalid_json += 1
+                await self._reject_frame(None, "Not valid json.")
             except S2ValidationError as e:
-                json_msg = json.loads(message)
-                message_id = json_msg.get("message_id")
+                self.rejected_frames.invalid_message += 1
+                # Binary wire formats can only be scanned for the message id after they have been decoded.
+                message_id = S2Connection._parse_message_id(e.obj if isinstance(e.obj, dict) else message)
                 if message_id:
-                    await self._respond_with_reception_status(
-                        subject_message_id=message_id,
-                        status=ReceptionStatusValues.INVALID_MESSAGE,
-                        diagnostic_label=str(e),
-                    )
+                    await self._reject_frame(message_id, self._diagnostic_label_for(e))
                 else:
-                    await self._respond_with_reception_status(
-                        subject_message_id=uuid.UUID("00000000-0000-0000-0000-000000000000"),
-                        status=ReceptionStatusValues.INVALID_DATA,
-                        diagnostic_label="Message appears valid json but could not find a message_id field.",
+                    await self._reject_frame(
+                        None, "Message appears valid json but could not find a message_id field."
                     )
             else:
-                logger.debug("Received message %s", s2_msg.to_json())
-
                 if isinstance(s2_msg, ReceptionStatus):
                     logger.debug(
                         "Message is a reception status for %s so registering in cache.",
@@ -352,20 +502,180 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
                     )
                     await self.reception_status_awaiter.receive_reception_status(s2_msg)
                 else:
+                    # Not serialized, as that would fully validate a lazily validated message.
+                    logger.debug(
+                        "Received message %s %s", model_class_of(s2_msg).__name__, s2_msg.message_id
+                    )
                     await self._received_messages.put(s2_msg)
 
+    async def _reject_frame(self, message_id: Optional[uuid.UUID], diagnostic_label: str) -> None:
+        """Reply to a rejected frame unless the error reply rate is exceeded.
+
+        The reply is INVALID_MESSAGE if the message id of the frame is known and INVALID_DATA otherwise.
+
+        :param message_id: The message id of the rejected frame, if known.
+        :param diagnostic_label: The reason the frame was rejected.
+        """
+        if not self._error_reply_limiter.try_acquire():
+            self.rejected_frames.suppressed_replies += 1
+            return
+
+        suppressed = self._error_reply_limiter.take_suppressed()
+        if suppressed:
+            diagnostic_label = f"{diagnostic_label} ({suppressed} earlier rejected messages were not answered.)"
+
+        await self._respond_with_reception_status(
+            subject_message_id=message_id or uuid.UUID("00000000-0000-0000-0000-000000000000"),
+            status=(
+                ReceptionStatusValues.INVALID_MESSAGE if message_id else ReceptionStatusValues.INVALID_DATA
+            ),
+            diagnostic_label=self._truncate_diagnostic_label(diagnostic_label),
+        )
+
+    def _diagnostic_label_for(self, error: S2ValidationError) -> str:
+        """Describe a validation error without including the (possibly large) rejected message.
+
+        :param error: The validation error of the rejected message.
+        :return: The diagnostic label.
+        """
+        cause = error.__cause__
+        if isinstance(cause, ValidationError) and cause.error_count():
+            first_error = cause.errors(include_url=False, include_context=False, include_input=False)[0]
+            location = ".".join(str(part) for part in first_error["loc"])
+            diagnostic_label = f"{error.msg} {location}: {first_error['msg']}"
+            if cause.error_count() > 1:
+                diagnostic_label += f" (and {cause.error_count() - 1} more errors)"
+        else:
+            diagnostic_label = error.msg
+        return self._truncate_diagnostic_label(diagnostic_label)
+
+    def _truncate_diagnostic_label(self, diagnostic_label: str) -> str:
+        if len(diagnostic_label) <= self._max_diagnostic_length:
+            return diagnostic_label
+        return diagnostic_label[: max(self._max_diagnostic_length - 3, 0)] + "..."
+
+    @staticmethod
+    def _parse_message_id(message: Union[str, bytes, Dict[str, Any]]) -> Optional[uuid.UUID]:
+        """Retrieve the message id of a message which could not be parsed from its envelope.
+
+        :param message: The message as received or as decoded by the wire codec.
+        :return: The message id or None if the message does not have a valid message id.
+        """
+        message_id = scan_envelope(message, ("message_id",)).message_id
+        if message_id is None:
+            return None
+        try:
+            return uuid.UUID(message_id)
+        except ValueError:
+            return None
+
+    async def _receive_frames(self) -> AsyncIterator[Union[str, bytes]]:
+        """Yield incoming frames until the connection is closed normally.
+
+        Frames are yielded as `str` when `decode_frames` is set and as the raw `bytes` otherwise. Fragmented
+        messages are yielded as a whole, as the parser needs the complete message. With `max_frame_size` the
+        fragments of an oversized message are not collected beyond the maximum size.
+        """
+        if self.ws is None:
+            raise RuntimeError(
+                "Cannot receive messages if websocket connection is not yet established."
+            )
+
+        if self._max_frame_size is not None:
+            try:
+                while True:
+                    yield await self._receive_limited_frame(self._max_frame_size)
+            except websockets.ConnectionClosedOK:
+                return
+
+        if self._decode_frames:
+            async for message in self.ws:
+                yield message
+        else:
+            try:
+                while True:
+                    yield await self.ws.recv(decode=False)
+            except websockets.ConnectionClosedOK:
+                return
+
+    async def _receive_limited_frame(self, max_frame_size: int) -> Union[str, bytes]:
+        """Receive a (possibly fragmented) message, but stop collecting its fragments beyond the maximum size.
+
+        :param max_frame_size: The maximum size of a message in bytes.
+        :return: The message, or its first fragments if the message is longer than the maximum size.
+        """
+        if self.ws is None:
+            raise RuntimeError(
+                "Cannot receive messages if websocket connection is not yet established."
+            )
+
+        fragments: List[Union[str, bytes]] = []
+        size = 0
+        async for fragment in self.ws.recv_streaming(decode=None if self._decode_frames else False):
+            # The remaining fragments of an oversized message are received but dropped. The length of a text
+            # fragment is a lower bound of its size in bytes, the exact size is checked on the whole message.
+            if size <= max_frame_size:
+                fragments.append(fragment)
+                size += len(fragment)
+        if len(fragments) == 1:
+            return fragments[0]
+        return fragments[0][:0].join(fragments)  # type: ignore[arg-type]
+
     async def _send_and_forget(self, s2_msg: S2Message) -> None:
         if self.ws is None:
             raise RuntimeError(
                 "Cannot send messages if websocket connection is not yet established."
             )
 
-        json_msg = s2_msg.to_json()
-        logger.debug("Sending message %s", json_msg)
+        if self._wire_codec is not None:
+            await self._send_frame_and_forget(self._wire_codec.encode(s2_msg))
+        elif self._fragment_size is not None:
+            await self._send_fragments_and_forget(s2_msg, self._fragment_size)
+        elif self._binary_frames:
+            await self._send_frame_and_forget(s2_msg.to_json_bytes(self._json_codec))
+        else:
+            await self._send_frame_and_forget(s2_msg.to_json(self._json_codec))
+
+    async def _send_frame_and_forget(self, frame: Union[str, bytes]) -> None:
+        if self.ws is None:
+            raise RuntimeError(
+                "Cannot send messages if websocket connection is not yet established."
+            )
+
+        logger.debug("Sending message %s", frame)
+        try:
+            await self.ws.send(frame)
+        except websockets.ConnectionClosedError as e:
+            logger.error("Unable to send message %s due to %s", frame, str(e))
+            self._restart_connection_event.set()
+
+    async def _send_fragments_and_forget(self, s2_msg: S2Message, fragment_size: int) -> None:
+        if self.ws is None:
+            raise RuntimeError(
+                "Cannot send messages if websocket connection is not yet established."
+            )
+
+        fragments = iter_json_fragments(s2_msg, fragment_size)
+        first = next(fragments, b"")
+        second = next(fragments, None)
+        if second is None:
+            await self._send_frame_and_forget(first if self._binary_frames else first.decode("utf-8"))
+            return
+
+        all_fragments = itertools.chain((first, second), fragments)
+        frames: Union[Iterator[bytes], Iterator[str]]
+        if self._binary_frames:
+            frames = all_fragments
+        else:
+            # Fragments may end in the middle of a multi-byte character.
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            frames = (decoder.decode(fragment) for fragment in all_fragments)
+
+        logger.debug("Sending message %s in fragments of %s bytes", type(s2_msg).__name__, fragment_size)
         try:
-            await self.ws.send(json_msg)
+            await self.ws.send(frames)
         except websockets.ConnectionClosedError as e:
-            logger.error("Unable to send message %s due to %s", s2_msg, str(e))
+            logger.error("Unable to send message %s due to %s", type(s2_msg).__name__, str(e))
             self._restart_connection_event.set()
 
     async def _respond_with_reception_status(
@@ -374,6 +684,17 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
         logger.debug(
             "Responding to message %s with status %s", subject_message_id, status
         )
+        # The most frequent reply is rendered from a template instead of validating and serializing a new message.
+        if (
+            self._wire_codec is None
+            and isinstance(subject_message_id, uuid.UUID)
+            and self._ok_reception_status.matches(status, diagnostic_label)
+        ):
+            if self._binary_frames:
+                await self._send_frame_and_forget(self._ok_reception_status.render_bytes(subject_message_id))
+            else:
+                await self._send_frame_and_forget(self._ok_reception_status.render(subject_message_id))
+            return
         await self._send_and_forget(
             ReceptionStatus(
                 subject_message_id=subject_message_id,
@@ -436,6 +757,44 @@ class S2Connection:  # pylint: disable=too-many-instance-attributes
             self._eventloop,
         ).result()
 
+    async def _publish_msg_async(
+        self,
+        s2_msg: S2Message,
+        timeout_reception_status: float = 5.0,
+        raise_on_error: bool = True,
+    ) -> Optional[ReceptionStatus]:
+        if not self.publisher.is_changed(s2_msg):
+            logger.debug("Not sending %s as it did not change since it was last sent.", type(s2_msg).__name__)
+            return None
+
+        reception_status = await self._send_msg_and_await_reception_status_async(
+            s2_msg, timeout_reception_status, raise_on_error
+        )
+        if reception_status.status == ReceptionStatusValues.OK:
+            self.publisher.record_sent(s2_msg)
+        return reception_status
+
+    def publish_msg_sync(
+        self,
+        s2_msg: S2Message,
+        timeout_reception_status: float = 5.0,
+        raise_on_error: bool = True,
+    ) -> Optional[ReceptionStatus]:
+        """Send a message and wait for its reception status, unless it did not change since it was last sent.
+
+        Messages are compared with the last accepted message of the same class according to `change_tolerances`.
+        Messages of classes without a tolerance are always sent.
+
+        :param s2_msg: The message.
+        :param timeout_reception_status: The time in seconds to wait for the reception status.
+        :param raise_on_error: Raise a RuntimeError if the reception status is not OK.
+        :return: The reception status or None if the message was not sent.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._publish_msg_async(s2_msg, timeout_reception_status, raise_on_error),
+            self._eventloop,
+        ).result()
+
     async def _handle_received_messages(self) -> None:
         while True:
             msg = await self._received_messages.get()
@@ -0,0 +1,178 @@
+"""Scan the envelope of an S2 message without parsing the full message.
+
+The envelope consists of the `message_type`, `message_id` and (for a ReceptionStatus) the `subject_message_id` of an
+S2 message. These are all that is needed to route a message, to reply to a message which could not be parsed or to
+filter messages in log tooling. Instead of parsing the whole JSON document, the raw text is searched for each quoted
+envelope key. As S2 messages are serialized with the envelope keys first, the cost of a scan usually does not depend on
+the size of the message. A missing key costs a single `find` over the message, except for the `subject_message_id`
+which is not searched for when the message type is known to be something else than a ReceptionStatus.
+
+A quoted key is only accepted when it follows a `{` or `,`, is followed by a `:` and is a key of the top-level object.
+Within a JSON string any quote is escaped, so the same text inside a string value is never mistaken for a key. To
+check the nesting level, the message is tokenized from the start up to the key, which is cheap as the envelope keys
+come first.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Optional, Pattern, Tuple, Union
+
+from s2python.json_codec import get_json_codec
+
+ENVELOPE_FIELDS = ("message_type", "message_id", "subject_message_id")
+
+_VALUE_PATTERN = r'\s*:\s*(?:"((?:[^"\\]|\\.)*)"|[^,}\s]+)'
+_STR_VALUE_PATTERN: Pattern[str] = re.compile(_VALUE_PATTERN, re.DOTALL)
+_BYTES_VALUE_PATTERN: Pattern[bytes] = re.compile(_VALUE_PATTERN.encode("ascii"), re.DOTALL)
+_KEY_PRECEDERS = "{,"
+_WHITESPACE = " \t\r\n"
+
+# A JSON string, a run of characters without strings or brackets or a single (bracket) character.
+_TOKEN_PATTERN = r'"(?:[^"\\]|\\.)*"|[^"{}\[\]]+|.'
+_STR_TOKEN_PATTERN: Pattern[str] = re.compile(_TOKEN_PATTERN, re.DOTALL)
+_BYTES_TOKEN_PATTERN: Pattern[bytes] = re.compile(_TOKEN_PATTERN.encode("ascii"), re.DOTALL)
+_OPENING_BRACKETS = ("{", "[", b"{", b"[")
+_CLOSING_BRACKETS = ("}", "]", b"}", b"]")
+
+
+@dataclass(frozen=True)
+class S2Envelope:
+    message_type: Optional[str] = None
+    message_id: Optional[str] = None
+    subject_message_id: Optional[str] = None
+
+
+def _decode_value(value: Union[str, bytes, None]) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="replace")
+    if "\\" in value:
+        try:
+            return str(get_json_codec().loads(f'"{value}"'))
+        except json.JSONDecodeError:
+            return None
+    return value
+
+
+def _is_key_position(message: Union[str, bytes], position: int) -> bool:
+    position -= 1
+    while position >= 0:
+        character = message[position : position + 1]
+        if isinstance(character, bytes):
+            character = character.decode("ascii", errors="replace")
+        if character not in _WHITESPACE:
+            return character in _KEY_PRECEDERS
+        position -= 1
+    return False
+
+
+class _DepthTracker:
+    """Track the nesting depth of a JSON document while tokenizing it from the start."""
+
+    def __init__(self, message: Union[str, bytes]):
+        token_pattern: Pattern[Any] = _BYTES_TOKEN_PATTERN if isinstance(message, bytes) else _STR_TOKEN_PATTERN
+        self._tokens: Iterator["re.Match[Any]"] = token_pattern.finditer(message)
+        self._next_token: Optional["re.Match[Any]"] = None
+        self._depth = 0
+
+    def depth_at(self, position: int) -> Optional[int]:
+        """Return the nesting depth at the position, which may not be before a previously checked position.
+
+        :param position: The index in the message.
+        :return: The depth (1 within the top-level object) or None if the position is within a string.
+        """
+        while True:
+            if self._next_token is None:
+                self._next_token = next(self._tokens, None)
+                if self._next_token is None:
+                    return None
+            token = self._next_token
+            if token.start() == position:
+                return self._depth
+            if token.end() > position:
+                return None
+            character = token.group()[:1]
+            if character in _OPENING_BRACKETS:
+                self._depth += 1
+            elif character in _CLOSING_BRACKETS:
+                self._depth -= 1
+            self._next_token = None
+
+
+def _find_value_match(message: Union[str, bytes], key: str) -> Optional["re.Match[Any]"]:
+    value_pattern: Pattern[Any]
+    if isinstance(message, bytes):
+        quoted_key: Union[str, bytes] = f'"{key}"'.encode("ascii")
+        value_pattern = _BYTES_VALUE_PATTERN
+    else:
+        quoted_key = f'"{key}"'
+        value_pattern = _STR_VALUE_PATTERN
+
+    depth_tracker = _DepthTracker(message)
+    position = message.find(quoted_key)  # type: ignore[arg-type]
+    while position != -1:
+        if _is_key_position(message, position) and depth_tracker.depth_at(position) == 1:
+            match = value_pattern.match(message, position + len(quoted_key))  # type: ignore[arg-type]
+            if match is not None:
+                return match
+        position = message.find(quoted_key, position + 1)  # type: ignore[arg-type]
+    return None
+
+
+def _find_value(message: Union[str, bytes], key: str) -> Optional[str]:
+    match = _find_value_match(message, key)
+    if match is None:
+        return None
+    return _decode_value(match.group(1))
+
+
+def find_value_span(message: Union[str, bytes], key: str) -> Optional[Tuple[int, int]]:
+    """Find the position of the string value of a top-level envelope key in the raw message.
+
+    :param message: The message as a JSON-formatted string or bytes.
+    :param key: One of the envelope keys.
+    :return: The start and end index of the value (without quotes) or None if the key has no string value.
+    """
+    match = _find_value_match(message, key)
+    if match is None or match.group(1) is None:
+        return None
+    return match.span(1)
+
+
+def scan_envelope(
+    unparsed_message: Union[Dict[Any, Any], str, bytes],
+    fields: Iterable[str] = ENVELOPE_FIELDS,
+) -> S2Envelope:
+    """Retrieve the envelope of an S2 message without parsing or validating the rest of the message.
+
+    The message is not checked to be valid JSON. A key which is missing or does not have a string value is returned
+    as None.
+
+    :param unparsed_message: The message as a JSON-formatted string or bytes or as a JSON-parsed dictionary.
+    :param fields: The envelope keys to retrieve. Only these keys are searched for.
+    :return: The envelope of the message.
+    """
+    fields = tuple(fields)
+    if isinstance(unparsed_message, dict):
+        return S2Envelope(
+            **{
+                key: value if isinstance(value, str) else None
+                for key, value in unparsed_message.items()
+                if key in fields
+            }
+        )
+
+    found: Dict[str, Optional[str]] = {}
+    if "message_type" in fields:
+        found["message_type"] = _find_value(unparsed_message, "message_type")
+    for key in fields:
+        if key == "message_type":
+            continue
+        if key == "subject_message_id" and found.get("message_type") not in (None, "ReceptionStatus"):
+            found[key] = None
+        else:
+            found[key] = _find_value(unparsed_message, key)
+
+    return S2Envelope(**found)
@@ -0,0 +1,129 @@
+"""Serialize large S2 messages to JSON in fragments of bounded size.
+
+A `PPBCPowerProfileDefinition` with many sequences or an `FRBCSystemDescription` with hundreds of operation modes
+would otherwise be serialized into a single large string before it is sent. `iter_json_fragments` walks the message
+tree instead: small S2 objects (which nest at most `SERIALIZED_WHOLE_DEPTH` levels of S2 objects) are serialized whole
+by pydantic-core, everything above them is written piece by piece. The pieces are collected into fragments of
+`fragment_size` bytes, which `S2Connection` sends as websocket continuation frames. Peak memory is then proportional to
+the fragment size plus the largest of the small objects, instead of to the size of the whole message, while the
+serialization is as fast as `to_json_bytes()`.
+
+The concatenated fragments are byte for byte equal to `to_json_bytes()`.
+"""
+
+from typing import Any, Dict, Iterator, List, Type, get_args
+
+from pydantic import BaseModel, RootModel  # pylint: disable=no-name-in-module
+from pydantic_core import to_json
+
+from s2python import sealed_json
+
+DEFAULT_FRAGMENT_SIZE = 64 * 1024
+
+# S2 objects which nest at most this many levels of S2 objects are serialized whole, e.g. an `FRBCOperationMode` with
+# its elements and their power ranges. Walking the tree any deeper costs more time than it saves memory.
+SERIALIZED_WHOLE_DEPTH = 2
+
+_NESTING_DEPTHS: Dict[Type[BaseModel], int] = {}
+
+
+def _nested_model_classes(annotation: Any) -> Iterator[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if not issubclass(annotation, RootModel):
+            yield annotation
+        return
+    for argument in get_args(annotation):
+        yield from _nested_model_classes(argument)
+
+
+def _nesting_depth(model_class: Type[BaseModel]) -> int:
+    depth = _NESTING_DEPTHS.get(model_class)
+    if depth is None:
+        depth = 0
+        for field_info in model_class.model_fields.values():
+            for nested_class in _nested_model_classes(field_info.annotation):
+                depth = max(depth, _nesting_depth(nested_class) + 1)
+        _NESTING_DEPTHS[model_class] = depth
+    return depth
+
+
+def _is_nested(value: Any) -> bool:
+    if isinstance(value, list):
+        return bool(value) and isinstance(value[0], BaseModel) and not isinstance(value[0], RootModel)
+    return isinstance(value, BaseModel) and not isinstance(value, RootModel)
+
+
+def _serialize_fields(model: BaseModel, names: List[str]) -> bytes:
+    # Serialized as `{"a":1,"b":2}`; fields which are None are left out, so the result may be `{}`.
+    return model.__pydantic_serializer__.to_json(model, include=set(names), by_alias=True, exclude_none=True)[1:-1]
+
+
+def _iter_pieces(value: Any) -> Iterator[bytes]:
+    if isinstance(value, list):
+        yield b"["
+        for index, item in enumerate(value):
+            if index:
+                yield b","
+            yield from _iter_pieces(item)
+        yield b"]"
+        return
+
+    if _nesting_depth(type(value)) <= SERIALIZED_WHOLE_DEPTH:
+        yield value.__pydantic_serializer__.to_json(value, by_alias=True, exclude_none=True)
+        return
+
+    nested = [name for name, field_value in value.__dict__.items() if _is_nested(field_value)]
+    if not nested:
+        yield value.__pydantic_serializer__.to_json(value, by_alias=True, exclude_none=True)
+        return
+
+    yield b"{"
+    separator = b""
+    plain_fields: List[str] = []
+    for name, field_info in type(value).model_fields.items():
+        if name not in nested:
+            plain_fields.append(name)
+            continue
+        if plain_fields:
+            serialized = _serialize_fields(value, plain_fields)
+            plain_fields = []
+            if serialized:
+                yield separator + serialized
+                separator = b","
+        yield separator + to_json(field_info.alias or name) + b":"
+        separator = b","
+        yield from _iter_pieces(getattr(value, name))
+    if plain_fields:
+        serialized = _serialize_fields(value, plain_fields)
+        if serialized:
+            yield separator + serialized
+    yield b"}"
+
+
+def iter_json_fragments(message: BaseModel, fragment_size: int = DEFAULT_FRAGMENT_SIZE) -> Iterator[bytes]:
+    """Serialize an S2 message to UTF-8 encoded JSON in fragments.
+
+    Fragments may end in the middle of a multi-byte UTF-8 character, so decode them with an incremental decoder.
+
+    :param message: The S2 message or message component.
+    :param fragment_size: The size of every fragment in bytes, except for the last one.
+    :raises: ValueError if the fragment size is not positive.
+    :return: An iterator over the fragments.
+    """
+    if fragment_size < 1:
+        raise ValueError("The fragment size must be at least 1 byte.")
+
+    sealed = sealed_json.sealed_json_bytes(message)
+    if sealed is not None:
+        for start in range(0, len(sealed), fragment_size):
+            yield sealed[start:start + fragment_size]
+        return
+
+    buffer = bytearray()
+    for piece in _iter_pieces(message):
+        buffer += piece
+        while len(buffer) >= fragment_size:
+            yield bytes(buffer[:fragment_size])
+            del buffer[:fragment_size]
+    if buffer:
+        yield bytes(buffer)
@@ -0,0 +1,235 @@
+"""Proxies for S2 messages of which the nested lists are only validated when they are accessed.
+
+Handlers often only look at a few top-level fields of large messages, e.g. `valid_from` and the actuator ids of an
+`FRBCSystemDescription`. A `LazyS2Object` validates all fields of its object eagerly, except for lists of S2 objects
+(e.g. `actuators`, `operation_modes`, `elements`). These are returned as a `LazyS2List` which validates an item, again
+as a `LazyS2Object`, only when it is accessed.
+
+The model validators which check the consistency between fields are not run, as they would access all nested lists.
+`validate_fully()` validates the object as a whole, including all model validators, and returns the resulting S2
+object. Any attribute which is not a field (e.g. `to_json`) is also retrieved from the fully validated object.
+
+A proxy is not an instance of the S2 class it represents; `model_class` (or `model_class_of(message)` for any parsed
+message) is that class. Messages without any lists of S2 objects, e.g. `ReceptionStatus`, are not proxied but
+validated fully right away, as there is nothing to defer.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Type, Union, get_args, get_origin, overload
+
+from pydantic import BaseModel, ValidationError  # pylint: disable=no-name-in-module
+from pydantic_core import SchemaValidator
+
+from s2python import frozen
+from s2python.s2_trusted_validator import build_trusted_validator, strip_validator_functions
+from s2python.s2_validation_error import S2ValidationError
+
+_LAZY_FIELDS: Dict[Type[BaseModel], Dict[str, Type[BaseModel]]] = {}
+_SHALLOW_VALIDATORS: Dict[Type[BaseModel], SchemaValidator] = {}
+_LIST_SCHEMA_WRAPPER_TYPES = ("default", "nullable", "function-after", "function-before", "function-wrap")
+
+
+def _list_item_model_class(annotation: Any) -> Optional[Type[BaseModel]]:
+    if get_origin(annotation) is Union:
+        arguments = [argument for argument in get_args(annotation) if argument not in (None, type(None))]
+        if len(arguments) != 1:
+            return None
+        annotation = arguments[0]
+    if get_origin(annotation) not in (list, List):
+        return None
+    (item_annotation,) = get_args(annotation)
+    if isinstance(item_annotation, type) and issubclass(item_annotation, BaseModel):
+        return item_annotation
+    return None
+
+
+def lazy_fields_of(model_class: Type[BaseModel]) -> Dict[str, Type[BaseModel]]:
+    """Retrieve the fields of a model class which are validated lazily.
+
+    :param model_class: The S2 class.
+    :return: The name of each field which is a list of S2 objects, mapped to the class of the items.
+    """
+    lazy_fields = _LAZY_FIELDS.get(model_class)
+    if lazy_fields is None:
+        lazy_fields = {}
+        for name, field in model_class.model_fields.items():
+            item_class = _list_item_model_class(field.annotation)
+            if item_class is not None:
+                lazy_fields[name] = item_class
+        _LAZY_FIELDS[model_class] = lazy_fields
+    return lazy_fields
+
+
+def _find_model_schema(schema: Any, model_class: Type[BaseModel]) -> Optional[Dict[str, Any]]:
+    if isinstance(schema, dict):
+        if schema.get("type") == "model" and schema.get("cls") is model_class:
+            return schema
+        for key, value in schema.items():
+            if key != "serialization":
+                found = _find_model_schema(value, model_class)
+                if found is not None:
+                    return found
+    elif isinstance(schema, list):
+        for item in schema:
+            found = _find_model_schema(item, model_class)
+            if found is not None:
+                return found
+    return None
+
+
+def _accept_any_list_items(schema: Dict[str, Any]) -> None:
+    while schema.get("type") in _LIST_SCHEMA_WRAPPER_TYPES:
+        schema = schema["schema"]
+    if schema.get("type") == "list":
+        schema["items_schema"] = {"type": "any"}
+
+
+def shallow_validator_for(model_class: Type[BaseModel]) -> SchemaValidator:
+    """Retrieve the (cached) validator which validates all fields of a model class except the lazy fields.
+
+    The lazy fields keep their raw items. No validator functions are run.
+
+    :param model_class: The S2 class.
+    :return: The compiled validator.
+    """
+    validator = _SHALLOW_VALIDATORS.get(model_class)
+    if validator is None:
+        schema = strip_validator_functions(model_class.__pydantic_core_schema__)
+        model_schema = _find_model_schema(schema, model_class)
+        if model_schema is not None:
+            fields = model_schema["schema"]["fields"]
+            for name in lazy_fields_of(model_class):
+                _accept_any_list_items(fields[name]["schema"])
+        validator = build_trusted_validator(schema)
+        _SHALLOW_VALIDATORS[model_class] = validator
+    return validator
+
+
+class LazyS2Object:
+    """Proxy for an S2 message or message component which validates its nested lists on first access."""
+
+    __slots__ = ("_model_class", "_raw", "_shallow", "_lazy_values", "_validated")
+
+    _model_class: Type[BaseModel]
+    _raw: Dict[str, Any]
+    _shallow: BaseModel
+    _lazy_values: Dict[str, Optional["LazyS2List"]]
+    _validated: Optional[BaseModel]
+
+    def __init__(self, model_class: Type[BaseModel], raw: Dict[str, Any]) -> None:
+        """Validate all fields of the S2 object except for the lists of S2 objects.
+
+        :param model_class: The S2 class the raw data should be validated as.
+        :param raw: The JSON-parsed dictionary.
+        :raises: S2ValidationError
+        """
+        try:
+            shallow = shallow_validator_for(model_class).validate_python(raw)
+        except (ValidationError, TypeError) as e:
+            raise S2ValidationError(model_class, raw, "Pydantic raised a validation error.") from e
+
+        object.__setattr__(self, "_model_class", model_class)
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_shallow", shallow)
+        object.__setattr__(self, "_lazy_values", {})
+        object.__setattr__(self, "_validated", None)
+
+    @property
+    def model_class(self) -> Type[BaseModel]:
+        """The S2 class of the object this proxy represents."""
+        return self._model_class
+
+    def __getattr__(self, name: str) -> Any:
+        lazy_fields = lazy_fields_of(self._model_class)
+        if name in lazy_fields:
+            if name not in self._lazy_values:
+                raw_items = getattr(self._shallow, name)
+                self._lazy_values[name] = None if raw_items is None else LazyS2List(raw_items, lazy_fields[name])
+            return self._lazy_values[name]
+        if name in self._model_class.model_fields:
+            return getattr(self._shallow, name)
+        return getattr(self.validate_fully(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"A lazily validated {self._model_class.__name__} may not be modified.")
+
+    def __repr__(self) -> str:
+        lazy_fields = lazy_fields_of(self._model_class)
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" if name in lazy_fields else f"{name}={getattr(self._shallow, name)!r}"
+            for name in self._model_class.model_fields
+        )
+        return f"Lazy{self._model_class.__name__}({fields})"
+
+    def validate_fully(self) -> Any:
+        """Validate the S2 object as a whole including all nested objects and model validators.
+
+        :raises: S2ValidationError
+        :return: The fully validated S2 object.
+        """
+        if self._validated is None:
+            try:
+                validated = self._model_class.model_validate(self._raw)
+            except (ValidationError, TypeError) as e:
+                raise S2ValidationError(self._model_class, self._raw, "Pydantic raised a validation error.") from e
+            object.__setattr__(self, "_validated", validated)
+        return self._validated
+
+
+class LazyS2List(Sequence[LazyS2Object]):
+    """A list of S2 objects which validates each item on first access."""
+
+    __slots__ = ("_raw_items", "_item_class", "_items")
+
+    _raw_items: List[Any]
+    _item_class: Type[BaseModel]
+    _items: List[Optional[LazyS2Object]]
+
+    def __init__(self, raw_items: List[Any], item_class: Type[BaseModel]) -> None:
+        self._raw_items = raw_items
+        self._item_class = item_class
+        self._items = [None] * len(raw_items)
+
+    def _item(self, index: int) -> LazyS2Object:
+        item = self._items[index]
+        if item is None:
+            item = LazyS2Object(self._item_class, self._raw_items[index])
+            self._items[index] = item
+        return item
+
+    @overload
+    def __getitem__(self, index: int) -> LazyS2Object: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[LazyS2Object]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[LazyS2Object, List[LazyS2Object]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self._raw_items)))]
+        return self._item(range(len(self._raw_items))[index])
+
+    def __len__(self) -> int:
+        return len(self._raw_items)
+
+    def __repr__(self) -> str:
+        return f"LazyS2List[{self._item_class.__name__}](length={len(self._raw_items)})"
+
+    def validate_fully(self) -> List[Any]:
+        """Validate all items as a whole including all nested objects and model validators.
+
+        :raises: S2ValidationError
+        :return: The fully validated S2 objects.
+        """
+        return [self._item(i).validate_fully() for i in range(len(self._raw_items))]
+
+
+def model_class_of(message: Union[BaseModel, LazyS2Object]) -> Type[BaseModel]:
+    """Retrieve the S2 class of an S2 object or of the object a proxy represents.
+
+    :param message: The S2 object, which may be frozen (see `s2python.frozen`), or proxy.
+    :return: The S2 class. For frozen objects this is the original class and not its frozen subclass.
+    """
+    if isinstance(message, LazyS2Object):
+        return message.model_class
+    if frozen.is_frozen(message):
+        return type(message).__base__  # type: ignore[return-value]
+    return type(message)
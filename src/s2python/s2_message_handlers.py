@@ -2,10 +2,14 @@ import asyncio
 import logging
 import threading
 import uuid
-from typing import Type, Dict, Callable, Awaitable, Union, TYPE_CHECKING
+from typing import Type, Dict, Callable, Awaitable, Optional, Union, TYPE_CHECKING
 
 from s2python.common import ReceptionStatusValues
 from s2python.message import S2Message
+from s2python.reception_status_template import PROCESSED_OKAY_LABEL
+from s2python.s2_lazy_message import LazyS2Object, model_class_of
+from s2python.s2_message_registry import S2MessageRegistry
+from s2python.s2_validation_error import S2ValidationError
 
 if TYPE_CHECKING:
     from s2python.s2_connection import S2Connection
@@ -35,7 +39,7 @@ class SendOkay:
         await self.connection._respond_with_reception_status(  # pylint: disable=protected-access
             subject_message_id=self.subject_message_id,
             status=ReceptionStatusValues.OK,
-            diagnostic_label="Processed okay.",
+            diagnostic_label=PROCESSED_OKAY_LABEL,
         )
 
     def run_sync(self) -> None:
@@ -44,7 +48,7 @@ class SendOkay:
         self.connection.respond_with_reception_status_sync(
             subject_message_id=self.subject_message_id,
             status=ReceptionStatusValues.OK,
-            diagnostic_label="Processed okay.",
+            diagnostic_label=PROCESSED_OKAY_LABEL,
         )
 
     async def ensure_send_async(self, type_msg: Type[S2Message]) -> None:
@@ -70,32 +74,52 @@ class SendOkay:
 
 class MessageHandlers:
     handlers: Dict[Type[S2Message], S2MessageHandler]
+    registry: Optional[S2MessageRegistry]
 
-    def __init__(self) -> None:
+    def __init__(self, registry: Optional[S2MessageRegistry] = None) -> None:
+        """Create the collection of message handlers.
+
+        :param registry: Only allow handlers for the message classes in this registry. None allows any message class.
+        """
         self.handlers = {}
+        self.registry = registry
 
-    async def handle_message(self, connection: "S2Connection", msg: S2Message) -> None:
+    async def handle_message(self, connection: "S2Connection", msg: Union[S2Message, LazyS2Object]) -> None:
         """Handle the S2 message using the registered handler.
 
+        A lazily validated message (see `s2python.s2_lazy_message`) is handled by the handler of the S2 class it
+        represents. If it turns out to be invalid while it is handled, it is answered with INVALID_DATA.
+
         :param connection: The S2 conncetion the `msg` is received from.
         :param msg: The S2 message
         """
-        handler = self.handlers.get(type(msg))
+        msg_type: Type[S2Message] = model_class_of(msg)  # type: ignore[assignment]
+        handler = self.handlers.get(msg_type)
         if handler is not None:
             send_okay = SendOkay(connection, msg.message_id)  # type: ignore[attr-defined, union-attr]
 
             try:
                 if asyncio.iscoroutinefunction(handler):
                     await handler(connection, msg, send_okay.run_async())  # type: ignore[arg-type]
-                    await send_okay.ensure_send_async(type(msg))
+                    await send_okay.ensure_send_async(msg_type)
                 else:
 
                     def do_message() -> None:
                         handler(connection, msg, send_okay.run_sync)  # type: ignore[arg-type]
-                        send_okay.ensure_send_sync(type(msg))
+                        send_okay.ensure_send_sync(msg_type)
 
                     eventloop = asyncio.get_event_loop()
                     await eventloop.run_in_executor(executor=None, func=do_message)
+            except S2ValidationError as e:
+                if not isinstance(msg, LazyS2Object):
+                    raise
+                connection.rejected_frames.invalid_message += 1
+                if not send_okay.status_is_send.is_set():
+                    await connection._respond_with_reception_status(  # pylint: disable=protected-access
+                        subject_message_id=msg.message_id,
+                        status=ReceptionStatusValues.INVALID_DATA,
+                        diagnostic_label=connection._diagnostic_label_for(e),  # pylint: disable=protected-access
+                    )
             except Exception:
                 if not send_okay.status_is_send.is_set():
                     await connection._respond_with_reception_status(  # pylint: disable=protected-access
@@ -108,7 +132,7 @@ class MessageHandlers:
         else:
             logger.warning(
                 "Received a message of type %s but no handler is registered. Ignoring the message.",
-                type(msg),
+                msg_type,
             )
 
     def register_handler(
@@ -118,5 +142,10 @@ class MessageHandlers:
 
         :param msg_type: The S2 message type to attach the handler to.
         :param handler: The function (asynchronuous or normal) which should handle the S2 message.
+        :raises: ValueError if a registry is set and the message type is not registered in it.
         """
+        if self.registry is not None and not self.registry.is_registered(msg_type):
+            raise ValueError(
+                f"Cannot register a handler for {msg_type.__name__} as it is not a registered S2 message."
+            )
         self.handlers[msg_type] = handler
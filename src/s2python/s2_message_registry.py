@@ -0,0 +1,185 @@
+"""Registry of the S2 message classes which may be parsed and handled.
+
+The registry maps each `message_type` to its message class and holds the compiled validators for all registered
+messages. Message classes, e.g. vendor extension messages, may be registered or unregistered at runtime. The compiled
+validators are rebuilt once per change of the registry instead of on every parsed message. The registered classes and
+their validators are replaced together, as a single snapshot, so a registry which is changed while other threads parse
+messages never pairs the classes of one state with the validators of another.
+
+The registry is a read-only mapping from message type to message class.
+
+Each message class must be an `S2MessageComponent` with a `message_type` field which has a literal default value that
+is unique within the registry.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple, Type, Union
+
+from typing_extensions import Annotated
+
+from pydantic import Field, TypeAdapter  # pylint: disable=no-name-in-module
+from pydantic_core import SchemaValidator
+
+from s2python.s2_trusted_validator import build_trusted_validator
+from s2python.validate_values_mixin import S2MessageComponent
+
+
+def build_message_adapter(message_classes: Iterable[Type[S2MessageComponent]]) -> TypeAdapter:
+    """Compile a single validator for all given message classes.
+
+    The validator is a union discriminated on the `message_type` literal of each class so pydantic selects the right
+    class without trying the others and is able to validate straight from a JSON string or bytes.
+
+    :param message_classes: The S2 message classes which may be parsed by the resulting adapter.
+    :return: The compiled type adapter.
+    """
+    # A single class is validated as a discriminated union as well, so an unknown message type is reported as such.
+    union_type = Union[tuple(message_classes)]  # type: ignore[valid-type]
+    return TypeAdapter(Annotated[union_type, Field(discriminator="message_type")])  # type: ignore[arg-type]
+
+
+def message_type_of(message_class: Type[S2MessageComponent]) -> str:
+    """Retrieve the `message_type` literal of a message class.
+
+    :param message_class: The S2 message class.
+    :raises: ValueError if the class does not have a `message_type` field with a string default value.
+    :return: The message type.
+    """
+    field = message_class.model_fields.get("message_type")
+    if field is None or not isinstance(field.default, str):
+        raise ValueError(
+            f"{message_class.__name__} cannot be registered as an S2 message as it does not have a 'message_type' "
+            f"field with a literal default value."
+        )
+    return field.default
+
+
+class _RegistryState(NamedTuple):
+    message_classes: Mapping[str, Type[S2MessageComponent]]
+    adapter: Optional[TypeAdapter]
+    trusted_validator: Optional[SchemaValidator]
+
+
+_EMPTY_STATE = _RegistryState({}, None, None)
+
+
+class S2MessageRegistry(Mapping[str, Type[S2MessageComponent]]):
+    _state: _RegistryState
+
+    def __init__(self, message_classes: Iterable[Type[S2MessageComponent]] = ()) -> None:
+        """Create a registry.
+
+        :param message_classes: The message classes to register initially.
+        :raises: ValueError if the message classes are not valid or their message types are not unique.
+        """
+        self._state = _EMPTY_STATE
+        self.register_all(message_classes)
+
+    def register(self, message_class: Type[S2MessageComponent]) -> None:
+        """Register a message class.
+
+        :param message_class: The S2 message class.
+        :raises: ValueError if the class is not valid or its message type is already registered for another class.
+        """
+        self.register_all([message_class])
+
+    def register_all(self, message_classes: Iterable[Type[S2MessageComponent]]) -> None:
+        """Register multiple message classes and rebuild the compiled validators only once.
+
+        Either all message classes are registered or, if any of them is not valid, none of them.
+
+        :param message_classes: The S2 message classes.
+        :raises: ValueError if a class is not valid or its message type is already registered for another class.
+        """
+        message_classes_by_type = dict(self._state.message_classes)
+        for message_class in message_classes:
+            message_type = message_type_of(message_class)
+            registered_class = message_classes_by_type.get(message_type)
+            if registered_class is not None and registered_class is not message_class:
+                raise ValueError(
+                    f"Message type {message_type} of {message_class.__name__} is already registered for "
+                    f"{registered_class.__name__}."
+                )
+            message_classes_by_type[message_type] = message_class
+        self._update(message_classes_by_type)
+
+    def unregister(self, message_class_or_type: Union[Type[S2MessageComponent], str]) -> None:
+        """Unregister a message class.
+
+        :param message_class_or_type: The S2 message class or its message type.
+        :raises: KeyError if the message class or type is not registered.
+        """
+        if isinstance(message_class_or_type, str):
+            message_type = message_class_or_type
+        else:
+            message_type = message_type_of(message_class_or_type)
+            if self._state.message_classes.get(message_type) is not message_class_or_type:
+                raise KeyError(message_class_or_type)
+
+        message_classes_by_type = dict(self._state.message_classes)
+        del message_classes_by_type[message_type]
+        self._update(message_classes_by_type)
+
+    def _update(self, message_classes_by_type: Dict[str, Type[S2MessageComponent]]) -> None:
+        if not message_classes_by_type:
+            self._state = _EMPTY_STATE
+            return
+        adapter = build_message_adapter(message_classes_by_type.values())
+        # The new state is only published once it is complete.
+        self._state = _RegistryState(
+            MappingProxyType(message_classes_by_type), adapter, build_trusted_validator(adapter.core_schema)
+        )
+
+    @property
+    def adapter(self) -> TypeAdapter:
+        """The compiled validator for all registered messages."""
+        adapter = self._state.adapter
+        if adapter is None:
+            raise LookupError("No S2 messages are registered.")
+        return adapter
+
+    @property
+    def trusted_validator(self) -> SchemaValidator:
+        """The compiled validator for all registered messages which does not run any validator functions."""
+        trusted_validator = self._state.trusted_validator
+        if trusted_validator is None:
+            raise LookupError("No S2 messages are registered.")
+        return trusted_validator
+
+    def message_class(self, message_type: Any) -> Optional[Type[S2MessageComponent]]:
+        """Retrieve the message class which is registered for the message type.
+
+        :param message_type: The message type.
+        :return: The message class or None if no class is registered for the message type.
+        """
+        return self._state.message_classes.get(message_type)
+
+    def is_registered(self, message_class: Type[Any]) -> bool:
+        """Check whether a message class is registered.
+
+        :param message_class: The message class.
+        :return: True if the message class is registered.
+        """
+        try:
+            return self._state.message_classes.get(message_type_of(message_class)) is message_class
+        except ValueError:
+            return False
+
+    def message_classes(self) -> Tuple[Type[S2MessageComponent], ...]:
+        """Retrieve all registered message classes.
+
+        :return: The message classes in order of registration.
+        """
+        return tuple(self._state.message_classes.values())
+
+    def __getitem__(self, message_type: str) -> Type[S2MessageComponent]:
+        return self._state.message_classes[message_type]
+
+    def __contains__(self, message_type: object) -> bool:
+        return message_type in self._state.message_classes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._state.message_classes)
+
+    def __len__(self) -> int:
+        return len(self._state.message_classes)
@@ -0,0 +1,102 @@
+"""Serialize collections of S2 messages to newline-delimited JSON (NDJSON) and read them back.
+
+Each message is serialized straight to bytes by pydantic-core and appended to a single output buffer, so no
+intermediate strings are created or joined. The messages in a collection may be of mixed types. `read_ndjson` streams
+the messages back using `S2Parser.iter_parse`. The same functions are available as `S2MessageComponent.dump_ndjson`,
+`S2MessageComponent.write_ndjson` and `S2MessageComponent.read_ndjson`.
+"""
+
+import functools
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from s2python.json_codec import JsonCodec
+from s2python.s2_parser import ParsedLine, S2Parser
+from s2python.utils import chunked, map_in_process_pool
+from s2python.validate_values_mixin import S2MessageComponent
+
+
+def dump_ndjson(
+    messages: Iterable[S2MessageComponent],
+    output: Optional[bytearray] = None,
+    json_codec: Optional[JsonCodec] = None,
+) -> bytearray:
+    """Serialize S2 messages to newline-delimited JSON.
+
+    :param messages: The S2 messages, which may be of different types.
+    :param output: The buffer the JSON lines are appended to. Pass the same (cleared) buffer to reuse its memory for
+                   consecutive batches. None creates a new buffer.
+    :param json_codec: Serialize with this JSON library. None lets pydantic-core serialize directly, which is the
+                       fastest option.
+    :raises: S2ValidationError
+    :return: The buffer with one line per message.
+    """
+    if output is None:
+        output = bytearray()
+    for message in messages:
+        output += message.to_json_bytes(json_codec)
+        output += b"\n"
+    return output
+
+
+def _dump_chunk(json_codec: Optional[JsonCodec], messages: List[S2MessageComponent]) -> Tuple[int, bytearray]:
+    return len(messages), dump_ndjson(messages, json_codec=json_codec)
+
+
+def write_ndjson(
+    messages: Iterable[S2MessageComponent],
+    file: BinaryIO,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    json_codec: Optional[JsonCodec] = None,
+) -> int:
+    """Write S2 messages as newline-delimited JSON to a file opened in binary mode.
+
+    The messages are serialized in chunks of `chunk_size` messages into a buffer which is reused for every chunk, so
+    memory use is bounded by the size of a chunk.
+
+    With `workers` the chunks are serialized by a pool of worker processes. At most two chunks per worker are in
+    progress at any time and the lines are still written in the order of the messages. As the messages have to be
+    sent to the worker processes, this is only worthwhile for very large batches of large messages.
+
+    :param messages: The S2 messages, which may be of different types.
+    :param file: The file the lines are written to.
+    :param workers: The number of worker processes. None serializes all messages in the current process.
+    :param chunk_size: The number of messages which is serialized at once.
+    :param json_codec: Serialize with this JSON library. None lets pydantic-core serialize directly.
+    :raises: S2ValidationError
+    :return: The number of written messages.
+    """
+    written = 0
+    chunks = chunked(messages, chunk_size)
+    if workers is None:
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer.clear()
+            file.write(dump_ndjson(chunk, buffer, json_codec))
+            written += len(chunk)
+        return written
+
+    for count, lines in map_in_process_pool(functools.partial(_dump_chunk, json_codec), chunks, workers):
+        file.write(lines)
+        written += count
+    return written
+
+
+def read_ndjson(
+    source: Iterable[Union[str, bytes]],
+    parser: Optional[S2Parser] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> Iterator[ParsedLine]:
+    """Stream S2 messages back from newline-delimited JSON, e.g. a file written by `write_ndjson`.
+
+    :param source: The chunks of newline-delimited JSON, e.g. a file opened in binary mode.
+    :param parser: The parser with which the lines are parsed. None uses a parser with the default settings.
+    :param workers: The number of worker processes. None parses all lines in the current process.
+    :param chunk_size: The number of lines which is sent to a worker process at once.
+    :raises: ValueError if a setting of the parser is not supported. See `S2Parser.iter_parse`.
+    :return: An iterator over the parse result of each non-blank line. See `S2Parser.iter_parse`.
+    """
+    if parser is None:
+        parser = S2Parser()
+    return parser.iter_parse(source, workers=workers, chunk_size=chunk_size)
@@ -0,0 +1,120 @@
+"""Cache of parsed S2 messages keyed on the content of the message except for its message id.
+
+Resource managers resend identical system descriptions and power profile definitions after every reconnect or control
+type switch with only a new `message_id`. The cache stores the parsed message under a digest of the raw message in
+which the value of `message_id` is skipped. The cached message is a frozen copy (see `s2python.frozen`) of the parsed
+message. Both the miss which caches it and every following hit return a frozen message; a hit is a copy of the cached
+message with the new message id, of which the nested objects are shared with the cached message as they cannot be
+changed. Messages which are not cached, e.g. as they are smaller than `min_message_size`, are returned as parsed.
+"""
+
+import hashlib
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Union
+
+from s2python import frozen
+from s2python.message import S2Message
+from s2python.s2_envelope import find_value_span
+
+
+@dataclass
+class S2ParseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    message: S2Message
+    size_bytes: int
+
+
+class S2ParseCache:
+    """A least-recently-used cache of parsed S2 messages.
+
+    The size of an entry is accounted as the size of the raw message it was parsed from.
+    """
+
+    max_entries: int
+    max_bytes: int
+    min_message_size: int
+    stats: S2ParseCacheStats
+
+    _entries: "OrderedDict[bytes, _CacheEntry]"
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 16 * 1024 * 1024, min_message_size: int = 2048):
+        """Create a new parse cache.
+
+        :param max_entries: The maximum number of cached messages.
+        :param max_bytes: The maximum total size of the raw messages of all cached messages.
+        :param min_message_size: Messages smaller than this are not cached as parsing them is cheap.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.min_message_size = min_message_size
+        self.stats = S2ParseCacheStats()
+        self._entries = OrderedDict()
+
+    def parse(self, unparsed_message: Union[str, bytes], parse: Callable[[Union[str, bytes]], S2Message]) -> S2Message:
+        """Retrieve the parsed message from the cache or parse and cache it.
+
+        :param unparsed_message: The message as a JSON-formatted string or bytes.
+        :param parse: The function which parses the message on a cache miss.
+        :raises: S2ValidationError, json.JSONDecodeError (from `parse`)
+        :return: The parsed message, which is frozen if it is cached.
+        """
+        if len(unparsed_message) < self.min_message_size:
+            return parse(unparsed_message)
+
+        raw_message = unparsed_message.encode("utf-8") if isinstance(unparsed_message, str) else unparsed_message
+        message_id_span = find_value_span(raw_message, "message_id")
+        message_id = None
+        digest = hashlib.blake2b(digest_size=32)
+        if message_id_span is None:
+            digest.update(raw_message)
+        else:
+            start, end = message_id_span
+            try:
+                message_id = uuid.UUID(raw_message[start:end].decode("ascii"))
+            except (UnicodeDecodeError, ValueError):
+                return parse(unparsed_message)
+            view = memoryview(raw_message)
+            digest.update(view[:start])
+            digest.update(view[end:])
+        key = digest.digest()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            if message_id is None:
+                return entry.message.model_copy()
+            return entry.message.model_copy(update={"message_id": message_id})
+
+        self.stats.misses += 1
+        message = frozen.freeze(parse(unparsed_message))
+        self._store(key, _CacheEntry(message, len(raw_message)))
+        return message  # type: ignore[no-any-return]
+
+    def clear(self) -> None:
+        """Remove all cached messages."""
+        self._entries.clear()
+        self.stats.entries = 0
+        self.stats.size_bytes = 0
+
+    def _store(self, key: bytes, entry: _CacheEntry) -> None:
+        if entry.size_bytes > self.max_bytes or self.max_entries <= 0:
+            return
+
+        self._entries[key] = entry
+        self.stats.size_bytes += entry.size_bytes
+        while len(self._entries) > self.max_entries or self.stats.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.stats.size_bytes -= evicted.size_bytes
+            self.stats.evictions += 1
+        self.stats.entries = len(self._entries)
@@ -1,57 +1,27 @@
+import functools
 import json
 import logging
-from typing import Optional, TypeVar, Union, Type, Dict, Any
-
-from s2python.common import (
-    Handshake,
-    HandshakeResponse,
-    InstructionStatusUpdate,
-    PowerForecast,
-    PowerMeasurement,
-    ReceptionStatus,
-    ResourceManagerDetails,
-    RevokeObject,
-    SelectControlType,
-    SessionRequest,
-)
-from s2python.frbc import (
-    FRBCActuatorStatus,
-    FRBCFillLevelTargetProfile,
-    FRBCInstruction,
-    FRBCLeakageBehaviour,
-    FRBCStorageStatus,
-    FRBCSystemDescription,
-    FRBCTimerStatus,
-    FRBCUsageForecast,
-)
-from s2python.pebc import (
-    PEBCPowerConstraints,
-    PEBCEnergyConstraint,
-    PEBCInstruction,
-)
-from s2python.ppbc import (
-    PPBCScheduleInstruction,
-    PPBCEndInterruptionInstruction,
-    PPBCPowerProfileDefinition,
-    PPBCPowerProfileStatus,
-    PPBCStartInterruptionInstruction
-)
-from s2python.ombc import (
-    OMBCInstruction,
-    OMBCStatus,
-    OMBCSystemDescription,
-    OMBCTimerStatus
-)
-from s2python.ddbc import (
-    DDBCActuatorStatus,
-    DDBCAverageDemandRateForecast,
-    DDBCInstruction,
-    DDBCSystemDescription,
-    DDBCTimerStatus,
+import re
+from dataclasses import dataclass
+from typing import (
+    Optional, TypeVar, Union, Type, Dict, Any, Iterable, NoReturn, Iterator, List, Mapping, Tuple, get_args
 )
 
+from pydantic import ValidationError  # pylint: disable=no-name-in-module
+
 from s2python.message import S2Message
+from s2python.json_codec import JsonCodec, get_json_codec
+from s2python.s2_envelope import S2Envelope, scan_envelope
+from s2python.s2_lazy_message import LazyS2Object, lazy_fields_of
+from s2python.s2_message_registry import (  # pylint: disable=unused-import
+    S2MessageRegistry,
+    build_message_adapter,
+    message_type_of,
+)
+from s2python.s2_parse_cache import S2ParseCache
+from s2python.utils import chunked, map_in_process_pool
 from s2python.validate_values_mixin import S2MessageComponent
+from s2python.wire_codec import WireCodec
 from s2python.s2_validation_error import S2ValidationError
 
 
@@ -61,72 +31,305 @@ S2MessageType = str
 M = TypeVar("M", bound=S2MessageComponent)
 
 
-# May be generated with development_utilities/generate_s2_message_type_to_class.py
-TYPE_TO_MESSAGE_CLASS: Dict[str, Type[S2Message]] = {
-    'DDBC.ActuatorStatus': DDBCActuatorStatus,
-    'DDBC.AverageDemandRateForecast': DDBCAverageDemandRateForecast,
-    'DDBC.Instruction': DDBCInstruction,
-    'DDBC.SystemDescription': DDBCSystemDescription,
-    'DDBC.TimerStatus': DDBCTimerStatus,
-    'FRBC.ActuatorStatus': FRBCActuatorStatus,
-    'FRBC.FillLevelTargetProfile': FRBCFillLevelTargetProfile,
-    'FRBC.Instruction': FRBCInstruction,
-    'FRBC.LeakageBehaviour': FRBCLeakageBehaviour,
-    'FRBC.StorageStatus': FRBCStorageStatus,
-    'FRBC.SystemDescription': FRBCSystemDescription,
-    'FRBC.TimerStatus': FRBCTimerStatus,
-    'FRBC.UsageForecast': FRBCUsageForecast,
-    'Handshake': Handshake,
-    'HandshakeResponse': HandshakeResponse,
-    'InstructionStatusUpdate': InstructionStatusUpdate,
-    'OMBC.Instruction': OMBCInstruction,
-    'OMBC.Status': OMBCStatus,
-    'OMBC.SystemDescription': OMBCSystemDescription,
-    'OMBC.TimerStatus': OMBCTimerStatus,
-    'PEBC.EnergyConstraint': PEBCEnergyConstraint,
-    'PEBC.Instruction': PEBCInstruction,
-    'PEBC.PowerConstraints': PEBCPowerConstraints,
-    'PPBC.EndInterruptionInstruction': PPBCEndInterruptionInstruction,
-    'PPBC.PowerProfileDefinition': PPBCPowerProfileDefinition,
-    'PPBC.PowerProfileStatus': PPBCPowerProfileStatus,
-    'PPBC.ScheduleInstruction': PPBCScheduleInstruction,
-    'PPBC.StartInterruptionInstruction': PPBCStartInterruptionInstruction,
-    'PowerForecast': PowerForecast,
-    'PowerMeasurement': PowerMeasurement,
-    'ReceptionStatus': ReceptionStatus,
-    'ResourceManagerDetails': ResourceManagerDetails,
-    'RevokeObject': RevokeObject,
-    'SelectControlType': SelectControlType,
-    'SessionRequest': SessionRequest,
-}
+# All standard S2 messages, in order of their message type.
+DEFAULT_MESSAGE_REGISTRY = S2MessageRegistry(sorted(get_args(S2Message), key=message_type_of))
+
+# The message classes of `DEFAULT_MESSAGE_REGISTRY` by message type, including any classes registered at runtime. This
+# is a read-only view; register message classes with the registry instead.
+TYPE_TO_MESSAGE_CLASS: Mapping[str, Type[S2MessageComponent]] = DEFAULT_MESSAGE_REGISTRY
+
+
+# pydantic-core describes invalid JSON as e.g. "expected value at line 1 column 6", with the column in bytes.
+_JSON_ERROR_LOCATION = re.compile(r"(.*) at line (\d+) column (\d+)", re.DOTALL)
+
+
+def _json_decode_error(description: str, unparsed_message: Union[str, bytes]) -> json.JSONDecodeError:
+    """Create the `json.JSONDecodeError` the json module would raise from the description of a pydantic-core error.
+
+    :param description: The description of the error by pydantic-core.
+    :param unparsed_message: The invalid JSON-formatted string or bytes.
+    :return: The error with the message and (character) position of the description.
+    """
+    if isinstance(unparsed_message, bytes):
+        raw_message = unparsed_message
+        document = unparsed_message.decode("utf-8", errors="replace")
+    else:
+        raw_message = unparsed_message.encode("utf-8", errors="surrogatepass")
+        document = unparsed_message
+
+    location = _JSON_ERROR_LOCATION.fullmatch(description)
+    if location is None:
+        return json.JSONDecodeError(description, document, 0)
+    line_start = 0
+    for _ in range(int(location.group(2)) - 1):
+        line_start = raw_message.find(b"\n", line_start) + 1
+    byte_position = min(line_start + int(location.group(3)) - 1, len(raw_message))
+    position = len(raw_message[:byte_position].decode("utf-8", errors="replace"))
+    return json.JSONDecodeError(location.group(1), document, position)
+
+
+def _raise_from_validation_error(
+    error: ValidationError,
+    unparsed_message: Union[dict[Any, Any], str, bytes],
+    message_class: Optional[Type[S2MessageComponent]] = None,
+    registry: S2MessageRegistry = DEFAULT_MESSAGE_REGISTRY,
+) -> NoReturn:
+    """Convert a pydantic validation error into the exceptions the parser has always raised.
+
+    Invalid JSON still results in a `json.JSONDecodeError` and all other errors in an `S2ValidationError`.
+    """
+    first_error = error.errors(include_url=False, include_input=False)[0]
+
+    if first_error["type"] == "json_invalid" and isinstance(unparsed_message, (str, bytes)):
+        description = first_error.get("ctx", {}).get("error", first_error["msg"])
+        raise _json_decode_error(description, unparsed_message) from error
+
+    if first_error["type"] in ("union_tag_invalid", "union_tag_not_found"):
+        message_type = first_error.get("ctx", {}).get("tag")
+        raise S2ValidationError(
+            None,
+            unparsed_message,
+            f"Unable to parse {message_type} as an S2 message. Type unknown.",
+        ) from error
+
+    if message_class is None and first_error["loc"]:
+        message_class = registry.message_class(str(first_error["loc"][0]))
+
+    raise S2ValidationError(
+        message_class, unparsed_message, "Pydantic raised a validation error."
+    ) from error
+
+
+@dataclass(frozen=True)
+class ParsedLine:
+    """The result of parsing a single line of newline-delimited JSON.
+
+    Exactly one of `message` and `error` is set.
+    """
+
+    line_number: int
+    message: Union[S2Message, LazyS2Object, None] = None
+    error: Optional[Exception] = None
+
+
+def iter_lines(source: Iterable[Union[str, bytes]]) -> Iterator[Tuple[int, Union[str, bytes]]]:
+    """Split a stream of chunks into lines with their (1-based) line number.
+
+    The chunks may be lines themselves, e.g. when iterating over a file, or arbitrary parts of the stream. Only a
+    single incomplete line is kept in memory. Blank lines are skipped but do count towards the line number.
+
+    :param source: The chunks of text or bytes.
+    :return: An iterator over the line numbers and lines without the line separator.
+    """
+    pending: List[Any] = []
+    line_number = 0
+    for chunk in source:
+        newline: Any = b"\n" if isinstance(chunk, bytes) else "\n"
+        start = 0
+        end = chunk.find(newline)
+        while end != -1:
+            line = chunk[start:end]
+            if pending:
+                pending.append(line)
+                line = line[:0].join(pending)
+                pending = []
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+            start = end + 1
+            end = chunk.find(newline, start)
+        if start < len(chunk):
+            pending.append(chunk[start:])
+
+    if pending:
+        line = pending[0][:0].join(pending)
+        if line.strip():
+            yield line_number + 1, line
+
+
+_WORKER_REGISTRIES: Dict[Tuple[Type[S2MessageComponent], ...], S2MessageRegistry] = {}
+
+
+def _registry_for(message_classes: Tuple[Type[S2MessageComponent], ...]) -> S2MessageRegistry:
+    # Registries are not picklable, so worker processes rebuild them once from the (picklable) message classes.
+    if message_classes == DEFAULT_MESSAGE_REGISTRY.message_classes():
+        return DEFAULT_MESSAGE_REGISTRY
+    registry = _WORKER_REGISTRIES.get(message_classes)
+    if registry is None:
+        registry = S2MessageRegistry(message_classes)
+        _WORKER_REGISTRIES[message_classes] = registry
+    return registry
+
+
+def _parse_chunk(parser: "S2Parser", lines: List[Tuple[int, Union[str, bytes]]]) -> List[ParsedLine]:
+    parsed_lines = []
+    for line_number, line in lines:
+        try:
+            parsed_lines.append(ParsedLine(line_number, message=parser.parse(line)))
+        except (S2ValidationError, json.JSONDecodeError) as e:
+            parsed_lines.append(ParsedLine(line_number, error=e))
+    return parsed_lines
+
+
+def _parse_lines(
+    trusted: bool,
+    json_codec: Optional[JsonCodec],
+    message_classes: Tuple[Type[S2MessageComponent], ...],
+    lines: List[Tuple[int, Union[str, bytes]]],
+) -> List[ParsedLine]:
+    # Runs in a worker process, which rebuilds (and keeps) the registry instead of receiving it with every chunk.
+    parser = S2Parser(trusted=trusted, json_codec=json_codec, registry=_registry_for(message_classes))
+    return _parse_chunk(parser, lines)
 
 
 class S2Parser:
-    @staticmethod
-    def _parse_json_if_required(unparsed_message: Union[dict[Any, Any], str, bytes]) -> dict:
-        if isinstance(unparsed_message, (str, bytes)):
-            return json.loads(unparsed_message)
-        return unparsed_message
+    trusted: bool
+    cache: Optional[S2ParseCache]
+    json_codec: Optional[JsonCodec]
+    lazy: bool
+    registry: S2MessageRegistry
+    wire_codec: Optional[WireCodec]
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        trusted: bool = False,
+        cache: Optional[S2ParseCache] = None,
+        json_codec: Optional[JsonCodec] = None,
+        lazy: bool = False,
+        registry: Optional[S2MessageRegistry] = None,
+        wire_codec: Optional[WireCodec] = None,
+    ) -> None:
+        """Create a parser.
+
+        :param trusted: Skip all model validators when parsing messages. Only use this if the other party is known to
+                        send valid messages. See `parse_as_any_message_trusted`.
+        :param cache: Reuse the parsed message for messages which only differ in their message id. Messages which are
+                      cached are returned frozen, also when they are parsed the first time. See `S2ParseCache`.
+        :param json_codec: Decode JSON-formatted messages with this JSON library before validating them. None lets
+                           pydantic-core parse the JSON itself, which is the fastest option.
+        :param lazy: Return proxies which only validate nested lists when they are accessed. The `trusted` and `cache`
+                     settings do not apply to lazy parsing. See `parse_as_any_message_lazy`.
+        :param registry: The message classes which may be parsed. None uses `DEFAULT_MESSAGE_REGISTRY` with all
+                         standard S2 messages.
+        :param wire_codec: Decode messages from this binary format (e.g. MessagePack) instead of JSON before
+                           validating them. The `cache` and `json_codec` settings do not apply to such messages. See
+                           `s2python.wire_codec`.
+        """
+        self.trusted = trusted
+        self.cache = cache
+        self.json_codec = json_codec
+        self.lazy = lazy
+        self.registry = DEFAULT_MESSAGE_REGISTRY if registry is None else registry
+        self.wire_codec = wire_codec
+
+    def parse(self, unparsed_message: Union[dict[Any, Any], str, bytes]) -> Union[S2Message, LazyS2Object]:
+        """Parse the message as any S2 python message according to the settings of this parser.
+
+        :param unparsed_message: The message as a JSON-formatted string or bytes, as bytes encoded with the wire codec
+                                 of this parser or as a json-parsed dictionary.
+        :raises: S2ValidationError, json.JSONDecodeError
+        :return: The parsed S2 message if no errors were found, or a proxy of it if `lazy` is set.
+        """
+        if self.wire_codec is not None and isinstance(unparsed_message, (str, bytes)):
+            unparsed_message = self.wire_codec.decode(unparsed_message)
+        if self.lazy:
+            return S2Parser.parse_as_any_message_lazy(unparsed_message, self.json_codec, self.registry)
+        if self.cache is not None and isinstance(unparsed_message, (str, bytes)):
+            return self.cache.parse(unparsed_message, self._parse_uncached)
+        return self._parse_uncached(unparsed_message)
+
+    def _parse_uncached(self, unparsed_message: Union[dict[Any, Any], str, bytes]) -> S2Message:
+        if self.json_codec is not None and isinstance(unparsed_message, (str, bytes)):
+            unparsed_message = self.json_codec.loads(unparsed_message)
+        if self.trusted:
+            return S2Parser.parse_as_any_message_trusted(unparsed_message, self.registry)
+        return S2Parser.parse_as_any_message(unparsed_message, self.registry)
 
     @staticmethod
-    def parse_as_any_message(unparsed_message: Union[dict[Any, Any], str, bytes]) -> S2Message:
+    def parse_as_any_message(
+        unparsed_message: Union[dict[Any, Any], str, bytes], registry: Optional[S2MessageRegistry] = None
+    ) -> S2Message:
         """Parse the message as any S2 python message regardless of message type.
 
-        :param unparsed_message: The message as a JSON-formatted string or as a json-parsed dictionary.
+        JSON-formatted strings and bytes are validated in a single pass by the compiled adapter of the registry
+        without first decoding them into a Python dictionary.
+
+        :param unparsed_message: The message as a JSON-formatted string, as JSON-formatted bytes as received from the
+                                 websocket or as a json-parsed dictionary.
+        :param registry: The message classes which may be parsed. None uses `DEFAULT_MESSAGE_REGISTRY`.
         :raises: S2ValidationError, json.JSONDecodeError
         :return: The parsed S2 message if no errors were found.
         """
-        message_json = S2Parser._parse_json_if_required(unparsed_message)
-        message_type = S2Parser.parse_message_type(message_json)
+        if registry is None:
+            registry = DEFAULT_MESSAGE_REGISTRY
+        try:
+            if isinstance(unparsed_message, (str, bytes)):
+                return registry.adapter.validate_json(unparsed_message)
+            return registry.adapter.validate_python(unparsed_message)
+        except ValidationError as e:
+            _raise_from_validation_error(e, unparsed_message, registry=registry)
+
+    @staticmethod
+    def parse_as_any_message_trusted(
+        unparsed_message: Union[dict[Any, Any], str, bytes], registry: Optional[S2MessageRegistry] = None
+    ) -> S2Message:
+        """Parse the message as any S2 python message without running any of the model validators.
+
+        The message is still built into the correct nested S2 classes, UUIDs, enums and datetimes but consistency
+        checks such as unique ids or references between timers, transitions and operation modes are skipped. Only use
+        this for messages from a trusted peer.
+
+        :param unparsed_message: The message as a JSON-formatted string or bytes or as a json-parsed dictionary.
+        :param registry: The message classes which may be parsed. None uses `DEFAULT_MESSAGE_REGISTRY`.
+        :raises: S2ValidationError, json.JSONDecodeError
+        :return: The parsed S2 message if no type errors were found.
+        """
+        if registry is None:
+            registry = DEFAULT_MESSAGE_REGISTRY
+        try:
+            if isinstance(unparsed_message, (str, bytes)):
+                return registry.trusted_validator.validate_json(unparsed_message)
+            return registry.trusted_validator.validate_python(unparsed_message)
+        except ValidationError as e:
+            _raise_from_validation_error(e, unparsed_message, registry=registry)
+
+    @staticmethod
+    def parse_as_any_message_lazy(
+        unparsed_message: Union[dict[Any, Any], str, bytes],
+        json_codec: Optional[JsonCodec] = None,
+        registry: Optional[S2MessageRegistry] = None,
+    ) -> Union[S2Message, LazyS2Object]:
+        """Parse the message as a proxy which validates the lists of nested S2 objects only when they are accessed.
+
+        All other fields of the message are validated immediately. Model validators are only run by calling
+        `validate_fully()` on the proxy, which returns the fully validated S2 message. Messages without lists of
+        nested S2 objects are validated fully right away. See `s2python.s2_lazy_message`.
+
+        :param unparsed_message: The message as a JSON-formatted string or bytes or as a json-parsed dictionary.
+        :param json_codec: The JSON library to decode JSON-formatted messages with. None uses the default codec.
+        :param registry: The message classes which may be parsed. None uses `DEFAULT_MESSAGE_REGISTRY`.
+        :raises: S2ValidationError, json.JSONDecodeError
+        :return: The lazily validated S2 message, or the S2 message if it has no lists of nested S2 objects.
+        """
+        if registry is None:
+            registry = DEFAULT_MESSAGE_REGISTRY
+        if isinstance(unparsed_message, (str, bytes)):
+            message_json = (json_codec or get_json_codec()).loads(unparsed_message)
+        else:
+            message_json = unparsed_message
 
-        if message_type not in TYPE_TO_MESSAGE_CLASS:
+        message_type = message_json.get("message_type") if isinstance(message_json, dict) else None
+        message_class = registry.message_class(message_type)
+        if message_class is None:
             raise S2ValidationError(
                 None,
-                message_json,
+                unparsed_message,
                 f"Unable to parse {message_type} as an S2 message. Type unknown.",
             )
-
-        return TYPE_TO_MESSAGE_CLASS[message_type].from_dict(message_json)
+        if not lazy_fields_of(message_class):
+            return S2Parser.parse_as_any_message(message_json, registry)
+        return LazyS2Object(message_class, message_json)
 
     @staticmethod
     def parse_as_message(
@@ -139,8 +342,16 @@ class S2Parser:
         :raises: S2ValidationError, json.JSONDecodeError
         :return: The parsed S2 message if no errors were found.
         """
-        message_json = S2Parser._parse_json_if_required(unparsed_message)
-        return as_message.from_dict(message_json)
+        try:
+            if isinstance(unparsed_message, (str, bytes)):
+                return as_message.model_validate_json(unparsed_message)
+            return as_message.model_validate(unparsed_message)
+        except ValidationError as e:
+            _raise_from_validation_error(e, unparsed_message, as_message)
+        except TypeError as e:
+            raise S2ValidationError(
+                as_message, unparsed_message, "Pydantic raised a validation error."
+            ) from e
 
     @staticmethod
     def parse_message_type(
@@ -151,10 +362,73 @@ class S2Parser:
         This is useful to call before `parse_as_message` to retrieve the message type and allows for strictly-typed
         parsing.
 
+        The message is decoded (but not validated) to check that it is valid JSON. Use `parse_envelope` to only scan
+        the message type without decoding the whole message.
+
         :param unparsed_message: The message as a JSON-formatted string or as a JSON-parsed dictionary.
         :raises: json.JSONDecodeError
         :return: The parsed S2 message type if no errors were found.
         """
-        message_json = S2Parser._parse_json_if_required(unparsed_message)
+        if isinstance(unparsed_message, (str, bytes)):
+            message_json = get_json_codec().loads(unparsed_message)
+        else:
+            message_json = unparsed_message
+
+        return message_json.get("message_type") if isinstance(message_json, dict) else None
+
+    @staticmethod
+    def parse_envelope(unparsed_message: Union[dict[Any, Any], str, bytes]) -> S2Envelope:
+        """Parse only the message type, message id and subject message id from the unparsed message.
+
+        This is useful for routing and filtering messages or replying to messages which could not be parsed.
+
+        :param unparsed_message: The message as a JSON-formatted string or as a JSON-parsed dictionary.
+        :return: The envelope of the message.
+        """
+        return scan_envelope(unparsed_message)
+
+    def iter_parse(
+        self,
+        source: Iterable[Union[str, bytes]],
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[ParsedLine]:
+        """Parse a stream of newline-delimited JSON S2 messages, e.g. an archive of received frames.
+
+        The source may be a file (opened in text or binary mode) or any iterator of str or bytes chunks. Lines which
+        cannot be parsed do not stop the iteration but result in a `ParsedLine` with the error. Memory use is bounded
+        by the chunks which are being parsed.
+
+        Each line is parsed according to the settings of this parser, as by `parse`. A `wire_codec` is not supported,
+        as the lines are JSON by definition.
+
+        With `workers` the lines are parsed in chunks of `chunk_size` lines by a pool of worker processes. At most two
+        chunks per worker are in progress at any time and the results are still yielded in the order of the source.
+        The worker processes apply the `trusted`, `json_codec` and `registry` settings. A `cache` or `lazy` parsing
+        is not supported with workers, as the cache and the lazily validated messages only exist in a single process.
+
+        :param source: The chunks of newline-delimited JSON.
+        :param workers: The number of worker processes. None parses all lines in the current process.
+        :param chunk_size: The number of lines which is sent to a worker process at once.
+        :raises: ValueError if a setting of this parser is not supported.
+        :return: An iterator over the parse result of each non-blank line.
+        """
+        if self.wire_codec is not None:
+            raise ValueError("Newline-delimited JSON cannot be parsed with a wire codec.")
+        if workers is not None and (self.cache is not None or self.lazy):
+            raise ValueError("Newline-delimited JSON cannot be parsed with a cache or lazily by worker processes.")
+        return self._iter_parse(source, workers, chunk_size)
 
-        return message_json.get("message_type")
+    def _iter_parse(
+        self, source: Iterable[Union[str, bytes]], workers: Optional[int], chunk_size: int
+    ) -> Iterator[ParsedLine]:
+        chunks = chunked(iter_lines(source), chunk_size)
+        if workers is None:
+            for chunk in chunks:
+                yield from _parse_chunk(self, chunk)
+        else:
+            parse_chunk = functools.partial(
+                _parse_lines, self.trusted, self.json_codec, self.registry.message_classes()
+            )
+            for parsed_lines in map_in_process_pool(parse_chunk, chunks, workers):
+                yield from parsed_lines
@@ -0,0 +1,144 @@
+"""Suppress sending messages which did not change (much) since the last one of the same type was sent.
+
+Resource managers typically recompute forecasts such as `PowerForecast`, `FRBCUsageForecast` and
+`DDBCAverageDemandRateForecast` every few seconds while the numbers barely move. `S2Publisher` compares each candidate
+message with the last message of the same type which was sent and only sends it if a value changed more than its
+`ChangeTolerance` allows. A message is always sent again after the refresh interval of its tolerance and after the
+connection is (re)established, as the other party may have lost its state.
+
+Message types without a tolerance are always sent.
+"""
+
+import datetime
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel, RootModel  # pylint: disable=no-name-in-module
+
+from s2python.message import S2Message
+
+
+@dataclass(frozen=True)
+class ChangeTolerance:
+    """How much a message may differ from the last one sent before it is considered changed.
+
+    Float fields are compared by their absolute difference, `Duration` fields by their difference in milliseconds and
+    datetime fields (e.g. `start_time`) by their difference in time. All other fields must be equal. The `message_id`
+    is never compared.
+    """
+
+    value: float = 0.0
+    """The tolerance of every float field which is not listed in `fields`."""
+    fields: Mapping[str, float] = field(default_factory=dict)
+    """The tolerance of float fields by field name, e.g. `{"usage_rate_expected": 0.5}`."""
+    duration_ms: int = 0
+    """The tolerance of `Duration` fields in milliseconds."""
+    time_shift: datetime.timedelta = datetime.timedelta(0)
+    """The tolerance of datetime fields, e.g. how far the start of a forecast may move."""
+    refresh_interval: Optional[float] = None
+    """Send the message anyway if the last one was sent at least this many seconds ago. None never refreshes."""
+
+    def is_within(self, candidate: BaseModel, previous: Dict[str, Any]) -> bool:
+        """Check whether a message only differs from a previous message within this tolerance.
+
+        :param candidate: The message which may be sent.
+        :param previous: The previous message as dumped by `model_dump()`.
+        :return: True if the candidate does not differ more than the tolerance allows.
+        """
+        for name in type(candidate).model_fields:
+            if name == "message_id":
+                continue
+            if name not in previous or not self._value_is_within(name, getattr(candidate, name), previous[name]):
+                return False
+        return True
+
+    def _value_is_within(  # pylint: disable=too-many-return-statements
+        self, name: str, candidate: Any, previous: Any
+    ) -> bool:
+        if isinstance(candidate, RootModel):
+            if isinstance(candidate.root, int) and not isinstance(candidate.root, bool):
+                # Durations, which are dumped as their number of milliseconds.
+                return isinstance(previous, int) and abs(candidate.root - previous) <= self.duration_ms
+            return bool(candidate.root == previous)
+        if isinstance(candidate, BaseModel):
+            return isinstance(previous, dict) and self.is_within(candidate, previous)
+        if isinstance(candidate, list):
+            return (
+                isinstance(previous, list)
+                and len(candidate) == len(previous)
+                and all(self._value_is_within(name, item, prev) for item, prev in zip(candidate, previous))
+            )
+        if isinstance(candidate, float):
+            return isinstance(previous, float) and abs(candidate - previous) <= self.fields.get(name, self.value)
+        if isinstance(candidate, datetime.datetime):
+            return isinstance(previous, datetime.datetime) and abs(candidate - previous) <= self.time_shift
+        return bool(candidate == previous)
+
+
+class S2Publisher:
+    """Keeps track of the last sent message per type to decide whether a new message has to be sent.
+
+    Used by `S2Connection.publish_msg_sync`, which sends a message only if `is_changed` and records it afterwards.
+    """
+
+    tolerances: Dict[Type[S2Message], ChangeTolerance]
+
+    _last_sent: Dict[Type[S2Message], Tuple[Dict[str, Any], float]]
+    _clock: Callable[[], float]
+
+    def __init__(
+        self,
+        tolerances: Optional[Mapping[Type[S2Message], ChangeTolerance]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a new publisher.
+
+        :param tolerances: The tolerance per message class. Messages of other classes are always sent.
+        :param clock: The (monotonic) clock in seconds.
+        """
+        self.tolerances = dict(tolerances or {})
+        self._last_sent = {}
+        self._clock = clock
+
+    def set_tolerance(self, msg_type: Type[S2Message], tolerance: Optional[ChangeTolerance]) -> None:
+        """Set or remove the tolerance of a message class.
+
+        :param msg_type: The message class, e.g. `PowerForecast`.
+        :param tolerance: The tolerance. None always sends messages of this class.
+        """
+        if tolerance is None:
+            self.tolerances.pop(msg_type, None)
+            self._last_sent.pop(msg_type, None)
+        else:
+            self.tolerances[msg_type] = tolerance
+
+    def reset(self) -> None:
+        """Forget all sent messages so the next message of every type is sent."""
+        self._last_sent.clear()
+
+    def is_changed(self, s2_msg: S2Message) -> bool:
+        """Check whether a message has to be sent.
+
+        :param s2_msg: The message which may be sent.
+        :return: False if the message does not differ from the last sent message of its type more than its tolerance
+                 allows and the refresh interval did not pass yet. True otherwise.
+        """
+        tolerance = self.tolerances.get(type(s2_msg))
+        last_sent = self._last_sent.get(type(s2_msg))
+        if tolerance is None or last_sent is None:
+            return True
+
+        previous, sent_at = last_sent
+        if tolerance.refresh_interval is not None and self._clock() - sent_at >= tolerance.refresh_interval:
+            return True
+        return not tolerance.is_within(s2_msg, previous)
+
+    def record_sent(self, s2_msg: S2Message) -> None:
+        """Remember a message which was sent (and accepted) as the last one of its type.
+
+        :param s2_msg: The sent message.
+        """
+        if type(s2_msg) in self.tolerances:
+            # Dumped, so later changes to the message object itself do not affect the comparison.
+            self._last_sent[type(s2_msg)] = (s2_msg.model_dump(), self._clock())
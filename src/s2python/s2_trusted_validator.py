@@ -0,0 +1,85 @@
+"""Validators for S2 messages from a trusted peer which skip all Python validator functions.
+
+The S2 classes carry a number of `model_validator`s which check the consistency of a message, e.g. whether the
+timers referenced in a transition exist. When both ends of a connection run audited software these checks are
+redundant. A trusted validator is compiled from the same pydantic core schema as the normal validator, but with every
+validator function removed. The message is still built into the correct nested S2 classes, UUIDs, enums and
+datetimes by pydantic-core, while none of the Python validators are executed.
+
+pydantic-core reuses the already compiled validator of a (complete) model class whenever it encounters that class in
+a schema, which would bring all validator functions back. The trusted validator is therefore compiled with
+`_use_prebuilt=False` (supported since pydantic-core 2.42, i.e. pydantic 2.13), so the model classes themselves are
+left untouched. The version of pydantic-core is checked once, on import. Versions before 2.33 (pydantic 2.10 and
+older) never reuse compiled validators. With pydantic 2.11 and 2.12 the compiled validators are reused and cannot be
+avoided without changing the model classes, so there `SKIPS_VALIDATOR_FUNCTIONS` is False: the trusted validators
+may still run the validator functions of the model classes and lazy messages (see `s2python.s2_lazy_message`) are
+validated fully right away. That is slower, but never accepts a message which the normal validator rejects.
+
+Constructing the message tree in Python (e.g. recursively through `model_construct`) is several times slower than
+letting pydantic-core build it, so the trusted path is derived from the core schema instead.
+"""
+
+import re
+from typing import Any, Dict, Type
+
+import pydantic_core
+from pydantic import BaseModel
+from pydantic_core import CoreSchema, SchemaValidator
+
+VALIDATOR_FUNCTION_SCHEMA_TYPES = ("function-after", "function-before", "function-wrap")
+
+_TRUSTED_VALIDATORS: Dict[Type[BaseModel], SchemaValidator] = {}
+
+_PYDANTIC_CORE_VERSION = tuple(int(part) for part in re.findall(r"\d+", pydantic_core.__version__)[:2])
+# Whether compiled validators can be told not to reuse the compiled validators of the model classes.
+SUPPORTS_USE_PREBUILT = _PYDANTIC_CORE_VERSION >= (2, 42)
+# Whether the trusted validators skip all validator functions, also those of the nested objects.
+SKIPS_VALIDATOR_FUNCTIONS = SUPPORTS_USE_PREBUILT or _PYDANTIC_CORE_VERSION < (2, 33)
+
+
+def strip_validator_functions(schema: Any) -> Any:
+    """Return a copy of the core schema with all before, after and wrap validator functions removed.
+
+    :param schema: The pydantic core schema (or any part of it).
+    :return: The core schema without validator functions.
+    """
+    if isinstance(schema, dict):
+        if schema.get("type") in VALIDATOR_FUNCTION_SCHEMA_TYPES:
+            stripped_schema = strip_validator_functions(schema["schema"])
+            # Definitions may refer to the validator function schema, so the schema within takes over its reference.
+            if "ref" in schema and "ref" not in stripped_schema:
+                stripped_schema = {**stripped_schema, "ref": schema["ref"]}
+            return stripped_schema
+        return {
+            key: value if key == "serialization" else strip_validator_functions(value)
+            for key, value in schema.items()
+        }
+    if isinstance(schema, list):
+        return [strip_validator_functions(item) for item in schema]
+    return schema
+
+
+def build_trusted_validator(schema: CoreSchema) -> SchemaValidator:
+    """Compile a validator for the core schema which does not run any validator functions.
+
+    :param schema: The pydantic core schema of a model or type adapter.
+    :return: The compiled trusted validator.
+    """
+    trusted_schema = strip_validator_functions(schema)
+    if SUPPORTS_USE_PREBUILT:
+        return SchemaValidator(trusted_schema, _use_prebuilt=False)  # type: ignore[call-arg,unused-ignore]
+    return SchemaValidator(trusted_schema)
+
+
+def trusted_validator_for(model_class: Type[BaseModel]) -> SchemaValidator:
+    """Retrieve the (cached) trusted validator for a pydantic model class.
+
+    :param model_class: The pydantic model class.
+    :return: The compiled trusted validator.
+    """
+    validator = _TRUSTED_VALIDATORS.get(model_class)
+    if validator is None:
+        validator = _TRUSTED_VALIDATORS.setdefault(
+            model_class, build_trusted_validator(model_class.__pydantic_core_schema__)
+        )
+    return validator
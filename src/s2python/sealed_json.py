@@ -0,0 +1,163 @@
+"""Serialize-once caching of the JSON of S2 messages which are sent repeatedly.
+
+Messages such as `FRBCSystemDescription` are sent again verbatim after every reconnect, often to several CEMs. A sealed
+message keeps its serialized JSON and only splices in its current `message_id`, so it can be resent with a new message
+id without serializing the whole message tree again.
+
+The cache is invalidated when the sealed message, or any S2 object nested in it at the time it was sealed, is changed
+through (validated) assignment, e.g. `actuator.id = ...`. Only the seals which contain the changed object are
+invalidated. Assigning a new `message_id` to the sealed message itself
+keeps the cache. Changes which bypass assignment, such as appending to a list in place, are not detected; unseal the
+message or seal it again after such changes.
+
+The seals are kept in module-level tables keyed by object identity instead of as pydantic private attributes, which
+would slow down the construction of every S2 object.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set
+
+from pydantic import BaseModel  # pylint: disable=no-name-in-module
+
+_MESSAGE_ID_KEY = b'"message_id":"'
+
+
+@dataclass
+class _Seal:
+    # The `id()` of the sealed object and of every S2 object nested in it.
+    member_ids: Set[int]
+    stale: bool = False
+    message_id: Optional[str] = None
+    # None while the object is being serialized.
+    body: Optional[bytes] = None
+    prefix: Optional[bytes] = None
+    suffix: bytes = b""
+
+
+_SEALS: Dict[int, _Seal] = {}
+# The `id()` of the sealed objects which contain an S2 object, by the `id()` of that object.
+_CONTAINING_SEALS: Dict[int, Set[int]] = {}
+# Guards both tables. Reentrant, as a finalizer may run (on garbage collection) while the lock is held.
+_SEALS_LOCK = threading.RLock()
+
+
+def _message_id_of(model: BaseModel) -> Optional[str]:
+    message_id = model.__dict__.get("message_id")
+    return None if message_id is None else str(message_id)
+
+
+def _collect_members(value: Any, member_ids: Set[int]) -> None:
+    if isinstance(value, BaseModel):
+        member_ids.add(id(value))
+        for item in value.__dict__.values():
+            _collect_members(item, member_ids)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect_members(item, member_ids)
+
+
+def _remove_memberships(model_id: int, sealed: _Seal) -> None:
+    for member_id in sealed.member_ids:
+        containing_seals = _CONTAINING_SEALS.get(member_id)
+        if containing_seals is not None:
+            containing_seals.discard(model_id)
+            if not containing_seals:
+                _CONTAINING_SEALS.pop(member_id, None)
+
+
+def _forget_seal(model_id: int) -> None:
+    with _SEALS_LOCK:
+        sealed = _SEALS.pop(model_id, None)
+        if sealed is not None:
+            _remove_memberships(model_id, sealed)
+
+
+def _build_seal(model: BaseModel) -> bytes:
+    member_ids: Set[int] = set()
+    _collect_members(model, member_ids)
+    sealed = _Seal(member_ids)
+    model_id = id(model)
+    # The seal is registered before the object is serialized, so that any assignment from now on marks it stale.
+    with _SEALS_LOCK:
+        previous_seal = _SEALS.get(model_id)
+        if previous_seal is not None:
+            _remove_memberships(model_id, previous_seal)
+        _SEALS[model_id] = sealed
+        for member_id in member_ids:
+            _CONTAINING_SEALS.setdefault(member_id, set()).add(model_id)
+
+    message_id = _message_id_of(model)
+    body = model.__pydantic_serializer__.to_json(model, by_alias=True, exclude_none=True)
+    if message_id is not None:
+        needle = _MESSAGE_ID_KEY + message_id.encode("ascii") + b'"'
+        if body.count(needle) == 1:
+            start = body.index(needle) + len(_MESSAGE_ID_KEY)
+            sealed.prefix = body[:start]
+            sealed.suffix = body[start + len(message_id):]
+    sealed.message_id = message_id
+    sealed.body = body
+    return body
+
+
+def seal(model: BaseModel) -> None:
+    """Serialize an S2 object once and keep the JSON until the object is changed.
+
+    :param model: The S2 message or message component.
+    """
+    if id(model) not in _SEALS:
+        weakref.finalize(model, _forget_seal, id(model))
+    _build_seal(model)
+
+
+def unseal(model: BaseModel) -> None:
+    """Drop the cached JSON of an S2 object.
+
+    :param model: The S2 message or message component.
+    """
+    _forget_seal(id(model))
+
+
+def is_sealed(model: BaseModel) -> bool:
+    """Check whether an S2 object is sealed.
+
+    :param model: The S2 message or message component.
+    :return: True if the object is sealed, even if its cached JSON was invalidated and has to be rebuilt.
+    """
+    return id(model) in _SEALS
+
+
+def sealed_json_bytes(model: BaseModel) -> Optional[bytes]:
+    """Retrieve the JSON of a sealed S2 object with its current message id.
+
+    :param model: The S2 message or message component.
+    :return: The UTF-8 encoded JSON or None if the object is not sealed.
+    """
+    sealed = _SEALS.get(id(model))
+    if sealed is None:
+        return None
+    if sealed.stale or sealed.body is None:
+        return _build_seal(model)
+
+    message_id = _message_id_of(model)
+    if message_id == sealed.message_id:
+        return sealed.body
+    if sealed.prefix is None or message_id is None:
+        return model.__pydantic_serializer__.to_json(model, by_alias=True, exclude_none=True)
+    return sealed.prefix + message_id.encode("ascii") + sealed.suffix
+
+
+def notify_assignment(model: BaseModel, name: str) -> None:
+    """Invalidate the cached JSON of the sealed objects which contain an S2 object that was assigned to.
+
+    :param model: The S2 object which was assigned to.
+    :param name: The name of the assigned field.
+    """
+    if name == "message_id":
+        return
+    with _SEALS_LOCK:
+        for seal_id in tuple(_CONTAINING_SEALS.get(id(model), ())):
+            sealed = _SEALS.get(seal_id)
+            if sealed is not None:
+                sealed.stale = True
@@ -1,8 +1,47 @@
-from typing import Generator, Tuple, List, TypeVar
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Deque, Generator, Iterable, Iterator, Tuple, List, TypeVar
 
 P = TypeVar("P")
+R = TypeVar("R")
 
 
 def pairwise(arr: List[P]) -> Generator[Tuple[P, P], None, None]:
     for i in range(max(len(arr) - 1, 0)):
         yield arr[i], arr[i + 1]
+
+
+def chunked(items: Iterable[P], chunk_size: int) -> Iterator[List[P]]:
+    """Split an iterable into lists of `chunk_size` items. The last list may be shorter."""
+    chunk: List[P] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def map_in_process_pool(function: Callable[[P], R], items: Iterable[P], workers: int) -> Iterator[R]:
+    """Apply a function to each item in a pool of worker processes and yield the results in the order of the items.
+
+    At most two items per worker are in progress at any time, so memory use stays bounded for long iterables. The
+    function and the items must be picklable.
+
+    :param function: The function, e.g. a module-level function or a `functools.partial` of one.
+    :param items: The items, e.g. chunks from `chunked`.
+    :param workers: The number of worker processes.
+    :return: An iterator over the results.
+    """
+    in_progress: Deque["Future[R]"] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for item in items:
+            in_progress.append(executor.submit(function, item))
+            if len(in_progress) >= 2 * workers:
+                yield in_progress.popleft().result()
+        while in_progress:
+            yield in_progress.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,4 +1,9 @@
 from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    ContextManager,
+    Iterable,
+    Iterator,
     TypeVar,
     Type,
     Callable,
@@ -8,6 +13,7 @@ from typing import (
     Mapping,
     List,
     Dict,
+    Optional,
 )
 
 from typing_extensions import Self
@@ -16,36 +22,219 @@ from pydantic import (  # pylint: disable=no-name-in-module
     BaseModel,
     ValidationError,
 )
+from pydantic_core import PydanticSerializationError
 
+from s2python.canonical_json import canonical_json, content_hash
+from s2python.deferred_validation import assign_deferred, defer_validation
+from s2python.json_codec import JsonCodec
+from s2python.s2_trusted_validator import trusted_validator_for
+from s2python import frozen, reference_index, sealed_json
 from s2python.s2_validation_error import S2ValidationError
 
+if TYPE_CHECKING:
+    from s2python.s2_parser import ParsedLine
+
 
 IntStr = Union[int, str]
 AbstractSetIntStr = AbstractSet[IntStr]
 MappingIntStrAny = Mapping[IntStr, Any]
 
 
-class S2MessageComponent(BaseModel):
+class S2MessageComponent(BaseModel):  # pylint: disable=too-many-public-methods
     def __setattr__(self, name: str, value: Any) -> None:
+        if name in reference_index.REFERENCE_FIELDS:
+            # Invalidated before the assignment is validated, as the model validators may use the reference index.
+            reference_index.notify_assignment(self)
+        if assign_deferred(self, name, value):
+            return
         try:
             super().__setattr__(name, value)
         except (ValidationError, TypeError) as e:
             raise S2ValidationError(
                 type(self), self, "Pydantic raised a validation error.",
             ) from e
+        sealed_json.notify_assignment(self, name)
+
+    def deferred_validation(self) -> ContextManager[Self]:
+        """Defer the validation of assignments to the S2 message or message component until the end of the context.
+
+        The assignments are stored without validation and the whole object (including its model validators) is
+        validated once on exit. If it is invalid, the assigned fields are restored. See `s2python.deferred_validation`.
+
+        :raises: S2ValidationError on exit if the object is invalid after the assignments.
+        :return: The context manager, which yields the object itself.
+        """
+        return defer_validation(self)
+
+    def seal(self) -> Self:
+        """Serialize the S2 message or message component once and reuse the json until it is changed.
+
+        `to_json` and `to_json_bytes` (without a json codec) then return the cached json with the current
+        `message_id` spliced in. See `s2python.sealed_json` for which changes invalidate the cache.
+
+        :return: The S2 message or message component itself.
+        """
+        sealed_json.seal(self)
+        return self
+
+    def unseal(self) -> None:
+        """Drop the json which was cached by `seal`."""
+        sealed_json.unseal(self)
+
+    @property
+    def is_sealed(self) -> bool:
+        """Whether the json of the S2 message or message component is cached by `seal`."""
+        return sealed_json.is_sealed(self)
 
-    def to_json(self) -> str:
+    def frozen(self) -> Self:
+        """Create a deeply frozen, hashable copy of the S2 message or message component.
+
+        Frozen nested components are reused instead of copied. See `s2python.frozen`.
+
+        :return: The frozen copy, or the object itself if it is frozen already.
+        """
+        return frozen.freeze(self)  # type: ignore[no-any-return]
+
+    def evolve(self, **changes: Any) -> Self:
+        """Create a frozen copy of the S2 message or message component with some fields changed.
+
+        Unchanged nested components are reused instead of copied. See `s2python.frozen`.
+
+        :param changes: The new values by field name.
+        :raises: S2ValidationError
+        :return: The frozen copy.
+        """
+        return frozen.evolve(self, changes)
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the S2 message or message component is frozen."""
+        return frozen.is_frozen(self)
+
+    def to_json(self, json_codec: Optional[JsonCodec] = None) -> str:
         """Convert the S2 message or message component to a json string.
 
+        :param json_codec: Serialize with this JSON library. None lets pydantic-core serialize directly, which is the
+                           fastest option.
         :return: The json string.
         """
         try:
+            if json_codec is not None:
+                return json_codec.dumps(self.model_dump(mode="json", by_alias=True, exclude_none=True))
+            sealed = sealed_json.sealed_json_bytes(self)
+            if sealed is not None:
+                return sealed.decode("utf-8")
             return self.model_dump_json(by_alias=True, exclude_none=True)
-        except (ValidationError, TypeError) as e:
+        except (ValidationError, PydanticSerializationError, TypeError) as e:
             raise S2ValidationError(
                 type(self), self, "Pydantic raised a validation error.",
             ) from e
 
+    def to_json_bytes(self, json_codec: Optional[JsonCodec] = None) -> bytes:
+        """Convert the S2 message or message component to UTF-8 encoded json.
+
+        pydantic-core serializes to bytes natively, so this skips the decoding into a string which `to_json` does.
+
+        :param json_codec: Serialize with this JSON library. None lets pydantic-core serialize directly, which is the
+                           fastest option.
+        :return: The UTF-8 encoded json.
+        """
+        try:
+            if json_codec is not None:
+                return json_codec.dumps_bytes(self.model_dump(mode="json", by_alias=True, exclude_none=True))
+            sealed = sealed_json.sealed_json_bytes(self)
+            if sealed is not None:
+                return sealed
+            return self.__pydantic_serializer__.to_json(self, by_alias=True, exclude_none=True)
+        except (ValidationError, PydanticSerializationError, TypeError) as e:
+            raise S2ValidationError(
+                type(self), self, "Pydantic raised a validation error.",
+            ) from e
+
+    @staticmethod
+    def dump_ndjson(
+        messages: Iterable["S2MessageComponent"],
+        output: Optional[bytearray] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ) -> bytearray:
+        """Serialize S2 messages, which may be of different types, to newline-delimited JSON.
+
+        See `s2python.s2_ndjson.dump_ndjson`.
+
+        :param messages: The S2 messages.
+        :param output: The buffer the JSON lines are appended to. None creates a new buffer.
+        :param json_codec: Serialize with this JSON library. None lets pydantic-core serialize directly.
+        :raises: S2ValidationError
+        :return: The buffer with one line per message.
+        """
+        from s2python import s2_ndjson  # pylint: disable=import-outside-toplevel,cyclic-import
+
+        return s2_ndjson.dump_ndjson(messages, output, json_codec)
+
+    @staticmethod
+    def write_ndjson(
+        messages: Iterable["S2MessageComponent"],
+        file: BinaryIO,
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+        json_codec: Optional[JsonCodec] = None,
+    ) -> int:
+        """Write S2 messages, which may be of different types, as newline-delimited JSON to a binary file.
+
+        See `s2python.s2_ndjson.write_ndjson`.
+
+        :param messages: The S2 messages.
+        :param file: The file the lines are written to.
+        :param workers: The number of worker processes. None serializes all messages in the current process.
+        :param chunk_size: The number of messages which is serialized at once.
+        :param json_codec: Serialize with this JSON library. None lets pydantic-core serialize directly.
+        :raises: S2ValidationError
+        :return: The number of written messages.
+        """
+        from s2python import s2_ndjson  # pylint: disable=import-outside-toplevel,cyclic-import
+
+        return s2_ndjson.write_ndjson(messages, file, workers, chunk_size, json_codec)
+
+    @staticmethod
+    def read_ndjson(
+        source: Iterable[Union[str, bytes]],
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator["ParsedLine"]:
+        """Stream S2 messages back from newline-delimited JSON, e.g. a file written by `write_ndjson`.
+
+        See `s2python.s2_ndjson.read_ndjson`.
+
+        :param source: The chunks of newline-delimited JSON, e.g. a file opened in binary mode.
+        :param workers: The number of worker processes. None parses all lines in the current process.
+        :param chunk_size: The number of lines which is sent to a worker process at once.
+        :return: An iterator over the parse result of each non-blank line.
+        """
+        from s2python import s2_ndjson  # pylint: disable=import-outside-toplevel,cyclic-import
+
+        return s2_ndjson.read_ndjson(source, workers=workers, chunk_size=chunk_size)
+
+    def to_canonical_json(self, exclude_message_id: bool = False) -> bytes:
+        """Convert the S2 message or message component to canonical json for hashing and comparison.
+
+        Keys are sorted and floats, UUIDs, datetimes and enums are normalized, see `s2python.canonical_json`.
+
+        :param exclude_message_id: Leave out the `message_id` of the message itself.
+        :return: The UTF-8 encoded canonical json.
+        """
+        return canonical_json(self, exclude_message_id)
+
+    def content_hash(self, exclude_message_id: bool = True) -> str:
+        """Compute a digest of the content of the S2 message or message component.
+
+        By default the `message_id` of the message itself is left out, so a message which is resent with a new
+        message id has the same content hash.
+
+        :param exclude_message_id: Leave out the `message_id` of the message itself.
+        :return: The hexadecimal SHA-256 digest of the canonical json.
+        """
+        return content_hash(self, exclude_message_id)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the S2 message or message component to a Python dictionary that contains Python-native structures..
 
@@ -67,7 +256,17 @@ class S2MessageComponent(BaseModel):
         return self.model_dump(mode='json')
 
     @classmethod
-    def from_json(cls, json_str: str) -> Self:
+    def from_json(cls, json_str: str, json_codec: Optional[JsonCodec] = None) -> Self:
+        """Build the S2 message or message component from a json string.
+
+        :param json_str: The json string.
+        :param json_codec: Decode the json string with this JSON library first. None lets pydantic-core parse the
+                           json string directly, which is the fastest option.
+        :raises: S2ValidationError, json.JSONDecodeError
+        :return: The S2 message or message component.
+        """
+        if json_codec is not None:
+            return cls.from_dict(json_codec.loads(json_str))
         try:
             gen_model = cls.model_validate_json(json_str)
         except (ValidationError, TypeError) as e:
@@ -76,6 +275,25 @@ class S2MessageComponent(BaseModel):
             ) from e
         return gen_model
 
+    @classmethod
+    def build(cls, **fields: Any) -> Self:
+        """Build the S2 message or message component, including all nested components, in a single validation.
+
+        Nested components may be given as dictionaries (or as already built objects). pydantic-core then builds the
+        whole tree at once, without calling the constructor of every nested component from Python, and a validation
+        error is only converted to an `S2ValidationError` once, here.
+
+        :param fields: The fields of the S2 message or message component.
+        :raises: S2ValidationError
+        :return: The S2 message or message component.
+        """
+        try:
+            return cls.__pydantic_validator__.validate_python(fields)
+        except (ValidationError, TypeError) as e:
+            raise S2ValidationError(
+                cls, fields, "Pydantic raised a validation error.",
+            ) from e
+
     @classmethod
     def from_dict(cls, json_dict: Dict[str, Any]) -> Self:
         try:
@@ -86,6 +304,40 @@ class S2MessageComponent(BaseModel):
             ) from e
         return gen_model
 
+    @classmethod
+    def from_json_trusted(cls, json_str: Union[str, bytes]) -> Self:
+        """Build the S2 message or message component from a trusted json string without running any validators.
+
+        Only use this for input from a trusted peer. See `s2python.s2_trusted_validator`.
+
+        :param json_str: The json string.
+        :raises: S2ValidationError if the input does not match the types of the S2 message.
+        :return: The S2 message or message component.
+        """
+        try:
+            return trusted_validator_for(cls).validate_json(json_str)
+        except (ValidationError, TypeError) as e:
+            raise S2ValidationError(
+                cls, json_str, "Pydantic raised a validation error.",
+            ) from e
+
+    @classmethod
+    def from_dict_trusted(cls, json_dict: Dict[str, Any]) -> Self:
+        """Build the S2 message or message component from a trusted dictionary without running any validators.
+
+        Only use this for input from a trusted peer. See `s2python.s2_trusted_validator`.
+
+        :param json_dict: The json-parsed dictionary.
+        :raises: S2ValidationError if the input does not match the types of the S2 message.
+        :return: The S2 message or message component.
+        """
+        try:
+            return trusted_validator_for(cls).validate_python(json_dict)
+        except (ValidationError, TypeError) as e:
+            raise S2ValidationError(
+                cls, json_dict, "Pydantic raised a validation error.",
+            ) from e
+
 
 def convert_to_s2exception(f: Callable) -> Callable:
     def inner(*args: List[Any], **kwargs: Dict[str, Any]) -> Any:
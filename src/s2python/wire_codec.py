@@ -0,0 +1,234 @@
+"""Compact binary formats in which S2 messages may be exchanged instead of JSON.
+
+A `WireCodec` encodes the same JSON-compatible data as the JSON messages (field names, enum values, ISO 8601
+datetimes, UUID strings), but as MessagePack or CBOR in binary websocket frames. This shrinks numbers, lists and
+objects but keeps the (long) field names, so both ends are still able to validate the messages with the normal S2
+classes.
+
+Both ends have to agree on the format. The client offers the websocket subprotocols of the codecs it supports (e.g.
+`s2.msgpack`) and the server selects one of them, see `select_wire_codec`. If the server does not select any of the
+offered subprotocols, JSON is used, which is the default.
+
+`ZlibDictionaryWireCodec` compresses each message on its own with a preset dictionary of the S2 field names and enum
+values (see `s2python.s2_compression`), for transports without permessage-deflate or without context takeover.
+
+MessagePack requires `msgpack` (`pip install s2-python[msgpack]`) and CBOR requires `cbor2`
+(`pip install s2-python[cbor]`). A codec is only registered if its library is installed.
+"""
+
+import abc
+import hashlib
+import zlib
+from typing import Any, Dict, Iterable, Optional, Union
+
+from s2python.json_codec import get_json_codec
+from s2python.s2_compression import build_s2_dictionary
+from s2python.s2_validation_error import S2ValidationError
+from s2python.validate_values_mixin import S2MessageComponent
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]  # pylint: disable=invalid-name
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None  # type: ignore[assignment]  # pylint: disable=invalid-name
+
+
+class WireCodec(abc.ABC):
+    name: str
+    subprotocol: str
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Convert Python data structures to the binary format.
+
+        :param obj: The Python data structures which only contain JSON-compatible types.
+        :return: The encoded data.
+        """
+
+    @abc.abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Convert the binary format to Python data structures.
+
+        :param data: The encoded data.
+        :raises: ValueError or TypeError if the data cannot be decoded.
+        :return: The Python data structures.
+        """
+
+    def encode(self, message: S2MessageComponent) -> bytes:
+        """Encode an S2 message.
+
+        :param message: The S2 message.
+        :return: The encoded message.
+        """
+        return self.dumps(message.model_dump(mode="json", by_alias=True, exclude_none=True))
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        """Decode an S2 message into Python data structures (or JSON) which still have to be validated.
+
+        :param data: The encoded message.
+        :raises: S2ValidationError if the data cannot be decoded, e.g. when a text frame is received.
+        :return: The Python data structures.
+        """
+        try:
+            return self.loads(data)  # type: ignore[arg-type]
+        except (ValueError, TypeError) as e:
+            raise S2ValidationError(None, data, f"Unable to decode the message as {self.name}.") from e
+
+
+class MsgpackWireCodec(WireCodec):
+    name = "msgpack"
+    subprotocol = "s2.msgpack"
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data)
+
+
+class CborWireCodec(WireCodec):
+    name = "cbor"
+    subprotocol = "s2.cbor"
+
+    def dumps(self, obj: Any) -> bytes:
+        return cbor2.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return cbor2.loads(data)
+        except cbor2.CBORError as e:
+            # Not a ValueError in every version of cbor2.
+            raise ValueError(str(e)) from e
+
+
+class ZlibDictionaryWireCodec(WireCodec):
+    """Compresses every message on its own with zlib and a preset dictionary of S2 field names and enum values.
+
+    The subprotocol contains a digest of the dictionary, so only ends with the same dictionary select this codec.
+    """
+
+    inner: Optional[WireCodec]
+    dictionary: bytes
+    level: int
+    max_message_size: Optional[int]
+
+    def __init__(
+        self,
+        inner: Optional[WireCodec] = None,
+        dictionary: Optional[bytes] = None,
+        level: int = 9,
+        max_message_size: Optional[int] = 16 * 1024 * 1024,
+    ) -> None:
+        """Create a compressing wire codec.
+
+        :param inner: The format of the compressed messages. None compresses JSON.
+        :param dictionary: The zlib preset dictionary. None uses `build_s2_dictionary()`.
+        :param level: The zlib compression level.
+        :param max_message_size: Messages which decompress to more bytes than this are rejected. None does not limit
+                                 the size.
+        """
+        self.inner = inner
+        self.dictionary = build_s2_dictionary() if dictionary is None else dictionary
+        self.level = level
+        self.max_message_size = max_message_size
+        inner_name = "json" if inner is None else inner.name
+        dictionary_digest = hashlib.sha256(self.dictionary).hexdigest()[:8]
+        self.name = f"{inner_name}+zlib"
+        self.subprotocol = f"s2.{inner_name}.zlib-{dictionary_digest}"
+
+    def _compress(self, data: bytes) -> bytes:
+        compressor = zlib.compressobj(
+            self.level, zlib.DEFLATED, -zlib.MAX_WBITS, 9, zlib.Z_DEFAULT_STRATEGY, self.dictionary
+        )
+        return compressor.compress(data) + compressor.flush()
+
+    def _decompress(self, data: bytes) -> bytes:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=self.dictionary)
+        try:
+            if self.max_message_size is None:
+                decompressed = decompressor.decompress(data)
+            else:
+                decompressed = decompressor.decompress(data, self.max_message_size + 1)
+        except zlib.error as e:
+            raise ValueError(str(e)) from e
+        if self.max_message_size is not None and len(decompressed) > self.max_message_size:
+            raise ValueError(f"Message decompresses to more than {self.max_message_size} bytes.")
+        if not decompressor.eof:
+            raise ValueError("Message is truncated.")
+        return decompressed
+
+    def dumps(self, obj: Any) -> bytes:
+        if self.inner is None:
+            return self._compress(get_json_codec().dumps_bytes(obj))
+        return self._compress(self.inner.dumps(obj))
+
+    def loads(self, data: bytes) -> Any:
+        if self.inner is None:
+            return get_json_codec().loads(self._decompress(data))
+        return self.inner.loads(self._decompress(data))
+
+    def encode(self, message: S2MessageComponent) -> bytes:
+        if self.inner is None:
+            return self._compress(message.to_json_bytes())
+        return self._compress(self.inner.encode(message))
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        if self.inner is not None:
+            return super().decode(data)
+        # Leave the JSON to pydantic-core, which parses and validates it in a single pass.
+        try:
+            return self._decompress(data)  # type: ignore[arg-type]
+        except (ValueError, TypeError) as e:
+            raise S2ValidationError(None, data, f"Unable to decode the message as {self.name}.") from e
+
+
+WIRE_CODECS: Dict[str, WireCodec] = {}
+
+
+def register_wire_codec(codec: WireCodec) -> None:
+    """Register a wire codec so it may be retrieved by its name.
+
+    :param codec: The wire codec.
+    """
+    WIRE_CODECS[codec.name] = codec
+
+
+def get_wire_codec(name: str) -> WireCodec:
+    """Retrieve a registered wire codec.
+
+    :param name: The name of the codec.
+    :raises: KeyError if no codec with the name is registered, e.g. because its library is not installed.
+    :return: The wire codec.
+    """
+    return WIRE_CODECS[name]
+
+
+def select_wire_codec(
+    subprotocols: Iterable[Optional[str]], supported_codecs: Iterable[WireCodec]
+) -> Optional[WireCodec]:
+    """Select the first supported wire codec from websocket subprotocols in order of preference.
+
+    Clients pass the subprotocol which was selected by the server. Servers pass the subprotocols offered by the
+    client and answer with the subprotocol of the selected codec.
+
+    :param subprotocols: The websocket subprotocols in order of preference.
+    :param supported_codecs: The wire codecs which are supported by this end.
+    :return: The selected wire codec or None if the messages are exchanged as JSON.
+    """
+    codecs_by_subprotocol = {codec.subprotocol: codec for codec in supported_codecs}
+    for subprotocol in subprotocols:
+        codec = codecs_by_subprotocol.get(str(subprotocol))
+        if codec is not None:
+            return codec
+    return None
+
+
+register_wire_codec(ZlibDictionaryWireCodec())
+if msgpack is not None:
+    register_wire_codec(MsgpackWireCodec())
+if cbor2 is not None:
+    register_wire_codec(CborWireCodec())
@@ -0,0 +1,96 @@
+import datetime
+import json
+import uuid
+from unittest import TestCase
+
+from s2python.canonical_json import canonical_json, content_hash
+from s2python.common import CommodityQuantity, PowerMeasurement, PowerValue
+
+
+def example_measurement(
+    message_id: uuid.UUID, measurement_timestamp: datetime.datetime, value: float = 10.0
+) -> PowerMeasurement:
+    return PowerMeasurement(
+        message_id=message_id,
+        measurement_timestamp=measurement_timestamp,
+        values=[PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1, value=value)],
+    )
+
+
+TIMESTAMP = datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+class CanonicalJsonTest(TestCase):
+    def test__canonical_json__sorted_compact(self):
+        # Arrange
+        message_id = uuid.UUID("2bdec96b-be3b-4ba9-afa0-c4a0632cced3")
+        measurement = example_measurement(message_id, TIMESTAMP)
+
+        # Act
+        canonical = canonical_json(measurement)
+
+        # Assert
+        self.assertEqual(
+            canonical,
+            b'{"measurement_timestamp":"2024-01-01T12:00:00+00:00",'
+            b'"message_id":"2bdec96b-be3b-4ba9-afa0-c4a0632cced3","message_type":"PowerMeasurement",'
+            b'"values":[{"commodity_quantity":"ELECTRIC.POWER.L1","value":10.0}]}',
+        )
+
+    def test__canonical_json__exclude_message_id(self):
+        # Arrange
+        measurement = example_measurement(uuid.uuid4(), TIMESTAMP)
+
+        # Act
+        canonical = canonical_json(measurement, exclude_message_id=True)
+
+        # Assert
+        self.assertNotIn("message_id", json.loads(canonical))
+
+    def test__canonical_json__same_instant_other_offset(self):
+        # Arrange
+        message_id = uuid.uuid4()
+        other_offset = TIMESTAMP.astimezone(datetime.timezone(datetime.timedelta(hours=2)))
+
+        # Act
+        canonical_utc = canonical_json(example_measurement(message_id, TIMESTAMP))
+        canonical_other_offset = canonical_json(example_measurement(message_id, other_offset))
+
+        # Assert
+        self.assertEqual(canonical_utc, canonical_other_offset)
+
+    def test__canonical_json__negative_zero(self):
+        # Arrange
+        message_id = uuid.uuid4()
+
+        # Act
+        canonical_zero = canonical_json(example_measurement(message_id, TIMESTAMP, 0.0))
+        canonical_negative_zero = canonical_json(example_measurement(message_id, TIMESTAMP, -0.0))
+
+        # Assert
+        self.assertEqual(canonical_zero, canonical_negative_zero)
+
+    def test__content_hash__ignores_message_id(self):
+        # Arrange
+        first = example_measurement(uuid.uuid4(), TIMESTAMP)
+        resent = example_measurement(uuid.uuid4(), TIMESTAMP)
+
+        # Act
+        first_hash = content_hash(first)
+        resent_hash = content_hash(resent)
+
+        # Assert
+        self.assertEqual(first_hash, resent_hash)
+        self.assertNotEqual(content_hash(first, exclude_message_id=False), content_hash(resent, exclude_message_id=False))
+
+    def test__content_hash__changed_content(self):
+        # Arrange
+        message_id = uuid.uuid4()
+
+        # Act
+        original_hash = example_measurement(message_id, TIMESTAMP, 10.0).content_hash()
+        changed_hash = example_measurement(message_id, TIMESTAMP, 10.5).content_hash()
+
+        # Assert
+        self.assertNotEqual(original_hash, changed_hash)
+        self.assertEqual(len(original_hash), 64)
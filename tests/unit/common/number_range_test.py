@@ -72,3 +72,16 @@ class NumberRangeTest(TestCase):
         # Assert
         expected_json = {"start_of_range": 6.0, "end_of_range": 5.0}
         self.assertEqual(json.loads(json_str), expected_json)
+
+    def test__hash__equal_ranges(self):
+        # Arrange
+        number_range = NumberRange(start_of_range=4.0, end_of_range=5.0)
+        same_number_range = NumberRange.from_json('{"start_of_range": 4, "end_of_range": 5}')
+
+        # Act
+        frozen_number_range = number_range.frozen()
+
+        # Assert
+        self.assertEqual(hash(number_range), hash(same_number_range))
+        self.assertEqual(hash(number_range), hash(frozen_number_range))
+        self.assertEqual(len({number_range, same_number_range, frozen_number_range}), 1)
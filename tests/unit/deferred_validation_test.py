@@ -0,0 +1,131 @@
+import datetime
+import threading
+import uuid
+from unittest import TestCase
+
+from s2python.common import CommodityQuantity, PowerMeasurement, PowerValue
+from s2python.s2_validation_error import S2ValidationError
+
+
+def example_measurement() -> PowerMeasurement:
+    return PowerMeasurement(
+        message_id=uuid.uuid4(),
+        measurement_timestamp=datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        values=[PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1, value=10.0)],
+    )
+
+
+class DeferredValidationTest(TestCase):
+    def test__deferred_validation__invalid_intermediate_state(self):
+        # Arrange
+        measurement = example_measurement()
+        duplicate = PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1, value=20.0)
+
+        # Act
+        with measurement.deferred_validation() as deferred:
+            measurement.values = [measurement.values[0], duplicate]
+            measurement.values = [duplicate]
+
+        # Assert
+        self.assertIs(deferred, measurement)
+        self.assertEqual(measurement.values, [duplicate])
+
+    def test__deferred_validation__coerced_on_exit(self):
+        # Arrange
+        measurement = example_measurement()
+        message_id = uuid.uuid4()
+
+        # Act
+        with measurement.deferred_validation():
+            measurement.message_id = str(message_id)  # type: ignore[assignment]
+            measurement.measurement_timestamp = "2024-02-01T00:00:00+00:00"  # type: ignore[assignment]
+
+        # Assert
+        self.assertEqual(measurement.message_id, message_id)
+        self.assertEqual(
+            measurement.measurement_timestamp, datetime.datetime(2024, 2, 1, tzinfo=datetime.timezone.utc)
+        )
+
+    def test__deferred_validation__invalid_final_state_restored(self):
+        # Arrange
+        measurement = example_measurement()
+        original_values = measurement.values
+        duplicate = PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1, value=20.0)
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            with measurement.deferred_validation():
+                measurement.values = [measurement.values[0], duplicate]
+        self.assertIs(measurement.values, original_values)
+
+    def test__deferred_validation__exception_restores(self):
+        # Arrange
+        measurement = example_measurement()
+        original_message_id = measurement.message_id
+
+        # Act / Assert
+        with self.assertRaises(KeyError):
+            with measurement.deferred_validation():
+                measurement.message_id = uuid.uuid4()
+                raise KeyError("failed")
+        self.assertEqual(measurement.message_id, original_message_id)
+
+    def test__deferred_validation__nested(self):
+        # Arrange
+        measurement = example_measurement()
+
+        # Act
+        with measurement.deferred_validation():
+            with measurement.deferred_validation():
+                measurement.values = []
+            values_after_inner = measurement.values
+            measurement.values = [PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L2, value=1.0)]
+
+        # Assert
+        self.assertEqual(values_after_inner, [])
+        self.assertEqual(len(measurement.values), 1)
+
+    def test__deferred_validation__unknown_field(self):
+        # Arrange
+        measurement = example_measurement()
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            with measurement.deferred_validation():
+                measurement.unknown_field = 1
+
+    def test__deferred_validation__sealed_invalidated(self):
+        # Arrange
+        measurement = example_measurement().seal()
+
+        # Act
+        with measurement.deferred_validation():
+            measurement.values = [PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L2, value=1.0)]
+
+        # Assert
+        self.assertEqual(
+            measurement.to_json_bytes(), measurement.model_dump_json(by_alias=True, exclude_none=True).encode()
+        )
+
+    def test__deferred_validation__other_thread_validates(self):
+        # Arrange
+        measurement = example_measurement()
+        entered = threading.Event()
+        done = threading.Event()
+
+        def defer_in_thread() -> None:
+            with measurement.deferred_validation():
+                entered.set()
+                done.wait(5)
+
+        thread = threading.Thread(target=defer_in_thread)
+        thread.start()
+        entered.wait(5)
+
+        # Act / Assert
+        try:
+            with self.assertRaises(S2ValidationError):
+                measurement.message_id = "not a uuid"  # type: ignore[assignment]
+        finally:
+            done.set()
+            thread.join()
@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from s2python.error_reply_limiter import ErrorReplyLimiter, RejectedFrameCounters
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ErrorReplyLimiterTest(TestCase):
+    def test__try_acquire__unlimited(self):
+        # Arrange
+        limiter = ErrorReplyLimiter(None, burst=1)
+
+        # Act
+        acquired = [limiter.try_acquire() for _ in range(100)]
+
+        # Assert
+        self.assertTrue(all(acquired))
+        self.assertEqual(limiter.take_suppressed(), 0)
+
+    def test__try_acquire__burst_then_rate(self):
+        # Arrange
+        clock = FakeClock()
+        limiter = ErrorReplyLimiter(2.0, burst=3, clock=clock)
+
+        # Act
+        burst = [limiter.try_acquire() for _ in range(5)]
+        clock.now = 1.0
+        after_one_second = [limiter.try_acquire() for _ in range(3)]
+
+        # Assert
+        self.assertEqual(burst, [True, True, True, False, False])
+        self.assertEqual(after_one_second, [True, True, False])
+        self.assertEqual(limiter.take_suppressed(), 3)
+        self.assertEqual(limiter.take_suppressed(), 0)
+
+    def test__try_acquire__refill_capped_at_burst(self):
+        # Arrange
+        clock = FakeClock()
+        limiter = ErrorReplyLimiter(1.0, burst=2, clock=clock)
+
+        # Act
+        clock.now = 100.0
+        acquired = [limiter.try_acquire() for _ in range(3)]
+
+        # Assert
+        self.assertEqual(acquired, [True, True, False])
+
+
+class RejectedFrameCountersTest(TestCase):
+    def test__total(self):
+        # Arrange
+        counters = RejectedFrameCounters(oversized=1, invalid_json=2, invalid_message=3, suppressed_replies=4)
+
+        # Act / Assert
+        self.assertEqual(counters.total, 6)
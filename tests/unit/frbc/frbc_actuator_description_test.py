@@ -19,6 +19,82 @@ from s2python.frbc import (
 )
 
 
+class CountingUUID(uuid.UUID):
+    """A UUID which counts how often any instance is hashed or compared."""
+
+    __slots__ = ()
+    operations = 0
+
+    def __eq__(self, other: object) -> bool:
+        CountingUUID.operations += 1
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        CountingUUID.operations += 1
+        return super().__hash__()
+
+
+def counting_uuid(value: uuid.UUID) -> CountingUUID:
+    # A separate instance for every reference, so comparisons are not short-cut by identity.
+    return CountingUUID(int=value.int)
+
+
+def constructed_actuator_description(operation_mode_count: int) -> FRBCActuatorDescription:
+    # Built with `model_construct` so only the validators of the actuator description itself are run.
+    element = FRBCOperationModeElement.model_construct(
+        fill_level_range=NumberRange.model_construct(start_of_range=0.0, end_of_range=1.0),
+        fill_rate=NumberRange.model_construct(start_of_range=0.0, end_of_range=1.0),
+        power_ranges=[
+            PowerRange.model_construct(
+                start_of_range=0.0, end_of_range=1.0, commodity_quantity=CommodityQuantity.HEAT_THERMAL_POWER
+            ),
+            PowerRange.model_construct(
+                start_of_range=0.0, end_of_range=1.0, commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1
+            ),
+        ],
+    )
+    operation_modes = [
+        FRBCOperationMode.model_construct(
+            id=counting_uuid(uuid.uuid4()), elements=[element], abnormal_condition_only=False
+        )
+        for _ in range(operation_mode_count)
+    ]
+    timers = [
+        Timer.model_construct(id=counting_uuid(uuid.uuid4()), duration=Duration.from_milliseconds(1000))
+        for _ in range(operation_mode_count)
+    ]
+    transitions = [
+        Transition.model_construct(
+            id=counting_uuid(uuid.uuid4()),
+            from_=counting_uuid(operation_modes[index % operation_mode_count].id),
+            to=counting_uuid(operation_modes[(index + 1) % operation_mode_count].id),
+            start_timers=[counting_uuid(timers[index % operation_mode_count].id)],
+            blocking_timers=[counting_uuid(timers[(index + 1) % operation_mode_count].id)],
+            transition_duration=Duration.from_milliseconds(0),
+            abnormal_condition_only=False,
+        )
+        for index in range(4 * operation_mode_count)
+    ]
+    return FRBCActuatorDescription.model_construct(
+        id=uuid.uuid4(),
+        operation_modes=operation_modes,
+        transitions=transitions,
+        timers=timers,
+        supported_commodities=[Commodity.HEAT, Commodity.ELECTRICITY],
+    )
+
+
+def count_validator_operations(actuator_description: FRBCActuatorDescription) -> int:
+    validators = [
+        getattr(actuator_description, name)
+        for name in FRBCActuatorDescription.__pydantic_decorators__.model_validators
+    ]
+    CountingUUID.operations = 0
+    for validator in validators:
+        validator()
+    return CountingUUID.operations
+
+
 class FRBCActuatorDescriptionTest(TestCase):
     def test__from_json__happy_path(self):
         # Arrange
@@ -239,3 +315,18 @@ class FRBCActuatorDescriptionTest(TestCase):
             ],
         }
         self.assertEqual(json.loads(json_str), expected_json)
+
+    def test__validators__scale_linearly(self):
+        # Arrange
+        small = constructed_actuator_description(125)
+        large = constructed_actuator_description(1000)
+
+        # Act
+        small_operations = count_validator_operations(small)
+        large_operations = count_validator_operations(large)
+
+        # Assert
+        # 8 times as many operation modes, timers and transitions. Quadratic validators would compare ids 64 times as
+        # often. The durations are measured by development_utilities/benchmark_validators.py.
+        self.assertGreater(small_operations, 0)
+        self.assertLessEqual(large_operations, 8 * small_operations)
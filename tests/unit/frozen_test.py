@@ -0,0 +1,177 @@
+import datetime
+import pickle
+import uuid
+from unittest import TestCase
+
+from s2python.common import CommodityQuantity, Duration, PowerMeasurement, PowerValue
+from s2python.frbc import FRBCSystemDescription
+from s2python.frozen import FrozenList
+from s2python.s2_validation_error import S2ValidationError
+
+
+def example_measurement() -> PowerMeasurement:
+    return PowerMeasurement(
+        message_id=uuid.uuid4(),
+        measurement_timestamp=datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        values=[
+            PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1, value=10.0),
+            PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L2, value=20.0),
+        ],
+    )
+
+
+def example_system_description() -> FRBCSystemDescription:
+    on_id, off_id, timer_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    element = {
+        "fill_level_range": {"start_of_range": 0, "end_of_range": 1},
+        "fill_rate": {"start_of_range": 0, "end_of_range": 1},
+        "power_ranges": [{"start_of_range": 0, "end_of_range": 1, "commodity_quantity": "ELECTRIC.POWER.L1"}],
+    }
+    modes = [{"id": mode_id, "elements": [element], "abnormal_condition_only": False} for mode_id in (on_id, off_id)]
+    transition = {
+        "id": uuid.uuid4(),
+        "from": on_id,
+        "to": off_id,
+        "start_timers": [timer_id],
+        "blocking_timers": [],
+        "transition_duration": 1000,
+        "abnormal_condition_only": False,
+    }
+    actuator = {
+        "id": uuid.uuid4(),
+        "supported_commodities": ["ELECTRICITY"],
+        "operation_modes": modes,
+        "transitions": [transition],
+        "timers": [{"id": timer_id, "duration": 2000}],
+    }
+    return FRBCSystemDescription.build(
+        message_id=uuid.uuid4(),
+        valid_from=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        actuators=[actuator],
+        storage={
+            "provides_leakage_behaviour": False,
+            "provides_fill_level_target_profile": False,
+            "provides_usage_forecast": False,
+            "fill_level_range": {"start_of_range": 0, "end_of_range": 1},
+        },
+    )
+
+
+class FrozenTest(TestCase):
+    def test__frozen__deep_copy(self):
+        # Arrange
+        measurement = example_measurement()
+
+        # Act
+        frozen_measurement = measurement.frozen()
+
+        # Assert
+        self.assertTrue(frozen_measurement.is_frozen)
+        self.assertFalse(measurement.is_frozen)
+        self.assertIsInstance(frozen_measurement, PowerMeasurement)
+        self.assertIsInstance(frozen_measurement.values, FrozenList)
+        self.assertTrue(frozen_measurement.values[0].is_frozen)
+        self.assertEqual(frozen_measurement.to_json(), measurement.to_json())
+        self.assertIs(frozen_measurement.frozen(), frozen_measurement)
+
+    def test__frozen__assignment_raises(self):
+        # Arrange
+        frozen_measurement = example_measurement().frozen()
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            frozen_measurement.message_id = uuid.uuid4()
+        with self.assertRaises(S2ValidationError):
+            frozen_measurement.values[0].value = 5.0
+        with self.assertRaises(TypeError):
+            frozen_measurement.values.append(frozen_measurement.values[0])
+
+    def test__frozen__hashable(self):
+        # Arrange
+        measurement = example_measurement()
+
+        # Act
+        first = measurement.frozen()
+        second = measurement.frozen()
+
+        # Assert
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual({first: "measurement"}[second], "measurement")
+
+    def test__frozen__equal_to_unfrozen(self):
+        # Arrange
+        measurement = example_measurement()
+
+        # Act
+        frozen_measurement = measurement.frozen()
+
+        # Assert
+        self.assertEqual(frozen_measurement, measurement)
+        self.assertEqual(measurement, frozen_measurement)
+        self.assertNotEqual(frozen_measurement.evolve(message_id=uuid.uuid4()), measurement)
+        self.assertNotEqual(frozen_measurement, frozen_measurement.values[0])
+
+    def test__frozen__system_description_equal_to_unfrozen(self):
+        # Arrange
+        system_description = example_system_description()
+
+        # Act
+        frozen_system_description = system_description.frozen()
+
+        # Assert
+        self.assertEqual(frozen_system_description, system_description)
+        self.assertEqual(system_description, frozen_system_description)
+        self.assertEqual(Duration.from_milliseconds(1000).frozen(), Duration.from_milliseconds(1000))
+        self.assertNotEqual(Duration.from_milliseconds(1000).frozen(), Duration.from_milliseconds(2000))
+
+    def test__evolve__reuses_unchanged(self):
+        # Arrange
+        frozen_measurement = example_measurement().frozen()
+        message_id = uuid.uuid4()
+
+        # Act
+        evolved = frozen_measurement.evolve(message_id=message_id)
+
+        # Assert
+        self.assertTrue(evolved.is_frozen)
+        self.assertEqual(evolved.message_id, message_id)
+        self.assertIs(evolved.values[0], frozen_measurement.values[0])
+        self.assertIs(evolved.values[1], frozen_measurement.values[1])
+        self.assertNotEqual(evolved, frozen_measurement)
+
+    def test__evolve__nested_dicts(self):
+        # Arrange
+        measurement = example_measurement()
+
+        # Act
+        evolved = measurement.evolve(values=[{"commodity_quantity": "ELECTRIC.POWER.L3", "value": 30.0}])
+
+        # Assert
+        self.assertIsInstance(evolved.values, FrozenList)
+        self.assertTrue(evolved.values[0].is_frozen)
+        self.assertEqual(evolved.values[0].commodity_quantity, CommodityQuantity.ELECTRIC_POWER_L3)
+        self.assertEqual(len(measurement.values), 2)
+
+    def test__evolve__invalid(self):
+        # Arrange
+        frozen_measurement = example_measurement().frozen()
+        value = frozen_measurement.values[0]
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            frozen_measurement.evolve(values=[value, value])
+        with self.assertRaises(S2ValidationError):
+            frozen_measurement.evolve(unknown_field=1)
+
+    def test__frozen__pickle(self):
+        # Arrange
+        frozen_measurement = example_measurement().frozen()
+
+        # Act
+        unpickled = pickle.loads(pickle.dumps(frozen_measurement))
+
+        # Assert
+        self.assertEqual(unpickled, frozen_measurement)
+        self.assertTrue(unpickled.is_frozen)
@@ -0,0 +1,64 @@
+import json
+from unittest import TestCase
+
+from s2python.json_codec import JsonCodec, StdlibJsonCodec, get_json_codec, register_json_codec, JSON_CODECS
+
+
+class UpperCaseJsonCodec(StdlibJsonCodec):
+    name = "upper"
+
+    def dumps(self, obj) -> str:
+        return super().dumps(obj).upper()
+
+
+class JsonCodecTest(TestCase):
+    def test__get_json_codec__default_prefers_orjson(self):
+        # Arrange / Act
+        codec = get_json_codec()
+
+        # Assert
+        self.assertIsInstance(codec, JsonCodec)
+        self.assertEqual(codec.name, "orjson" if "orjson" in JSON_CODECS else "stdlib")
+
+    def test__codecs__roundtrip(self):
+        # Arrange
+        data = {"message_type": "Handshake", "values": [1, 2.5, None, True], "label": "ü"}
+
+        for codec in list(JSON_CODECS.values()):
+            # Act
+            roundtrip = codec.loads(codec.dumps(data).encode("utf-8"))
+
+            # Assert
+            self.assertEqual(roundtrip, data)
+
+    def test__codecs__dumps_bytes(self):
+        # Arrange
+        data = {"message_type": "Handshake", "label": "ü"}
+
+        for codec in list(JSON_CODECS.values()):
+            # Act
+            dumped = codec.dumps_bytes(data)
+
+            # Assert
+            self.assertEqual(dumped, codec.dumps(data).encode("utf-8"))
+
+    def test__codecs__invalid_json(self):
+        for codec in list(JSON_CODECS.values()):
+            # Act / Assert
+            with self.assertRaises(json.JSONDecodeError):
+                codec.loads(b'{"message_type": ')
+
+    def test__register_json_codec(self):
+        # Arrange
+        default_codec = get_json_codec()
+        codec = UpperCaseJsonCodec()
+
+        # Act
+        register_json_codec(codec)
+
+        # Assert
+        try:
+            self.assertIs(get_json_codec("upper"), codec)
+            self.assertIs(get_json_codec(), default_codec)
+        finally:
+            del JSON_CODECS["upper"]
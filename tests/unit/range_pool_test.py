@@ -0,0 +1,66 @@
+import uuid
+from unittest import TestCase
+
+from s2python.common import CommodityQuantity, NumberRange, PowerRange
+from s2python.frbc import FRBCOperationMode, FRBCOperationModeElement
+from s2python.range_pool import RangePool
+from s2python.s2_validation_error import S2ValidationError
+
+
+def example_element(index: int) -> FRBCOperationModeElement:
+    power_range = PowerRange(start_of_range=0, end_of_range=1000, commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1)
+    return FRBCOperationModeElement(
+        fill_level_range=NumberRange(start_of_range=index, end_of_range=index + 1),
+        fill_rate=NumberRange(start_of_range=1.0, end_of_range=1.0),
+        power_ranges=[power_range],
+    )
+
+
+def example_operation_mode() -> FRBCOperationMode:
+    elements = [example_element(index) for index in range(3)]
+    return FRBCOperationMode(id=uuid.uuid4(), abnormal_condition_only=False, elements=elements)
+
+
+class RangePoolTest(TestCase):
+    def test__intern_ranges__shared(self):
+        # Arrange
+        pool = RangePool()
+        first = example_operation_mode()
+        second = example_operation_mode()
+        original = first.model_copy(deep=True)
+
+        # Act
+        pool.intern_ranges(first)
+        pool.intern_ranges(second)
+
+        # Assert
+        self.assertEqual(len(pool), 5)
+        self.assertIs(first.elements[0].fill_rate, first.elements[1].fill_rate)
+        self.assertIs(first.elements[2].fill_level_range, second.elements[2].fill_level_range)
+        self.assertIs(first.elements[0].power_ranges[0], second.elements[0].power_ranges[0])
+        self.assertTrue(first.elements[0].fill_rate.is_frozen)
+        self.assertEqual(first, original)
+        self.assertEqual(first.to_json(), original.to_json())
+
+    def test__intern_ranges__shared_ranges_immutable(self):
+        # Arrange
+        operation_mode = RangePool().intern_ranges(example_operation_mode())
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            operation_mode.elements[0].fill_rate.end_of_range = 2.0
+        operation_mode.elements[0].fill_rate = NumberRange(start_of_range=1.0, end_of_range=2.0)
+        self.assertEqual(operation_mode.elements[1].fill_rate.end_of_range, 1.0)
+
+    def test__intern__frozen_range(self):
+        # Arrange
+        pool = RangePool()
+        number_range = NumberRange(start_of_range=1.0, end_of_range=2.0)
+
+        # Act
+        shared = pool.intern(number_range)
+
+        # Assert
+        self.assertIs(pool.intern(shared), shared)
+        self.assertIs(pool.intern(number_range.frozen()), shared)
+        self.assertEqual(len(pool), 1)
@@ -0,0 +1,56 @@
+import uuid
+from unittest import TestCase
+
+from s2python.common import ReceptionStatus, ReceptionStatusValues
+from s2python.json_codec import JSON_CODECS
+from s2python.reception_status_template import PROCESSED_OKAY_LABEL, ReceptionStatusTemplate
+from s2python.s2_validation_error import S2ValidationError
+
+
+class ReceptionStatusTemplateTest(TestCase):
+    def test__render__equals_serialized_message(self):
+        # Arrange
+        subject_message_id = uuid.uuid4()
+        template = ReceptionStatusTemplate(ReceptionStatusValues.OK, PROCESSED_OKAY_LABEL)
+
+        # Act
+        rendered = template.render(subject_message_id)
+
+        # Assert
+        expected = ReceptionStatus(
+            subject_message_id=subject_message_id,
+            status=ReceptionStatusValues.OK,
+            diagnostic_label=PROCESSED_OKAY_LABEL,
+        ).to_json()
+        self.assertEqual(rendered, expected)
+        self.assertEqual(template.render_bytes(subject_message_id), expected.encode("utf-8"))
+
+    def test__render__json_codecs(self):
+        for codec in JSON_CODECS.values():
+            with self.subTest(codec=codec.name):
+                # Arrange
+                subject_message_id = uuid.uuid4()
+                template = ReceptionStatusTemplate(ReceptionStatusValues.OK, json_codec=codec)
+
+                # Act
+                rendered = template.render(subject_message_id)
+
+                # Assert
+                expected = ReceptionStatus(
+                    subject_message_id=subject_message_id, status=ReceptionStatusValues.OK
+                ).to_json(codec)
+                self.assertEqual(rendered, expected)
+
+    def test__matches(self):
+        # Arrange
+        template = ReceptionStatusTemplate(ReceptionStatusValues.OK, PROCESSED_OKAY_LABEL)
+
+        # Act / Assert
+        self.assertTrue(template.matches(ReceptionStatusValues.OK, PROCESSED_OKAY_LABEL))
+        self.assertFalse(template.matches(ReceptionStatusValues.OK, None))
+        self.assertFalse(template.matches(ReceptionStatusValues.PERMANENT_ERROR, PROCESSED_OKAY_LABEL))
+
+    def test__init__invalid_status(self):
+        # Arrange / Act / Assert
+        with self.assertRaises(S2ValidationError):
+            ReceptionStatusTemplate("NOT_A_STATUS")  # type: ignore[arg-type]
@@ -0,0 +1,227 @@
+import datetime
+import gc
+import uuid
+from unittest import TestCase
+
+from s2python.common import (
+    Commodity,
+    CommodityQuantity,
+    Duration,
+    NumberRange,
+    PowerRange,
+    Timer,
+    Transition,
+)
+from s2python.frbc import (
+    FRBCActuatorDescription,
+    FRBCOperationMode,
+    FRBCOperationModeElement,
+    FRBCStorageDescription,
+    FRBCSystemDescription,
+)
+from s2python.ombc import OMBCOperationMode, OMBCSystemDescription
+from s2python import reference_index as reference_index_module
+from s2python.reference_index import reference_index
+from s2python.s2_validation_error import S2ValidationError
+
+VALID_FROM = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def example_operation_mode() -> FRBCOperationMode:
+    return FRBCOperationMode(
+        id=uuid.uuid4(),
+        abnormal_condition_only=False,
+        elements=[
+            FRBCOperationModeElement(
+                fill_level_range=NumberRange(start_of_range=0.0, end_of_range=100.0),
+                fill_rate=NumberRange(start_of_range=1.0, end_of_range=1.0),
+                power_ranges=[
+                    PowerRange(
+                        start_of_range=100.0,
+                        end_of_range=100.0,
+                        commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1,
+                    )
+                ],
+            )
+        ],
+    )
+
+
+def example_transition(from_: uuid.UUID, to: uuid.UUID, timer: Timer) -> Transition:
+    return Transition(
+        id=uuid.uuid4(),
+        from_=from_,
+        to=to,
+        start_timers=[timer.id],
+        blocking_timers=[],
+        transition_duration=Duration.from_milliseconds(0),
+        abnormal_condition_only=False,
+    )
+
+
+def example_actuator() -> FRBCActuatorDescription:
+    on, off = example_operation_mode(), example_operation_mode()
+    timer = Timer(id=uuid.uuid4(), duration=Duration.from_milliseconds(1000))
+    return FRBCActuatorDescription(
+        id=uuid.uuid4(),
+        operation_modes=[on, off],
+        transitions=[example_transition(on.id, off.id, timer), example_transition(off.id, on.id, timer)],
+        timers=[timer],
+        supported_commodities=[Commodity.ELECTRICITY],
+    )
+
+
+def example_system_description() -> FRBCSystemDescription:
+    return FRBCSystemDescription(
+        message_id=uuid.uuid4(),
+        valid_from=VALID_FROM,
+        actuators=[example_actuator(), example_actuator()],
+        storage=FRBCStorageDescription(
+            provides_leakage_behaviour=False,
+            provides_fill_level_target_profile=False,
+            provides_usage_forecast=False,
+            fill_level_range=NumberRange(start_of_range=0.0, end_of_range=100.0),
+        ),
+    )
+
+
+class ReferenceIndexTest(TestCase):
+    def test__lookups__system_description(self):
+        # Arrange
+        system_description = example_system_description()
+        actuator = system_description.actuators[1]
+        on, off = actuator.operation_modes
+
+        # Act
+        found_actuator = system_description.get_actuator(actuator.id)
+        found_operation_mode = system_description.get_operation_mode(off.id)
+        found_timer = system_description.get_timer(actuator.timers[0].id)
+        found_transition = system_description.get_transition(actuator.transitions[0].id)
+
+        # Assert
+        self.assertIs(found_actuator, actuator)
+        self.assertIs(found_operation_mode, off)
+        self.assertIs(found_timer, actuator.timers[0])
+        self.assertIs(found_transition, actuator.transitions[0])
+        self.assertEqual(system_description.transitions_from(on.id), [actuator.transitions[0]])
+        self.assertEqual(system_description.transitions_to(on.id), [actuator.transitions[1]])
+        self.assertIs(actuator.get_operation_mode(on.id), on)
+
+    def test__lookups__unknown_id(self):
+        # Arrange
+        system_description = example_system_description()
+        unknown_id = uuid.uuid4()
+
+        # Act / Assert
+        self.assertIsNone(system_description.get_actuator(unknown_id))
+        self.assertIsNone(system_description.get_operation_mode(unknown_id))
+        self.assertIsNone(system_description.get_timer(unknown_id))
+        self.assertEqual(system_description.transitions_from(unknown_id), [])
+
+    def test__lookups__ombc_system_description(self):
+        # Arrange
+        operation_mode = OMBCOperationMode(
+            id=uuid.uuid4(),
+            power_ranges=[
+                PowerRange(
+                    start_of_range=0.0,
+                    end_of_range=100.0,
+                    commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1,
+                )
+            ],
+            abnormal_condition_only=False,
+        )
+        timer = Timer(id=uuid.uuid4(), duration=Duration.from_milliseconds(1000))
+        transition = example_transition(operation_mode.id, operation_mode.id, timer)
+        system_description = OMBCSystemDescription(
+            message_id=uuid.uuid4(),
+            valid_from=VALID_FROM,
+            operation_modes=[operation_mode],
+            transitions=[transition],
+            timers=[timer],
+        )
+
+        # Act / Assert
+        self.assertIs(system_description.get_operation_mode(operation_mode.id), operation_mode)
+        self.assertIs(system_description.get_timer(timer.id), timer)
+        self.assertEqual(system_description.transitions_from(operation_mode.id), [transition])
+
+    def test__assignment__rebuilds_index(self):
+        # Arrange
+        system_description = example_system_description()
+        actuator = system_description.actuators[0]
+        on, off = actuator.operation_modes
+        system_description.transitions_to(on.id)
+        new_timer = Timer(id=uuid.uuid4(), duration=Duration.from_milliseconds(500))
+
+        # Act
+        actuator.transitions[0].to = on.id
+        actuator.timers = [actuator.timers[0], new_timer]
+
+        # Assert
+        self.assertEqual(system_description.transitions_to(on.id), actuator.transitions)
+        self.assertEqual(system_description.transitions_to(off.id), [])
+        self.assertIs(system_description.get_timer(new_timer.id), new_timer)
+
+    def test__assignment__only_rebuilds_containing_indexes(self):
+        # Arrange
+        system_description = example_system_description()
+        changed_actuator, other_actuator = system_description.actuators
+        other_index = reference_index(other_actuator)
+        operation_mode = changed_actuator.operation_modes[0]
+        old_id = operation_mode.id
+        system_description.get_operation_mode(old_id)
+
+        # Act
+        operation_mode.diagnostic_label = "Not an id"
+        unchanged_index = reference_index(changed_actuator)
+        operation_mode.id = uuid.uuid4()
+
+        # Assert
+        self.assertIs(reference_index(other_actuator), other_index)
+        self.assertIsNot(reference_index(changed_actuator), unchanged_index)
+        self.assertIsNone(system_description.get_operation_mode(old_id))
+        self.assertIs(system_description.get_operation_mode(operation_mode.id), operation_mode)
+
+    def test__finalized__forgets_memberships(self):
+        # pylint: disable=protected-access
+        # Arrange
+        system_description = example_system_description()
+        system_description_id = id(system_description)
+        transition = system_description.actuators[0].transitions[0]
+        system_description.get_transition(transition.id)
+
+        # Act
+        del system_description
+        gc.collect()
+
+        # Assert
+        self.assertNotIn(system_description_id, reference_index_module._INDEXES)
+        self.assertNotIn(
+            system_description_id, reference_index_module._CONTAINING_INDEXES.get(id(transition), set())
+        )
+
+    def test__assignment__validators_use_current_index(self):
+        # Arrange
+        actuator = example_actuator()
+        timer = actuator.timers[0]
+        actuator.get_timer(timer.id)
+
+        # Act / Assert
+        # With the index from before the assignment the timer would still be found.
+        with self.assertRaises(S2ValidationError):
+            actuator.timers = []
+
+    def test__deferred_validation__restored_index(self):
+        # Arrange
+        actuator = example_actuator()
+        timer = actuator.timers[0]
+
+        # Act
+        with self.assertRaises(S2ValidationError):
+            with actuator.deferred_validation():
+                actuator.timers = []
+                self.assertIsNone(actuator.get_timer(timer.id))
+
+        # Assert
+        self.assertIs(actuator.get_timer(timer.id), timer)
@@ -0,0 +1,113 @@
+import uuid
+import zlib
+from unittest import TestCase
+
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+
+from s2python.common import ReceptionStatus, ReceptionStatusValues
+from s2python.s2_compression import DeflateOptions, build_s2_dictionary
+from s2python.s2_parser import S2Parser
+from s2python.s2_validation_error import S2ValidationError
+from s2python.wire_codec import WIRE_CODECS, ZlibDictionaryWireCodec
+
+
+def example_reception_status() -> ReceptionStatus:
+    return ReceptionStatus(
+        subject_message_id=uuid.uuid4(), status=ReceptionStatusValues.OK, diagnostic_label="Processed okay."
+    )
+
+
+class DeflateOptionsTest(TestCase):
+    def test__client_extension_factory(self):
+        # Arrange
+        options = DeflateOptions(
+            level=9, client_max_window_bits=12, server_max_window_bits=10, server_no_context_takeover=True
+        )
+
+        # Act
+        factory = options.client_extension_factory()
+
+        # Assert
+        self.assertIsInstance(factory, ClientPerMessageDeflateFactory)
+        self.assertEqual(
+            factory.get_request_params(),
+            [
+                ("server_no_context_takeover", None),
+                ("server_max_window_bits", "10"),
+                ("client_max_window_bits", "12"),
+            ],
+        )
+
+
+class BuildS2DictionaryTest(TestCase):
+    def test__build_s2_dictionary__schema(self):
+        # Arrange / Act
+        dictionary = build_s2_dictionary()
+
+        # Assert
+        self.assertEqual(dictionary, build_s2_dictionary())
+        self.assertIn(b'"message_type":"ReceptionStatus","subject_message_id":', dictionary)
+        self.assertIn(b'"ELECTRIC.POWER.L1"', dictionary)
+        self.assertIn(b'"from":', dictionary)
+
+    def test__build_s2_dictionary__samples_last(self):
+        # Arrange
+        sample = example_reception_status().to_json_bytes()
+
+        # Act
+        dictionary = build_s2_dictionary([sample], max_size=1000)
+
+        # Assert
+        self.assertEqual(len(dictionary), 1000)
+        self.assertTrue(dictionary.endswith(sample))
+
+
+class ZlibDictionaryWireCodecTest(TestCase):
+    def test__encode__roundtrip(self):
+        for inner in [None] + list(WIRE_CODECS.values()):
+            with self.subTest(inner=None if inner is None else inner.name):
+                # Arrange
+                codec = ZlibDictionaryWireCodec(inner)
+                message = example_reception_status()
+
+                # Act
+                parsed = S2Parser(wire_codec=codec).parse(codec.encode(message))
+
+                # Assert
+                self.assertEqual(parsed, message)
+
+    def test__encode__smaller_than_without_dictionary(self):
+        # Arrange
+        codec = ZlibDictionaryWireCodec()
+        message_json = example_reception_status().to_json_bytes()
+
+        # Act
+        encoded = codec.encode(example_reception_status())
+
+        # Assert
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self.assertLess(len(encoded), len(compressor.compress(message_json) + compressor.flush()) * 0.7)
+
+    def test__subprotocol__depends_on_dictionary(self):
+        # Arrange / Act
+        codec = ZlibDictionaryWireCodec()
+        other_codec = ZlibDictionaryWireCodec(dictionary=build_s2_dictionary([b"sample"]))
+
+        # Assert
+        self.assertEqual(codec.name, "json+zlib")
+        self.assertTrue(codec.subprotocol.startswith("s2.json.zlib-"))
+        self.assertEqual(codec.subprotocol, ZlibDictionaryWireCodec().subprotocol)
+        self.assertNotEqual(codec.subprotocol, other_codec.subprotocol)
+
+    def test__decode__invalid_data(self):
+        # Arrange
+        codec = ZlibDictionaryWireCodec(max_message_size=100)
+        parser = S2Parser(wire_codec=codec)
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            parser.parse(b"\xff\xff\xff")
+        with self.assertRaises(S2ValidationError):
+            parser.parse(codec.encode(example_reception_status())[:-3])
+        with self.assertRaises(S2ValidationError):
+            parser.parse(codec.dumps({"diagnostic_label": "x" * 200}))
@@ -1,3 +1,530 @@
+import asyncio
+import json
+import uuid
+from typing import Any, List, Union
+from unittest import IsolatedAsyncioTestCase, skipUnless
+from unittest.mock import AsyncMock, patch
+
+import websockets
+
+from s2python.common import (
+    EnergyManagementRole,
+    Duration,
+    Handshake,
+    PowerMeasurement,
+    ReceptionStatus,
+    ReceptionStatusValues,
+)
+from s2python.s2_compression import DeflateOptions
+from s2python.s2_connection import S2Connection, AssetDetails
+from s2python.s2_parse_cache import S2ParseCache
+from s2python.s2_publisher import ChangeTolerance
+from s2python.wire_codec import WIRE_CODECS, get_wire_codec
+
+# pylint: disable=protected-access
+
+
+class FakeWebsocket:
+    """Stand-in for a websockets connection which replays a fixed list of frames.
+
+    A list of frames is replayed as the fragments of a single message.
+    """
+
+    def __init__(self, frames: List[Any]):
+        self.frames = list(frames)
+        self.decode_args: List[Union[bool, None]] = []
+        self.sent: List[Any] = []
+
+    async def recv(self, decode=None):
+        self.decode_args.append(decode)
+        if not self.frames:
+            raise websockets.ConnectionClosedOK(None, None)
+        frame = self.frames.pop(0)
+        return frame[0][:0].join(frame) if isinstance(frame, list) else frame
+
+    async def recv_streaming(self, decode=None):
+        self.decode_args.append(decode)
+        if not self.frames:
+            raise websockets.ConnectionClosedOK(None, None)
+        frame = self.frames.pop(0)
+        for fragment in frame if isinstance(frame, list) else [frame]:
+            yield fragment
+
+    async def __aiter__(self):
+        try:
+            while True:
+                yield await self.recv()
+        except websockets.ConnectionClosedOK:
+            return
+
+    async def send(self, message):
+        self.sent.append(message if isinstance(message, (str, bytes)) else list(message))
+
+
+def create_connection(**kwargs) -> S2Connection:
+    return S2Connection(
+        url="ws://localhost",
+        role=EnergyManagementRole.RM,
+        control_types=[],
+        asset_details=AssetDetails(
+            resource_id=uuid.uuid4(),
+            provides_forecast=False,
+            provides_power_measurements=[],
+            instruction_processing_delay=Duration.from_milliseconds(1),
+            roles=[],
+        ),
+        **kwargs,
+    )
+
+
+HANDSHAKE_JSON = (
+    '{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "Handshake", "role": '
+    '"CEM", "supported_protocol_versions": ["3.0alpha"]}'
+)
+
+
+class S2ConnectionReceiveTest(IsolatedAsyncioTestCase):
+    async def test__receive_messages__decoded_frames(self):
+        # Arrange
+        connection = create_connection()
+        connection.ws = FakeWebsocket([HANDSHAKE_JSON])  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        received = connection._received_messages.get_nowait()
+        self.assertIsInstance(received, Handshake)
+        self.assertEqual(connection.ws.decode_args, [None, None])  # type: ignore[union-attr]
+
+    async def test__receive_messages__raw_bytes_frames(self):
+        # Arrange
+        connection = create_connection(decode_frames=False)
+        connection.ws = FakeWebsocket([HANDSHAKE_JSON.encode("utf-8")])  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        received = connection._received_messages.get_nowait()
+        self.assertIsInstance(received, Handshake)
+        self.assertEqual(received.message_id, uuid.UUID("ca093515-0bb3-4709-bd56-092c1808b791"))
+        self.assertEqual(connection.ws.decode_args, [False, False])  # type: ignore[union-attr]
+
+    async def test__receive_messages__invalid_message_reply(self):
+        # Arrange
+        connection = create_connection(decode_frames=False)
+        connection.ws = FakeWebsocket(  # type: ignore[assignment]
+            [b'{"message_type": "Handshake", "message_id": "ca093515-0bb3-4709-bd56-092c1808b791"}']
+        )
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        self.assertTrue(connection._received_messages.empty())
+        reply = json.loads(connection.ws.sent[0])  # type: ignore[union-attr]
+        self.assertEqual(reply["subject_message_id"], "ca093515-0bb3-4709-bd56-092c1808b791")
+        self.assertEqual(reply["status"], "INVALID_MESSAGE")
+
+    async def test__receive_messages__oversized_frame(self):
+        # Arrange
+        connection = create_connection(max_frame_size=50)
+        connection.ws = FakeWebsocket([HANDSHAKE_JSON])  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        self.assertTrue(connection._received_messages.empty())
+        self.assertEqual(connection.rejected_frames.oversized, 1)
+        reply = json.loads(connection.ws.sent[0])  # type: ignore[union-attr]
+        self.assertEqual(reply["subject_message_id"], "ca093515-0bb3-4709-bd56-092c1808b791")
+        self.assertEqual(reply["status"], "INVALID_MESSAGE")
+
+    async def test__receive_messages__oversized_frame_in_bytes(self):
+        # Arrange
+        message = HANDSHAKE_JSON[:-1] + ', "label": "' + "\u00e9" * 20 + '"}'
+        connection = create_connection(max_frame_size=len(message))
+        connection.ws = FakeWebsocket([message])  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        self.assertEqual(connection.rejected_frames.oversized, 1)
+
+    async def test__receive_messages__small_text_frame_not_encoded(self):
+        # Arrange
+        class CountingStr(str):
+            encoded = 0
+
+            def encode(self, *args: Any, **kwargs: Any) -> bytes:
+                CountingStr.encoded += 1
+                return super().encode(*args, **kwargs)
+
+        connection = create_connection(max_frame_size=len(HANDSHAKE_JSON) * 4)
+        connection.ws = FakeWebsocket([CountingStr(HANDSHAKE_JSON)])  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        self.assertEqual(CountingStr.encoded, 0)
+        self.assertEqual(connection.rejected_frames.oversized, 0)
+
+    async def test__receive_messages__truncated_diagnostic_label(self):
+        # Arrange
+        connection = create_connection(max_diagnostic_length=20)
+        connection.ws = FakeWebsocket(  # type: ignore[assignment]
+            ['{"message_type": "Handshake", "message_id": "ca093515-0bb3-4709-bd56-092c1808b791"}']
+        )
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        reply = json.loads(connection.ws.sent[0])  # type: ignore[union-attr]
+        self.assertEqual(len(reply["diagnostic_label"]), 20)
+        self.assertTrue(reply["diagnostic_label"].endswith("..."))
+        self.assertEqual(connection.rejected_frames.invalid_message, 1)
+
+    async def test__receive_messages__error_replies_rate_limited(self):
+        # Arrange
+        connection = create_connection(error_reply_rate=0.001, error_reply_burst=2)
+        connection.ws = FakeWebsocket(["not json"] * 5)  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        self.assertEqual(len(connection.ws.sent), 2)  # type: ignore[union-attr]
+        self.assertEqual(connection.rejected_frames.invalid_json, 5)
+        self.assertEqual(connection.rejected_frames.suppressed_replies, 3)
+
+
+    async def test__handle_message__invalid_lazy_message(self):
+        # Arrange
+        connection = create_connection(lazy_validation=True)
+        connection.ws = FakeWebsocket([])  # type: ignore[assignment]
+        handled = []
+        connection._handlers.register_handler(
+            PowerMeasurement, lambda _connection, msg, _send_okay: handled.append(msg.values[0])
+        )
+        message = connection.s2_parser.parse(
+            '{"message_type": "PowerMeasurement", "message_id": "ca093515-0bb3-4709-bd56-092c1808b791", '
+            '"measurement_timestamp": "2024-01-01T00:00:00+00:00", '
+            '"values": [{"commodity_quantity": "ELECTRIC.POWER.L1", "value": "not a number"}]}'
+        )
+
+        # Act
+        await connection._handlers.handle_message(connection, message)
+
+        # Assert
+        self.assertEqual(handled, [])
+        self.assertEqual(connection.rejected_frames.invalid_message, 1)
+        reply = json.loads(connection.ws.sent[0])  # type: ignore[union-attr]
+        self.assertEqual(reply["subject_message_id"], "ca093515-0bb3-4709-bd56-092c1808b791")
+        self.assertEqual(reply["status"], "INVALID_DATA")
+
+
+    async def test__handle_message__parse_cache_hit(self):
+        # Arrange
+        connection = create_connection(parse_cache=S2ParseCache(min_message_size=0))
+        message_ids = ["ca093515-0bb3-4709-bd56-092c1808b791", "0a5d7ee4-4b2a-4d2a-9a38-d3a0c1cb1a4f"]
+        connection.ws = FakeWebsocket(  # type: ignore[assignment]
+            [
+                f'{{"message_type": "PowerMeasurement", "message_id": "{message_id}", '
+                '"measurement_timestamp": "2024-01-01T00:00:00+00:00", '
+                '"values": [{"commodity_quantity": "ELECTRIC.POWER.L1", "value": 10.0}]}'
+                for message_id in message_ids
+            ]
+        )
+        connection._received_messages = asyncio.Queue()
+        handled = []
+
+        async def handle_power_measurement(_connection, msg, send_okay):
+            handled.append(msg)
+            await send_okay
+
+        connection._handlers.register_handler(PowerMeasurement, handle_power_measurement)
+        await connection._receive_messages()
+
+        # Act
+        while not connection._received_messages.empty():
+            await connection._handlers.handle_message(connection, connection._received_messages.get_nowait())
+
+        # Assert
+        self.assertEqual(connection.s2_parser.cache.stats.hits, 1)  # type: ignore[union-attr]
+        self.assertEqual([str(msg.message_id) for msg in handled], message_ids)
+        replies = [json.loads(reply) for reply in connection.ws.sent]  # type: ignore[union-attr]
+        self.assertEqual([reply["subject_message_id"] for reply in replies], message_ids)
+        self.assertEqual([reply["status"] for reply in replies], ["OK", "OK"])
+
+
+class S2ConnectionReplyTest(IsolatedAsyncioTestCase):
+    async def test__respond_with_reception_status__ok_template(self):
+        # Arrange
+        connection = create_connection()
+        connection.ws = FakeWebsocket([])  # type: ignore[assignment]
+        subject_message_id = uuid.uuid4()
+
+        # Act
+        await connection._respond_with_reception_status(
+            subject_message_id, ReceptionStatusValues.OK, "Processed okay."
+        )
+        await connection._respond_with_reception_status(
+            subject_message_id, ReceptionStatusValues.PERMANENT_ERROR, "Failed."
+        )
+
+        # Assert
+        self.assertEqual(
+            connection.ws.sent,  # type: ignore[union-attr]
+            [
+                ReceptionStatus(
+                    subject_message_id=subject_message_id,
+                    status=ReceptionStatusValues.OK,
+                    diagnostic_label="Processed okay.",
+                ).to_json(),
+                ReceptionStatus(
+                    subject_message_id=subject_message_id,
+                    status=ReceptionStatusValues.PERMANENT_ERROR,
+                    diagnostic_label="Failed.",
+                ).to_json(),
+            ],
+        )
+
+    async def test__send_and_forget__binary_frames(self):
+        # Arrange
+        connection = create_connection(binary_frames=True)
+        connection.ws = FakeWebsocket([])  # type: ignore[assignment]
+        subject_message_id = uuid.uuid4()
+        handshake = Handshake.from_json(HANDSHAKE_JSON)
+
+        # Act
+        await connection._send_and_forget(handshake)
+        await connection._respond_with_reception_status(
+            subject_message_id, ReceptionStatusValues.OK, "Processed okay."
+        )
+
+        # Assert
+        self.assertEqual(
+            connection.ws.sent,  # type: ignore[union-attr]
+            [
+                handshake.to_json().encode("utf-8"),
+                ReceptionStatus(
+                    subject_message_id=subject_message_id,
+                    status=ReceptionStatusValues.OK,
+                    diagnostic_label="Processed okay.",
+                ).to_json().encode("utf-8"),
+            ],
+        )
+
+    async def test__send_and_forget__fragments(self):
+        # Arrange
+        connection = create_connection(fragment_size=16)
+        connection.ws = FakeWebsocket([])  # type: ignore[assignment]
+        handshake = Handshake.from_json(HANDSHAKE_JSON)
+
+        # Act
+        await connection._send_and_forget(handshake)
+
+        # Assert
+        (fragments,) = connection.ws.sent  # type: ignore[union-attr]
+        self.assertGreater(len(fragments), 1)
+        self.assertTrue(all(isinstance(fragment, str) for fragment in fragments))
+        self.assertEqual("".join(fragments), handshake.to_json())
+
+    async def test__send_and_forget__single_fragment(self):
+        # Arrange
+        connection = create_connection(fragment_size=1024, binary_frames=True)
+        connection.ws = FakeWebsocket([])  # type: ignore[assignment]
+        handshake = Handshake.from_json(HANDSHAKE_JSON)
+
+        # Act
+        await connection._send_and_forget(handshake)
+
+        # Assert
+        self.assertEqual(connection.ws.sent, [handshake.to_json_bytes()])  # type: ignore[union-attr]
+
+
+class S2ConnectionFragmentedReceiveTest(IsolatedAsyncioTestCase):
+    async def test__receive_messages__fragmented_message(self):
+        # Arrange
+        connection = create_connection(max_frame_size=1024)
+        connection.ws = FakeWebsocket([[HANDSHAKE_JSON[:40], HANDSHAKE_JSON[40:]]])  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        await connection._receive_messages()
+
+        # Assert
+        self.assertEqual(connection._received_messages.get_nowait(), Handshake.from_json(HANDSHAKE_JSON))
+
+    async def test__receive_messages__oversized_fragmented_message(self):
+        # Arrange
+        connection = create_connection(max_frame_size=50, decode_frames=False)
+        fragments = [fragment.encode("utf-8") for fragment in (HANDSHAKE_JSON[:60], HANDSHAKE_JSON[60:])]
+        connection.ws = FakeWebsocket([fragments, HANDSHAKE_JSON.encode("utf-8")])  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        frames = [frame async for frame in connection._receive_frames()]
+
+        # Assert
+        self.assertEqual(frames, [fragments[0], HANDSHAKE_JSON.encode("utf-8")])
+        self.assertEqual(connection.ws.decode_args, [False, False, False])  # type: ignore[union-attr]
+
+
+@skipUnless("msgpack" in WIRE_CODECS, "msgpack is not installed")
+class S2ConnectionWireCodecTest(IsolatedAsyncioTestCase):
+    async def test__select_wire_codec__none_selected(self):
+        # Arrange
+        connection = create_connection(wire_codecs=[get_wire_codec("msgpack")])
+        connection.ws = FakeWebsocket([])  # type: ignore[assignment]
+        handshake = Handshake.from_json(HANDSHAKE_JSON)
+
+        # Act
+        connection._select_wire_codec(None)
+        await connection._send_and_forget(handshake)
+
+        # Assert
+        self.assertIsNone(connection.s2_parser.wire_codec)
+        self.assertEqual(connection.ws.sent, [handshake.to_json()])  # type: ignore[union-attr]
+
+    async def test__send_and_receive__msgpack(self):
+        # Arrange
+        codec = get_wire_codec("msgpack")
+        connection = create_connection(wire_codecs=[codec])
+        handshake = Handshake.from_json(HANDSHAKE_JSON)
+        connection.ws = FakeWebsocket([codec.encode(handshake)])  # type: ignore[assignment]
+        connection._received_messages = asyncio.Queue()
+        subject_message_id = uuid.uuid4()
+
+        # Act
+        connection._select_wire_codec("s2.msgpack")
+        await connection._receive_messages()
+        await connection._respond_with_reception_status(
+            subject_message_id, ReceptionStatusValues.OK, "Processed okay."
+        )
+
+        # Assert
+        self.assertEqual(connection._received_messages.get_nowait(), handshake)
+        reply = codec.decode(connection.ws.sent[0])  # type: ignore[union-attr]
+        self.assertEqual(reply["subject_message_id"], str(subject_message_id))
+        self.assertEqual(reply["status"], "OK")
+
+    async def test__receive_messages__msgpack_invalid_message_reply(self):
+        # Arrange
+        codec = get_wire_codec("msgpack")
+        connection = create_connection(wire_codecs=[codec])
+        connection.ws = FakeWebsocket(  # type: ignore[assignment]
+            [codec.dumps({"message_type": "Handshake", "message_id": "ca093515-0bb3-4709-bd56-092c1808b791"})]
+        )
+        connection._received_messages = asyncio.Queue()
+
+        # Act
+        connection._select_wire_codec("s2.msgpack")
+        await connection._receive_messages()
+
+        # Assert
+        self.assertTrue(connection._received_messages.empty())
+        reply = codec.decode(connection.ws.sent[0])  # type: ignore[union-attr]
+        self.assertEqual(reply["subject_message_id"], "ca093515-0bb3-4709-bd56-092c1808b791")
+        self.assertEqual(reply["status"], "INVALID_MESSAGE")
+
+
+class S2ConnectionConnectTest(IsolatedAsyncioTestCase):
+    async def test__connect_ws__compression_default(self):
+        # Arrange
+        connection = create_connection()
+
+        # Act
+        with patch("s2python.s2_connection.ws_connect", new=AsyncMock()) as ws_connect:
+            await connection._connect_ws()
+
+        # Assert
+        self.assertNotIn("compression", ws_connect.call_args.kwargs)
+        self.assertNotIn("extensions", ws_connect.call_args.kwargs)
+
+    async def test__connect_ws__max_frame_size(self):
+        # Arrange
+        connection = create_connection(max_frame_size=1024)
+
+        # Act
+        with patch("s2python.s2_connection.ws_connect", new=AsyncMock()) as ws_connect:
+            await connection._connect_ws()
+
+        # Assert
+        self.assertEqual(ws_connect.call_args.kwargs["max_size"], 1024)
+
+    async def test__connect_ws__compression_disabled(self):
+        # Arrange
+        connection = create_connection(compression=False)
+
+        # Act
+        with patch("s2python.s2_connection.ws_connect", new=AsyncMock()) as ws_connect:
+            await connection._connect_ws()
+
+        # Assert
+        self.assertIsNone(ws_connect.call_args.kwargs["compression"])
+
+    async def test__connect_ws__deflate_options(self):
+        # Arrange
+        connection = create_connection(compression=DeflateOptions(client_no_context_takeover=True))
+
+        # Act
+        with patch("s2python.s2_connection.ws_connect", new=AsyncMock()) as ws_connect:
+            await connection._connect_ws()
+
+        # Assert
+        (extension,) = ws_connect.call_args.kwargs["extensions"]
+        self.assertIn(("client_no_context_takeover", None), extension.get_request_params())
+
+
+class S2ConnectionPublishTest(IsolatedAsyncioTestCase):
+    async def test__publish_msg_async__unchanged_not_sent(self):
+        # Arrange
+        connection = create_connection(change_tolerances={ReceptionStatus: ChangeTolerance()})
+        subject_message_id = uuid.uuid4()
+        reception_status = ReceptionStatus(subject_message_id=subject_message_id, status=ReceptionStatusValues.OK)
+        send = AsyncMock(return_value=reception_status)
+
+        # Act
+        with patch.object(connection, "_send_msg_and_await_reception_status_async", new=send):
+            first = await connection._publish_msg_async(reception_status)
+            second = await connection._publish_msg_async(
+                ReceptionStatus(subject_message_id=subject_message_id, status=ReceptionStatusValues.OK)
+            )
+
+        # Assert
+        self.assertIs(first, reception_status)
+        self.assertIsNone(second)
+        send.assert_awaited_once()
+
+    async def test__publish_msg_async__not_ok_sent_again(self):
+        # Arrange
+        connection = create_connection(change_tolerances={ReceptionStatus: ChangeTolerance()})
+        reception_status = ReceptionStatus(subject_message_id=uuid.uuid4(), status=ReceptionStatusValues.INVALID_DATA)
+        send = AsyncMock(return_value=reception_status)
+
+        # Act
+        with patch.object(connection, "_send_msg_and_await_reception_status_async", new=send):
+            await connection._publish_msg_async(reception_status, raise_on_error=False)
+            await connection._publish_msg_async(reception_status, raise_on_error=False)
+
+        # Assert
+        self.assertEqual(send.await_count, 2)
+
+
 # import unittest
 #
 #
@@ -0,0 +1,103 @@
+import json
+from unittest import TestCase
+
+from s2python.s2_envelope import S2Envelope, scan_envelope
+
+
+RECEPTION_STATUS_JSON = (
+    '{"message_type": "ReceptionStatus", "message_id": "ca093515-0bb3-4709-bd56-092c1808b791", '
+    '"subject_message_id": "2bdec96b-be3b-4ba9-afa0-c4a0632cced3", "status": "OK"}'
+)
+
+
+class ScanEnvelopeTest(TestCase):
+    def test__scan_envelope__str(self):
+        # Arrange / Act
+        envelope = scan_envelope(RECEPTION_STATUS_JSON)
+
+        # Assert
+        self.assertEqual(
+            envelope,
+            S2Envelope(
+                message_type="ReceptionStatus",
+                message_id="ca093515-0bb3-4709-bd56-092c1808b791",
+                subject_message_id="2bdec96b-be3b-4ba9-afa0-c4a0632cced3",
+            ),
+        )
+
+    def test__scan_envelope__bytes(self):
+        # Arrange / Act
+        envelope = scan_envelope(RECEPTION_STATUS_JSON.encode())
+
+        # Assert
+        self.assertEqual(envelope, scan_envelope(RECEPTION_STATUS_JSON))
+
+    def test__scan_envelope__dict(self):
+        # Arrange / Act
+        envelope = scan_envelope(json.loads(RECEPTION_STATUS_JSON))
+
+        # Assert
+        self.assertEqual(envelope, scan_envelope(RECEPTION_STATUS_JSON))
+
+    def test__scan_envelope__only_requested_fields(self):
+        # Arrange / Act
+        envelope = scan_envelope(RECEPTION_STATUS_JSON, ("message_id",))
+
+        # Assert
+        self.assertEqual(envelope, S2Envelope(message_id="ca093515-0bb3-4709-bd56-092c1808b791"))
+
+    def test__scan_envelope__ignores_nested_keys(self):
+        # Arrange
+        message = (
+            '{"nested": {"message_type": "Handshake", "items": [{"message_id": "a"}]}, "message_type": "PowerMeasurement",'
+            ' "label": "{[", "message_id": "ca093515-0bb3-4709-bd56-092c1808b791"}'
+        )
+
+        # Act
+        envelope = scan_envelope(message)
+
+        # Assert
+        self.assertEqual(
+            envelope,
+            S2Envelope(message_type="PowerMeasurement", message_id="ca093515-0bb3-4709-bd56-092c1808b791"),
+        )
+        self.assertEqual(scan_envelope(message.encode()), envelope)
+
+    def test__scan_envelope__only_nested_key(self):
+        # Arrange / Act
+        envelope = scan_envelope('{"nested": {"message_type": "Handshake"}}')
+
+        # Assert
+        self.assertEqual(envelope, S2Envelope())
+
+    def test__scan_envelope__ignores_keys_inside_strings(self):
+        # Arrange
+        message_json = json.dumps(
+            {
+                "diagnostic_label": '{"message_type": "Handshake", "message_id": "wrong"}',
+                "message_type": "ReceptionStatus",
+            }
+        )
+
+        # Act
+        envelope = scan_envelope(message_json)
+
+        # Assert
+        self.assertEqual(envelope, S2Envelope(message_type="ReceptionStatus"))
+
+    def test__scan_envelope__escaped_and_non_string_values(self):
+        # Arrange
+        message_json = '{"message_type": "Hand\\u0073hake", "message_id": null}'
+
+        # Act
+        envelope = scan_envelope(message_json)
+
+        # Assert
+        self.assertEqual(envelope, S2Envelope(message_type="Handshake"))
+
+    def test__scan_envelope__no_json(self):
+        # Arrange / Act
+        envelope = scan_envelope(b"\x00\xff not json")
+
+        # Assert
+        self.assertEqual(envelope, S2Envelope())
@@ -0,0 +1,110 @@
+import codecs
+import uuid
+from unittest import TestCase
+
+from s2python.common import Duration, NumberRange, PowerRange, CommodityQuantity
+from s2python.frbc import (
+    FRBCActuatorDescription,
+    FRBCOperationMode,
+    FRBCOperationModeElement,
+    FRBCStorageDescription,
+    FRBCSystemDescription,
+)
+from s2python.s2_json_stream import iter_json_fragments
+
+
+def example_system_description(operation_modes: int) -> FRBCSystemDescription:
+    return FRBCSystemDescription(
+        message_id=uuid.uuid4(),
+        valid_from="2024-01-01T00:00:00+00:00",
+        actuators=[
+            FRBCActuatorDescription(
+                id=uuid.uuid4(),
+                diagnostic_label="Warmtepomp één",
+                supported_commodities=["ELECTRICITY"],
+                operation_modes=[
+                    FRBCOperationMode(
+                        id=uuid.uuid4(),
+                        elements=[
+                            FRBCOperationModeElement(
+                                fill_level_range=NumberRange(start_of_range=0, end_of_range=100),
+                                fill_rate=NumberRange(start_of_range=1, end_of_range=1),
+                                power_ranges=[
+                                    PowerRange(
+                                        start_of_range=index,
+                                        end_of_range=index,
+                                        commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1,
+                                    )
+                                ],
+                            )
+                        ],
+                        abnormal_condition_only=False,
+                    )
+                    for index in range(operation_modes)
+                ],
+                transitions=[],
+                timers=[],
+            )
+        ],
+        storage=FRBCStorageDescription(
+            provides_leakage_behaviour=False,
+            provides_fill_level_target_profile=False,
+            provides_usage_forecast=False,
+            fill_level_range=NumberRange(start_of_range=0, end_of_range=100),
+        ),
+    )
+
+
+class S2JsonStreamTest(TestCase):
+    def test__iter_json_fragments__equal_to_json_bytes(self):
+        # Arrange
+        system_description = example_system_description(20)
+
+        for fragment_size in (1, 3, 100, 1_000_000):
+            with self.subTest(fragment_size=fragment_size):
+                # Act
+                fragments = list(iter_json_fragments(system_description, fragment_size))
+
+                # Assert
+                self.assertEqual(b"".join(fragments), system_description.to_json_bytes())
+                self.assertTrue(all(len(fragment) == fragment_size for fragment in fragments[:-1]))
+
+    def test__iter_json_fragments__incremental_decode(self):
+        # Arrange
+        system_description = example_system_description(2)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        # Act
+        text = "".join(decoder.decode(fragment) for fragment in iter_json_fragments(system_description, 7))
+
+        # Assert
+        self.assertEqual(text, system_description.to_json())
+
+    def test__iter_json_fragments__small_component(self):
+        # Arrange
+        duration = Duration.from_milliseconds(1000)
+
+        # Act
+        fragments = list(iter_json_fragments(duration))
+
+        # Assert
+        self.assertEqual(fragments, [b"1000"])
+
+    def test__iter_json_fragments__sealed(self):
+        # Arrange
+        system_description = example_system_description(5).seal()
+        system_description.message_id = uuid.uuid4()
+
+        # Act
+        fragments = list(iter_json_fragments(system_description, 64))
+
+        # Assert
+        self.assertEqual(b"".join(fragments), system_description.to_json_bytes())
+
+    def test__iter_json_fragments__invalid_fragment_size(self):
+        # Arrange
+        system_description = example_system_description(1)
+
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            next(iter_json_fragments(system_description, 0))
@@ -0,0 +1,162 @@
+import copy
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest import TestCase, skipUnless
+
+from s2python import s2_trusted_validator
+from s2python.common import ReceptionStatus
+from s2python.frbc import FRBCActuatorDescription, FRBCOperationMode, FRBCSystemDescription
+from s2python.s2_lazy_message import LazyS2List, LazyS2Object, lazy_fields_of, model_class_of
+from s2python.s2_parser import S2Parser
+from s2python.s2_validation_error import S2ValidationError
+
+OPERATION_MODE_ID = "2795136c-eb30-4f8a-bdaa-61feba1e71b6"
+TIMER_ID = "e1ff9e58-935b-4765-92e3-5e7679f73eb6"
+
+SYSTEM_DESCRIPTION = {
+    "message_type": "FRBC.SystemDescription",
+    "message_id": "97256813-de70-4640-a992-9ae0b2d8e4d1",
+    "valid_from": "2020-01-01T00:00:00+00:00",
+    "actuators": [
+        {
+            "id": "a1061148-f19e-4b1b-8fe3-b506583ce61e",
+            "supported_commodities": ["ELECTRICITY"],
+            "operation_modes": [
+                {
+                    "id": OPERATION_MODE_ID,
+                    "abnormal_condition_only": False,
+                    "elements": [
+                        {
+                            "fill_level_range": {"start_of_range": 0.0, "end_of_range": 100.0},
+                            "fill_rate": {"start_of_range": 1.0, "end_of_range": 2.0},
+                            "power_ranges": [
+                                {
+                                    "commodity_quantity": "ELECTRIC.POWER.L1",
+                                    "start_of_range": 0.0,
+                                    "end_of_range": 1000.0,
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+            "transitions": [
+                {
+                    "id": "c32cc1d3-4722-41e3-a8de-55307c723611",
+                    "from": OPERATION_MODE_ID,
+                    "to": OPERATION_MODE_ID,
+                    "start_timers": [TIMER_ID],
+                    "blocking_timers": [TIMER_ID],
+                    "transition_duration": 1000,
+                    "abnormal_condition_only": False,
+                }
+            ],
+            "timers": [{"id": TIMER_ID, "duration": 1000}],
+        }
+    ],
+    "storage": {
+        "provides_leakage_behaviour": False,
+        "provides_fill_level_target_profile": False,
+        "provides_usage_forecast": False,
+        "fill_level_range": {"start_of_range": 0.0, "end_of_range": 100.0},
+    },
+}
+
+
+class LazyS2MessageTest(TestCase):
+    def test__lazy_fields_of(self):
+        # Arrange / Act
+        lazy_fields = lazy_fields_of(FRBCActuatorDescription)
+
+        # Assert
+        self.assertEqual(set(lazy_fields), {"operation_modes", "transitions", "timers"})
+        self.assertIs(lazy_fields["operation_modes"], FRBCOperationMode)
+
+    def test__parse_lazy__top_level_fields(self):
+        # Arrange
+        parser = S2Parser(lazy=True)
+
+        # Act
+        message = parser.parse(json.dumps(SYSTEM_DESCRIPTION))
+
+        # Assert
+        assert isinstance(message, LazyS2Object)
+        self.assertIs(message.model_class, FRBCSystemDescription)
+        self.assertIs(model_class_of(message), FRBCSystemDescription)
+        self.assertEqual(message.message_id, uuid.UUID("97256813-de70-4640-a992-9ae0b2d8e4d1"))
+        self.assertEqual(message.valid_from, datetime(2020, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(message.storage.fill_level_range.end_of_range, 100.0)
+
+    def test__parse_lazy__without_nested_lists(self):
+        # Arrange
+        reception_status = {
+            "message_type": "ReceptionStatus",
+            "subject_message_id": "97256813-de70-4640-a992-9ae0b2d8e4d1",
+            "status": "OK",
+        }
+
+        # Act
+        message = S2Parser.parse_as_any_message_lazy(reception_status)
+
+        # Assert
+        self.assertIs(type(message), ReceptionStatus)
+
+    @skipUnless(s2_trusted_validator.SKIPS_VALIDATOR_FUNCTIONS, "Nested objects are validated right away.")
+    def test__parse_lazy__nested_lists_validated_on_access(self):
+        # Arrange
+        raw = copy.deepcopy(SYSTEM_DESCRIPTION)
+        raw["actuators"][0]["operation_modes"][0]["elements"][0]["fill_rate"] = "invalid"  # type: ignore[index]
+        message = S2Parser.parse_as_any_message_lazy(raw)
+        assert isinstance(message, LazyS2Object)
+
+        # Act
+        actuators = message.actuators
+        operation_mode = actuators[0].operation_modes[0]
+
+        # Assert
+        self.assertIsInstance(actuators, LazyS2List)
+        self.assertEqual(len(actuators), 1)
+        self.assertEqual(actuators[0].id, uuid.UUID("a1061148-f19e-4b1b-8fe3-b506583ce61e"))
+        self.assertEqual(operation_mode.id, uuid.UUID(OPERATION_MODE_ID))
+        with self.assertRaises(S2ValidationError):
+            _ = operation_mode.elements[0]
+
+    @skipUnless(s2_trusted_validator.SKIPS_VALIDATOR_FUNCTIONS, "Nested objects are validated right away.")
+    def test__validate_fully__runs_model_validators(self):
+        # Arrange
+        raw = copy.deepcopy(SYSTEM_DESCRIPTION)
+        raw["actuators"][0]["timers"].append({"id": TIMER_ID, "duration": 1000})  # type: ignore[index]
+        message = S2Parser.parse_as_any_message_lazy(raw)
+        assert isinstance(message, LazyS2Object)
+
+        # Act / Assert
+        self.assertEqual(len(message.actuators[0].timers), 2)
+        with self.assertRaises(S2ValidationError):
+            message.validate_fully()
+
+    def test__validate_fully__returns_message(self):
+        # Arrange
+        message = S2Parser.parse_as_any_message_lazy(json.dumps(SYSTEM_DESCRIPTION).encode("utf-8"))
+        assert isinstance(message, LazyS2Object)
+
+        # Act
+        validated = message.validate_fully()
+
+        # Assert
+        self.assertIs(type(validated), FRBCSystemDescription)
+        self.assertEqual(validated, S2Parser.parse_as_any_message(SYSTEM_DESCRIPTION))
+        self.assertEqual(json.loads(message.to_json()), json.loads(validated.to_json()))
+
+    def test__parse_lazy__unknown_type(self):
+        # Arrange / Act / Assert
+        with self.assertRaises(S2ValidationError):
+            S2Parser.parse_as_any_message_lazy('{"message_type": "Unknown"}')
+
+    def test__lazy_object__immutable(self):
+        # Arrange
+        message = S2Parser.parse_as_any_message_lazy(SYSTEM_DESCRIPTION)
+
+        # Act / Assert
+        with self.assertRaises(AttributeError):
+            message.message_id = uuid.uuid4()
@@ -0,0 +1,158 @@
+import uuid
+from typing import Literal
+from unittest import TestCase
+
+from pydantic import ConfigDict
+
+from s2python.common import Handshake, RevokeObject
+from s2python.generated.gen_s2 import RevokeObject as GenRevokeObject
+from s2python.s2_message_handlers import MessageHandlers
+from s2python.s2_message_registry import S2MessageRegistry
+from s2python.s2_parser import DEFAULT_MESSAGE_REGISTRY, TYPE_TO_MESSAGE_CLASS, S2Parser
+from s2python.s2_validation_error import S2ValidationError
+from s2python.validate_values_mixin import S2MessageComponent, catch_and_convert_exceptions
+
+
+@catch_and_convert_exceptions
+class VendorHeartbeat(S2MessageComponent):
+    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+
+    message_type: Literal["Vendor.Heartbeat"] = "Vendor.Heartbeat"
+    message_id: uuid.UUID
+    sequence_number: int
+
+
+HEARTBEAT_JSON = (
+    '{"message_type": "Vendor.Heartbeat", "message_id": "ca093515-0bb3-4709-bd56-092c1808b791", '
+    '"sequence_number": 3}'
+)
+
+
+class S2MessageRegistryTest(TestCase):
+    def test__default_registry__contains_standard_messages(self):
+        # Arrange / Act / Assert
+        self.assertEqual(len(DEFAULT_MESSAGE_REGISTRY), 35)
+        self.assertIn("Handshake", DEFAULT_MESSAGE_REGISTRY)
+        self.assertIs(DEFAULT_MESSAGE_REGISTRY.message_class("Handshake"), Handshake)
+        self.assertTrue(DEFAULT_MESSAGE_REGISTRY.is_registered(Handshake))
+        self.assertFalse(DEFAULT_MESSAGE_REGISTRY.is_registered(GenRevokeObject))
+
+    def test__registry__read_only_mapping(self):
+        # Arrange
+        registry = S2MessageRegistry([Handshake])
+        mapping = dict(registry)
+
+        # Act
+        registry.register(VendorHeartbeat)
+
+        # Assert
+        self.assertEqual(mapping, {"Handshake": Handshake})
+        self.assertEqual(dict(registry), {"Handshake": Handshake, "Vendor.Heartbeat": VendorHeartbeat})
+        self.assertIs(registry["Vendor.Heartbeat"], VendorHeartbeat)
+        self.assertIs(TYPE_TO_MESSAGE_CLASS, DEFAULT_MESSAGE_REGISTRY)
+        self.assertIs(TYPE_TO_MESSAGE_CLASS["RevokeObject"], RevokeObject)
+        with self.assertRaises(TypeError):
+            # pylint: disable-next=unsupported-assignment-operation
+            TYPE_TO_MESSAGE_CLASS["Vendor.Heartbeat"] = VendorHeartbeat  # type: ignore[index]
+
+    def test__register__vendor_message_is_parsed(self):
+        # Arrange
+        registry = S2MessageRegistry(DEFAULT_MESSAGE_REGISTRY.message_classes())
+        parser = S2Parser(registry=registry)
+
+        # Act
+        registry.register(VendorHeartbeat)
+        message = parser.parse(HEARTBEAT_JSON)
+
+        # Assert
+        self.assertEqual(
+            message,
+            VendorHeartbeat(message_id=uuid.UUID("ca093515-0bb3-4709-bd56-092c1808b791"), sequence_number=3),
+        )
+        self.assertIsInstance(S2Parser(trusted=True, registry=registry).parse(HEARTBEAT_JSON), VendorHeartbeat)
+        self.assertIsInstance(S2Parser(lazy=True, registry=registry).parse(HEARTBEAT_JSON), VendorHeartbeat)
+        self.assertNotIn("Vendor.Heartbeat", DEFAULT_MESSAGE_REGISTRY)
+
+    def test__register__vendor_message_not_in_default_registry(self):
+        # Arrange / Act / Assert
+        with self.assertRaises(S2ValidationError):
+            S2Parser().parse(HEARTBEAT_JSON)
+
+    def test__register__invalid_vendor_message_names_class(self):
+        # Arrange
+        registry = S2MessageRegistry([Handshake, VendorHeartbeat])
+
+        # Act
+        with self.assertRaises(S2ValidationError) as context:
+            S2Parser(registry=registry).parse(HEARTBEAT_JSON.replace(': 3', ': "three"'))
+
+        # Assert
+        self.assertIs(context.exception.class_, VendorHeartbeat)
+
+    def test__register__duplicate_message_type(self):
+        # Arrange
+        registry = S2MessageRegistry([RevokeObject, Handshake])
+
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            registry.register_all([VendorHeartbeat, GenRevokeObject])  # type: ignore[list-item]
+        self.assertNotIn("Vendor.Heartbeat", registry)
+        self.assertIs(registry.message_class("RevokeObject"), RevokeObject)
+
+    def test__register__same_class_twice(self):
+        # Arrange
+        registry = S2MessageRegistry([Handshake])
+
+        # Act
+        registry.register(Handshake)
+
+        # Assert
+        self.assertEqual(list(registry), ["Handshake"])
+
+    def test__register__no_message_type(self):
+        # Arrange
+        registry = S2MessageRegistry()
+
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            registry.register(S2MessageComponent)  # type: ignore[type-abstract]
+
+    def test__unregister(self):
+        # Arrange
+        registry = S2MessageRegistry([Handshake, RevokeObject, VendorHeartbeat])
+
+        # Act
+        registry.unregister(VendorHeartbeat)
+        registry.unregister("RevokeObject")
+
+        # Assert
+        self.assertEqual(list(registry), ["Handshake"])
+        with self.assertRaisesRegex(S2ValidationError, "Type unknown"):
+            S2Parser(registry=registry).parse(HEARTBEAT_JSON)
+        with self.assertRaisesRegex(S2ValidationError, "Type unknown"):
+            S2Parser(trusted=True, registry=registry).parse(HEARTBEAT_JSON)
+        with self.assertRaises(KeyError):
+            registry.unregister(VendorHeartbeat)
+        with self.assertRaises(KeyError):
+            registry.unregister("RevokeObject")
+
+    def test__empty_registry(self):
+        # Arrange
+        registry = S2MessageRegistry()
+
+        # Act / Assert
+        with self.assertRaises(LookupError):
+            _ = registry.adapter
+
+    def test__message_handlers__only_registered_messages(self):
+        # Arrange
+        registry = S2MessageRegistry([Handshake])
+        handlers = MessageHandlers(registry)
+
+        # Act
+        handlers.register_handler(Handshake, lambda connection, message, send_okay: None)
+
+        # Assert
+        self.assertIn(Handshake, handlers.handlers)
+        with self.assertRaises(ValueError):
+            handlers.register_handler(RevokeObject, lambda connection, message, send_okay: None)
@@ -0,0 +1,110 @@
+import io
+import uuid
+from typing import List
+from unittest import TestCase
+
+from s2python.common import Handshake, ReceptionStatus, ReceptionStatusValues, EnergyManagementRole
+from s2python.json_codec import JSON_CODECS
+from s2python.s2_ndjson import dump_ndjson, read_ndjson, write_ndjson
+from s2python.s2_validation_error import S2ValidationError
+from s2python.validate_values_mixin import S2MessageComponent
+
+
+def example_messages(count: int) -> List[S2MessageComponent]:
+    messages: List[S2MessageComponent] = []
+    for _ in range(count):
+        messages.append(
+            Handshake(
+                message_id=uuid.uuid4(), role=EnergyManagementRole.CEM, supported_protocol_versions=["0.0.2-beta"]
+            )
+        )
+        messages.append(ReceptionStatus(subject_message_id=uuid.uuid4(), status=ReceptionStatusValues.OK))
+    return messages
+
+
+class S2NdjsonTest(TestCase):
+    def test__dump_ndjson__mixed_messages(self):
+        # Arrange
+        messages = example_messages(3)
+
+        # Act
+        output = dump_ndjson(messages)
+
+        # Assert
+        self.assertEqual(bytes(output), b"".join(message.to_json().encode("utf-8") + b"\n" for message in messages))
+
+    def test__dump_ndjson__reuse_buffer(self):
+        # Arrange
+        messages = example_messages(2)
+        buffer = bytearray(b"existing\n")
+
+        # Act
+        output = dump_ndjson(messages, buffer)
+
+        # Assert
+        self.assertIs(output, buffer)
+        self.assertTrue(output.startswith(b"existing\n"))
+        self.assertEqual(output.count(b"\n"), 5)
+
+    def test__dump_ndjson__json_codecs(self):
+        # Arrange
+        messages = example_messages(2)
+
+        for codec in JSON_CODECS.values():
+            # Act
+            output = dump_ndjson(messages, json_codec=codec)
+
+            # Assert
+            parsed = [parsed_line.message for parsed_line in read_ndjson([bytes(output)])]
+            self.assertEqual(parsed, messages)
+
+    def test__write_ndjson__roundtrip(self):
+        # Arrange
+        messages = example_messages(5)
+        file = io.BytesIO()
+
+        # Act
+        written = write_ndjson(messages, file, chunk_size=3)
+        file.seek(0)
+        parsed_lines = list(read_ndjson(file))
+
+        # Assert
+        self.assertEqual(written, 10)
+        self.assertEqual([parsed_line.line_number for parsed_line in parsed_lines], list(range(1, 11)))
+        self.assertEqual([parsed_line.message for parsed_line in parsed_lines], messages)
+
+    def test__write_ndjson__workers_preserve_order(self):
+        # Arrange
+        messages = example_messages(10)
+        file = io.BytesIO()
+
+        # Act
+        written = write_ndjson(messages, file, workers=2, chunk_size=3)
+
+        # Assert
+        self.assertEqual(written, 20)
+        self.assertEqual(file.getvalue(), bytes(dump_ndjson(messages)))
+
+    def test__dump_ndjson__unserializable_message(self):
+        # Arrange
+        message = example_messages(1)[0]
+        message.__dict__["role"] = object()
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            dump_ndjson([message])
+
+    def test__s2_message_component__roundtrip(self):
+        # Arrange
+        messages = example_messages(3)
+        file = io.BytesIO()
+
+        # Act
+        written = S2MessageComponent.write_ndjson(messages, file, chunk_size=2)
+        file.seek(0)
+        parsed_lines = list(S2MessageComponent.read_ndjson(file))
+
+        # Assert
+        self.assertEqual(written, 6)
+        self.assertEqual(bytes(S2MessageComponent.dump_ndjson(messages)), file.getvalue())
+        self.assertEqual([parsed_line.message for parsed_line in parsed_lines], messages)
@@ -0,0 +1,123 @@
+import uuid
+from unittest import TestCase
+
+from s2python.common import Handshake
+from s2python.s2_parse_cache import S2ParseCache, S2ParseCacheStats
+from s2python.s2_parser import S2Parser
+from s2python.s2_validation_error import S2ValidationError
+
+
+def handshake_json(message_id: uuid.UUID, role: str = "CEM") -> bytes:
+    return (
+        f'{{"message_id": "{message_id}", "message_type": "Handshake", "role": "{role}", '
+        f'"supported_protocol_versions": ["3.0alpha"]}}'
+    ).encode("utf-8")
+
+
+class S2ParseCacheTest(TestCase):
+    def test__parse__hit_with_new_message_id(self):
+        # Arrange
+        cache = S2ParseCache(min_message_size=0)
+        parser = S2Parser(cache=cache)
+        first_id = uuid.uuid4()
+        second_id = uuid.uuid4()
+        first = parser.parse(handshake_json(first_id))
+
+        # Act
+        second = parser.parse(handshake_json(second_id).decode("utf-8"))
+
+        # Assert
+        assert isinstance(first, Handshake)
+        assert isinstance(second, Handshake)
+        self.assertEqual(first.message_id, first_id)
+        self.assertEqual(second.message_id, second_id)
+        self.assertEqual(second.supported_protocol_versions, first.supported_protocol_versions)
+        self.assertEqual(
+            cache.stats,
+            S2ParseCacheStats(hits=1, misses=1, evictions=0, entries=1, size_bytes=len(handshake_json(first_id))),
+        )
+
+    def test__parse__different_content_is_a_miss(self):
+        # Arrange
+        cache = S2ParseCache(min_message_size=0)
+        parser = S2Parser(cache=cache)
+        parser.parse(handshake_json(uuid.uuid4(), role="CEM"))
+
+        # Act
+        parsed = parser.parse(handshake_json(uuid.uuid4(), role="RM"))
+
+        # Assert
+        assert isinstance(parsed, Handshake)
+        self.assertEqual(parsed.role.value, "RM")
+        self.assertEqual(cache.stats.misses, 2)
+        self.assertEqual(cache.stats.hits, 0)
+
+    def test__parse__small_messages_are_not_cached(self):
+        # Arrange
+        cache = S2ParseCache()
+        parser = S2Parser(cache=cache)
+
+        # Act
+        parser.parse(handshake_json(uuid.uuid4()))
+        parser.parse(handshake_json(uuid.uuid4()))
+
+        # Assert
+        self.assertEqual(cache.stats, S2ParseCacheStats())
+
+    def test__parse__evicts_least_recently_used(self):
+        # Arrange
+        cache = S2ParseCache(max_entries=1, min_message_size=0)
+        parser = S2Parser(cache=cache)
+
+        # Act
+        parser.parse(handshake_json(uuid.uuid4(), role="CEM"))
+        parser.parse(handshake_json(uuid.uuid4(), role="RM"))
+        parser.parse(handshake_json(uuid.uuid4(), role="CEM"))
+
+        # Assert
+        self.assertEqual(cache.stats.misses, 3)
+        self.assertEqual(cache.stats.evictions, 2)
+        self.assertEqual(cache.stats.entries, 1)
+
+    def test__parse__byte_limit(self):
+        # Arrange
+        cache = S2ParseCache(max_bytes=10, min_message_size=0)
+        parser = S2Parser(cache=cache)
+
+        # Act
+        parser.parse(handshake_json(uuid.uuid4()))
+
+        # Assert
+        self.assertEqual(cache.stats.entries, 0)
+        self.assertEqual(cache.stats.size_bytes, 0)
+
+    def test__parse__errors_are_not_cached(self):
+        # Arrange
+        cache = S2ParseCache(min_message_size=0)
+        parser = S2Parser(cache=cache)
+        message_json = handshake_json(uuid.uuid4(), role="NOT_A_ROLE")
+
+        # Act / Assert
+        for _ in range(2):
+            with self.assertRaises(S2ValidationError):
+                parser.parse(message_json)
+        self.assertEqual(cache.stats.entries, 0)
+        self.assertEqual(cache.stats.misses, 2)
+
+    def test__parse__miss_and_hit_are_frozen(self):
+        # Arrange
+        cache = S2ParseCache(min_message_size=0)
+        parser = S2Parser(cache=cache)
+
+        # Act
+        first = parser.parse(handshake_json(uuid.uuid4()))
+        second = parser.parse(handshake_json(uuid.uuid4()))
+
+        # Assert
+        assert isinstance(first, Handshake) and first.supported_protocol_versions is not None
+        assert isinstance(second, Handshake) and second.supported_protocol_versions is not None
+        self.assertTrue(first.is_frozen)
+        self.assertTrue(second.is_frozen)
+        with self.assertRaises(TypeError):
+            first.supported_protocol_versions.append("MUTATED")
+        self.assertEqual(second.supported_protocol_versions, ["3.0alpha"])
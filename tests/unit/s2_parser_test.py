@@ -1,12 +1,22 @@
+import json
 from unittest import TestCase
 from uuid import UUID
 
-from s2python.common import HandshakeResponse
+from s2python.common import HandshakeResponse, PowerMeasurement
 from s2python.generated.gen_s2 import EnergyManagementRole
+from s2python import frozen
+from s2python.json_codec import JSON_CODECS
+from s2python.s2_message_registry import S2MessageRegistry
+from s2python.s2_parse_cache import S2ParseCache
 from s2python.s2_parser import S2Parser
 from s2python.common.handshake import Handshake
 from s2python.s2_validation_error import S2ValidationError
 
+HANDSHAKE_LINE = (
+    b'{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "Handshake", "role": '
+    b'"CEM", "supported_protocol_versions": ["3.0alpha"]}'
+)
+
 
 class S2ParserTest(TestCase):
     def test_parse_as_any_message__str(self):
@@ -118,3 +128,255 @@ class S2ParserTest(TestCase):
         # Act / Assert
         with self.assertRaises(S2ValidationError):
             S2Parser.parse_as_message(message_json, HandshakeResponse)
+
+    def test_parse_as_any_message__bytes(self):
+        # Arrange
+        message_json = (
+            b'{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "Handshake", "role": '
+            b'"CEM", "supported_protocol_versions": ["3.0alpha"]}'
+        )
+
+        # Act
+        parsed_message = S2Parser.parse_as_any_message(message_json)
+
+        # Assert
+        self.assertEqual(
+            parsed_message,
+            Handshake(
+                message_id=UUID("ca093515-0bb3-4709-bd56-092c1808b791"),
+                role=EnergyManagementRole.CEM,
+                supported_protocol_versions=["3.0alpha"],
+            ),
+        )
+
+    def test_parse_as_any_message__str_validation_error(self):
+        # Arrange
+        message_json = '{"message_type": "Handshake", "role": "CEM", "supported_protocol_versions": ["3.0alpha"]}'
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError) as context:
+            S2Parser.parse_as_any_message(message_json)
+        self.assertIs(context.exception.class_, Handshake)
+
+    def test_parse_as_any_message__unknown_type(self):
+        # Arrange
+        message_json = '{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "Unknown"}'
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError) as context:
+            S2Parser.parse_as_any_message(message_json)
+        self.assertEqual(
+            context.exception.msg, "Unable to parse Unknown as an S2 message. Type unknown."
+        )
+
+    def test_parse_as_any_message__missing_type(self):
+        # Arrange
+        message_json = {"message_id": "ca093515-0bb3-4709-bd56-092c1808b791"}
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError) as context:
+            S2Parser.parse_as_any_message(message_json)
+        self.assertEqual(
+            context.exception.msg, "Unable to parse None as an S2 message. Type unknown."
+        )
+
+    def test_parse_as_any_message__invalid_json(self):
+        # Arrange
+        message_json = b'{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", '
+
+        # Act / Assert
+        with self.assertRaises(json.JSONDecodeError):
+            S2Parser.parse_as_any_message(message_json)
+
+    def test_parse_as_any_message__invalid_json_position(self):
+        # Arrange
+        message_json = '{"message_type": "Handshake", "role": "\u00e9",\n "message_id": x}'
+
+        # Act
+        with self.assertRaises(json.JSONDecodeError) as context:
+            S2Parser.parse_as_any_message(message_json)
+        with self.assertRaises(json.JSONDecodeError) as bytes_context:
+            S2Parser.parse_as_any_message(message_json.encode("utf-8"))
+
+        # Assert
+        self.assertEqual(context.exception.msg, "expected value")
+        self.assertEqual(context.exception.pos, message_json.index("x"))
+        self.assertEqual((context.exception.lineno, context.exception.colno), (2, 16))
+        self.assertEqual(bytes_context.exception.pos, context.exception.pos)
+
+    def test_parse_as_message__str_wrong_class(self):
+        # Arrange
+        message_json = (
+            '{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "Handshake", "role": '
+            '"CEM", "supported_protocol_versions": ["3.0alpha"]}'
+        )
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError) as context:
+            S2Parser.parse_as_message(message_json, HandshakeResponse)
+        self.assertIs(context.exception.class_, HandshakeResponse)
+
+    def test_parse_as_any_message_trusted__skips_validators(self):
+        # Arrange
+        message_json = (
+            '{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "PowerMeasurement", '
+            '"measurement_timestamp": "2024-01-01T00:00:00+00:00", "values": ['
+            '{"commodity_quantity": "ELECTRIC.POWER.L1", "value": 100.0}, '
+            '{"commodity_quantity": "ELECTRIC.POWER.L1", "value": 200.0}]}'
+        )
+
+        # Act
+        parsed_message = S2Parser.parse_as_any_message_trusted(message_json)
+
+        # Assert
+        assert isinstance(parsed_message, PowerMeasurement)
+        self.assertEqual(len(parsed_message.values), 2)
+        with self.assertRaises(S2ValidationError):
+            S2Parser.parse_as_any_message(message_json)
+
+    def test_parse_as_any_message_trusted__bytes(self):
+        # Arrange
+        message_json = (
+            b'{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "Handshake", "role": '
+            b'"CEM", "supported_protocol_versions": ["3.0alpha"]}'
+        )
+
+        # Act
+        parsed_message = S2Parser.parse_as_any_message_trusted(message_json)
+
+        # Assert
+        self.assertEqual(
+            parsed_message,
+            Handshake(
+                message_id=UUID("ca093515-0bb3-4709-bd56-092c1808b791"),
+                role=EnergyManagementRole.CEM,
+                supported_protocol_versions=["3.0alpha"],
+            ),
+        )
+
+    def test_parse_as_any_message_trusted__unknown_type(self):
+        # Arrange
+        message_json = '{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "Unknown"}'
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError) as context:
+            S2Parser.parse_as_any_message_trusted(message_json)
+        self.assertEqual(
+            context.exception.msg, "Unable to parse Unknown as an S2 message. Type unknown."
+        )
+
+    def test_parse__trusted_parser(self):
+        # Arrange
+        message_json = {
+            "message_id": "ca093515-0bb3-4709-bd56-092c1808b791",
+            "message_type": "PowerMeasurement",
+            "measurement_timestamp": "2024-01-01T00:00:00+00:00",
+            "values": [
+                {"commodity_quantity": "ELECTRIC.POWER.L1", "value": 100.0},
+                {"commodity_quantity": "ELECTRIC.POWER.L1", "value": 200.0},
+            ],
+        }
+
+        # Act
+        parsed_message = S2Parser(trusted=True).parse(message_json)
+
+        # Assert
+        self.assertIsInstance(parsed_message, PowerMeasurement)
+        with self.assertRaises(S2ValidationError):
+            S2Parser().parse(message_json)
+
+    def test_parse__json_codec(self):
+        for codec in list(JSON_CODECS.values()):
+            # Arrange
+            parser = S2Parser(json_codec=codec)
+
+            # Act
+            parsed_message = parser.parse(HANDSHAKE_LINE)
+
+            # Assert
+            self.assertIsInstance(parsed_message, Handshake)
+            with self.assertRaises(json.JSONDecodeError):
+                parser.parse(b"not json")
+
+
+class S2ParserIterParseTest(TestCase):
+    def test_iter_parse__collects_errors(self):
+        # Arrange
+        source = [
+            HANDSHAKE_LINE + b"\n\nnot json\n" + HANDSHAKE_LINE[:20],
+            HANDSHAKE_LINE[20:] + b"\n{\"message_type\": \"Unknown\"}",
+        ]
+
+        # Act
+        parsed_lines = list(S2Parser().iter_parse(source))
+
+        # Assert
+        self.assertEqual([parsed_line.line_number for parsed_line in parsed_lines], [1, 3, 4, 5])
+        self.assertIsInstance(parsed_lines[0].message, Handshake)
+        self.assertIsInstance(parsed_lines[1].error, json.JSONDecodeError)
+        self.assertIsInstance(parsed_lines[2].message, Handshake)
+        self.assertIsInstance(parsed_lines[3].error, S2ValidationError)
+
+    def test_iter_parse__workers_preserve_order(self):
+        # Arrange
+        lines = [HANDSHAKE_LINE if i % 7 else b"not json" for i in range(50)]
+        source = iter(line + b"\n" for line in lines)
+
+        # Act
+        parsed_lines = list(S2Parser().iter_parse(source, workers=2, chunk_size=4))
+
+        # Assert
+        self.assertEqual([parsed_line.line_number for parsed_line in parsed_lines], list(range(1, 51)))
+        self.assertEqual(
+            [parsed_line.error is None for parsed_line in parsed_lines], [i % 7 != 0 for i in range(50)]
+        )
+
+    def test_iter_parse__parser_settings(self):
+        # Arrange
+        source = [HANDSHAKE_LINE + b"\n"]
+
+        # Act
+        restricted_lines = list(S2Parser(registry=S2MessageRegistry([PowerMeasurement])).iter_parse(source))
+        cached_lines = list(S2Parser(cache=S2ParseCache(min_message_size=0)).iter_parse(source))
+        worker_lines = list(
+            S2Parser(registry=S2MessageRegistry([PowerMeasurement])).iter_parse(source, workers=1)
+        )
+
+        # Assert
+        self.assertIsInstance(restricted_lines[0].error, S2ValidationError)
+        self.assertIsInstance(cached_lines[0].message, Handshake)
+        self.assertTrue(frozen.is_frozen(cached_lines[0].message))  # type: ignore[arg-type]
+        self.assertIsInstance(worker_lines[0].error, S2ValidationError)
+
+    def test_iter_parse__unsupported_settings(self):
+        # Arrange
+        source = [HANDSHAKE_LINE + b"\n"]
+
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            S2Parser(lazy=True).iter_parse(source, workers=2)
+        with self.assertRaises(ValueError):
+            S2Parser(cache=S2ParseCache()).iter_parse(source, workers=2)
+
+
+class S2ParserMessageTypeTest(TestCase):
+    def test_parse_message_type__bytes(self):
+        # Arrange
+        message_json = (
+            b'{"message_id": "ca093515-0bb3-4709-bd56-092c1808b791", "message_type": "Handshake", "role": '
+            b'"CEM", "supported_protocol_versions": ["3.0alpha"]}'
+        )
+
+        # Act
+        message_type = S2Parser.parse_message_type(message_json)
+
+        # Assert
+        self.assertEqual(message_type, "Handshake")
+
+    def test_parse_message_type__invalid_json(self):
+        # Arrange
+        message_json = '{"message_type": "Handshake", "role": '
+
+        # Act / Assert
+        with self.assertRaises(json.JSONDecodeError):
+            S2Parser.parse_message_type(message_json)
@@ -0,0 +1,135 @@
+import datetime
+import uuid
+from typing import List
+from unittest import TestCase
+
+from s2python.common import CommodityQuantity, Duration, PowerMeasurement, PowerValue
+from s2python.frbc import FRBCUsageForecast, FRBCUsageForecastElement
+from s2python.s2_publisher import ChangeTolerance, S2Publisher
+
+START_TIME = datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def usage_forecast(
+    rates: List[float], start_time: datetime.datetime = START_TIME, duration_ms: int = 60_000
+) -> FRBCUsageForecast:
+    return FRBCUsageForecast(
+        message_id=uuid.uuid4(),
+        start_time=start_time,
+        elements=[
+            FRBCUsageForecastElement(duration=Duration.from_milliseconds(duration_ms), usage_rate_expected=rate)
+            for rate in rates
+        ],
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class S2PublisherTest(TestCase):
+    def test__is_changed__nothing_sent(self):
+        # Arrange
+        publisher = S2Publisher({FRBCUsageForecast: ChangeTolerance(value=1.0)})
+
+        # Act
+        changed = publisher.is_changed(usage_forecast([1.0, 2.0]))
+
+        # Assert
+        self.assertTrue(changed)
+
+    def test__is_changed__within_tolerance(self):
+        # Arrange
+        tolerance = ChangeTolerance(value=0.5, duration_ms=1000, time_shift=datetime.timedelta(seconds=5))
+        publisher = S2Publisher({FRBCUsageForecast: tolerance})
+        publisher.record_sent(usage_forecast([1.0, 2.0]))
+
+        # Act
+        changed = publisher.is_changed(
+            usage_forecast([1.4, 1.6], START_TIME + datetime.timedelta(seconds=3), duration_ms=60_500)
+        )
+
+        # Assert
+        self.assertFalse(changed)
+
+    def test__is_changed__outside_tolerance(self):
+        # Arrange
+        publisher = S2Publisher({FRBCUsageForecast: ChangeTolerance(value=0.5)})
+        publisher.record_sent(usage_forecast([1.0, 2.0]))
+
+        # Act / Assert
+        self.assertTrue(publisher.is_changed(usage_forecast([1.0, 2.6])))
+        self.assertTrue(publisher.is_changed(usage_forecast([1.0, 2.0, 3.0])))
+        self.assertTrue(publisher.is_changed(usage_forecast([1.0, 2.0], duration_ms=61_000)))
+        self.assertTrue(publisher.is_changed(usage_forecast([1.0, 2.0], START_TIME + datetime.timedelta(seconds=1))))
+
+    def test__is_changed__field_tolerance(self):
+        # Arrange
+        tolerance = ChangeTolerance(fields={"usage_rate_expected": 2.0})
+        publisher = S2Publisher({FRBCUsageForecast: tolerance})
+        publisher.record_sent(usage_forecast([1.0, 2.0]))
+
+        # Act
+        changed = publisher.is_changed(usage_forecast([2.5, 3.5]))
+
+        # Assert
+        self.assertFalse(changed)
+
+    def test__is_changed__refresh_interval(self):
+        # Arrange
+        clock = FakeClock()
+        publisher = S2Publisher({FRBCUsageForecast: ChangeTolerance(refresh_interval=60.0)}, clock)
+        publisher.record_sent(usage_forecast([1.0]))
+
+        # Act
+        clock.now = 59.0
+        changed_before_refresh = publisher.is_changed(usage_forecast([1.0]))
+        clock.now = 60.0
+        changed_at_refresh = publisher.is_changed(usage_forecast([1.0]))
+
+        # Assert
+        self.assertFalse(changed_before_refresh)
+        self.assertTrue(changed_at_refresh)
+
+    def test__is_changed__sent_message_modified_afterwards(self):
+        # Arrange
+        publisher = S2Publisher({FRBCUsageForecast: ChangeTolerance()})
+        forecast = usage_forecast([1.0])
+        publisher.record_sent(forecast)
+
+        # Act
+        forecast.elements[0].usage_rate_expected = 5.0
+        changed = publisher.is_changed(forecast)
+
+        # Assert
+        self.assertTrue(changed)
+
+    def test__is_changed__no_tolerance(self):
+        # Arrange
+        publisher = S2Publisher({FRBCUsageForecast: ChangeTolerance()})
+        measurement = PowerMeasurement(
+            message_id=uuid.uuid4(), measurement_timestamp=START_TIME,
+            values=[PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1, value=1.0)],
+        )
+        publisher.record_sent(measurement)
+
+        # Act
+        changed = publisher.is_changed(measurement)
+
+        # Assert
+        self.assertTrue(changed)
+
+    def test__reset(self):
+        # Arrange
+        publisher = S2Publisher({FRBCUsageForecast: ChangeTolerance()})
+        publisher.record_sent(usage_forecast([1.0]))
+
+        # Act
+        publisher.reset()
+
+        # Assert
+        self.assertTrue(publisher.is_changed(usage_forecast([1.0])))
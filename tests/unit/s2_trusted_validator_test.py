@@ -0,0 +1,41 @@
+from unittest import TestCase, mock
+
+from pydantic_core import SchemaValidator, core_schema
+
+from s2python import s2_trusted_validator
+from s2python.common import PowerMeasurement
+
+
+class S2TrustedValidatorTest(TestCase):
+    def test__build_trusted_validator__leaves_classes_complete(self):
+        # Arrange
+        completeness_while_compiling = []
+        schema_validator = s2_trusted_validator.SchemaValidator
+
+        def compile_schema(*args, **kwargs):
+            completeness_while_compiling.append(PowerMeasurement.__dict__["__pydantic_complete__"])
+            return schema_validator(*args, **kwargs)
+
+        # Act
+        with mock.patch.object(s2_trusted_validator, "SchemaValidator", side_effect=compile_schema) as validator:
+            s2_trusted_validator.build_trusted_validator(PowerMeasurement.__pydantic_core_schema__)
+
+        # Assert
+        expected_kwargs = {"_use_prebuilt": False} if s2_trusted_validator.SUPPORTS_USE_PREBUILT else {}
+        self.assertEqual(validator.call_args.kwargs, expected_kwargs)
+        self.assertEqual(completeness_while_compiling, [True])
+
+    def test__strip_validator_functions__keeps_references(self):
+        # Arrange
+        fields_schema = core_schema.typed_dict_schema({"value": core_schema.typed_dict_field(core_schema.int_schema())})
+        schema = core_schema.definitions_schema(
+            core_schema.definition_reference_schema("Value"),
+            [core_schema.no_info_after_validator_function(lambda value: value, fields_schema, ref="Value")],
+        )
+
+        # Act
+        stripped_schema = s2_trusted_validator.strip_validator_functions(schema)
+
+        # Assert
+        self.assertEqual(stripped_schema["definitions"], [{**fields_schema, "ref": "Value"}])
+        self.assertEqual(SchemaValidator(stripped_schema).validate_python({"value": "1"}), {"value": 1})
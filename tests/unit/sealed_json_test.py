@@ -0,0 +1,112 @@
+import datetime
+import uuid
+from unittest import TestCase
+
+from s2python.common import CommodityQuantity, PowerMeasurement, PowerValue
+
+
+def example_measurement() -> PowerMeasurement:
+    return PowerMeasurement(
+        message_id=uuid.uuid4(),
+        measurement_timestamp=datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        values=[PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1, value=10.0)],
+    )
+
+
+def serialize(measurement: PowerMeasurement) -> bytes:
+    return measurement.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+
+
+class SealedJsonTest(TestCase):
+    def test__seal__same_json(self):
+        # Arrange
+        measurement = example_measurement()
+
+        # Act
+        sealed = measurement.seal()
+
+        # Assert
+        self.assertIs(sealed, measurement)
+        self.assertTrue(measurement.is_sealed)
+        self.assertEqual(measurement.to_json_bytes(), serialize(measurement))
+        self.assertEqual(measurement.to_json(), serialize(measurement).decode("utf-8"))
+
+    def test__seal__reuses_cached_json(self):
+        # Arrange
+        measurement = example_measurement().seal()
+
+        # Act
+        first = measurement.to_json_bytes()
+        second = measurement.to_json_bytes()
+
+        # Assert
+        self.assertIs(first, second)
+
+    def test__seal__new_message_id_spliced(self):
+        # Arrange
+        measurement = example_measurement().seal()
+
+        # Act
+        measurement.message_id = uuid.uuid4()
+
+        # Assert
+        self.assertIn(str(measurement.message_id).encode("ascii"), measurement.to_json_bytes())
+        self.assertEqual(measurement.to_json_bytes(), serialize(measurement))
+
+    def test__seal__assignment_invalidates(self):
+        # Arrange
+        measurement = example_measurement().seal()
+        sealed_json = measurement.to_json_bytes()
+
+        # Act
+        measurement.measurement_timestamp = datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc)
+
+        # Assert
+        self.assertNotEqual(measurement.to_json_bytes(), sealed_json)
+        self.assertEqual(measurement.to_json_bytes(), serialize(measurement))
+
+    def test__seal__nested_assignment_invalidates(self):
+        # Arrange
+        measurement = example_measurement().seal()
+
+        # Act
+        measurement.values[0].value = 12.5
+
+        # Assert
+        self.assertEqual(measurement.to_json_bytes(), serialize(measurement))
+
+    def test__seal__nested_object_replaced(self):
+        # Arrange
+        measurement = example_measurement().seal()
+        measurement.values = [PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L2, value=1.0)]
+        measurement.to_json_bytes()
+
+        # Act
+        measurement.values[0].value = 2.0
+
+        # Assert
+        self.assertEqual(measurement.to_json_bytes(), serialize(measurement))
+
+    def test__seal__other_seals_kept(self):
+        # Arrange
+        measurement = example_measurement().seal()
+        other_measurement = example_measurement().seal()
+        other_json = other_measurement.to_json_bytes()
+
+        # Act
+        measurement.values[0].value = 12.5
+
+        # Assert
+        self.assertEqual(measurement.to_json_bytes(), serialize(measurement))
+        self.assertIs(other_measurement.to_json_bytes(), other_json)
+
+    def test__unseal(self):
+        # Arrange
+        measurement = example_measurement().seal()
+
+        # Act
+        measurement.unseal()
+
+        # Assert
+        self.assertFalse(measurement.is_sealed)
+        self.assertEqual(measurement.to_json_bytes(), serialize(measurement))
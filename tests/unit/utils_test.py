@@ -1,7 +1,7 @@
 from typing import List
 from unittest import TestCase
 
-from s2python.utils import pairwise
+from s2python.utils import chunked, pairwise
 
 
 class PairwiseTest(TestCase):
@@ -44,3 +44,25 @@ class PairwiseTest(TestCase):
 
         # Assert
         self.assertEqual(pairs, [(1, 2), (2, 3), (3, 4)])
+
+
+class ChunkedTest(TestCase):
+    def test_last_chunk_shorter(self):
+        # Arrange
+        input_array = [1, 2, 3, 4, 5]
+
+        # Act
+        chunks = list(chunked(input_array, 2))
+
+        # Assert
+        self.assertEqual(chunks, [[1, 2], [3, 4], [5]])
+
+    def test_empty(self):
+        # Arrange
+        input_array: List[int] = []
+
+        # Act
+        chunks = list(chunked(input_array, 2))
+
+        # Assert
+        self.assertEqual(chunks, [])
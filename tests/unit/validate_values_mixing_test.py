@@ -3,6 +3,9 @@ import unittest
 import datetime
 import uuid
 
+from s2python.common import CommodityQuantity, PowerMeasurement, PowerValue
+from s2python.json_codec import JSON_CODECS
+from s2python.s2_validation_error import S2ValidationError
 from s2python.validate_values_mixin import S2MessageComponent
 
 
@@ -66,3 +69,86 @@ class TestS2MessageComponent(unittest.TestCase):
         self.assertEqual(message_dict['some_float'], message.some_float)
         self.assertEqual(message_dict['some_datetime'], message.some_datetime.isoformat())
         self.assertEqual(message_dict['some_timedelta'], 'PT1H1M')
+
+    def test__from_json_trusted__skips_validators(self):
+        # Arrange
+        json_str = json.dumps({'message_id': str(uuid.uuid4()),
+                               'message_type': 'PowerMeasurement',
+                               'measurement_timestamp': '2024-01-01T00:00:00+00:00',
+                               'values': [{'commodity_quantity': 'ELECTRIC.POWER.L1', 'value': 100.0},
+                                          {'commodity_quantity': 'ELECTRIC.POWER.L1', 'value': 200.0}]})
+
+        # Act
+        message = PowerMeasurement.from_json_trusted(json_str)
+
+        # Assert
+        self.assertEqual(len(message.values), 2)
+        with self.assertRaises(S2ValidationError):
+            PowerMeasurement.from_json(json_str)
+
+    def test__from_dict_trusted__invalid_type(self):
+        # Arrange
+        json_dict = {'some_uuid': 'not-a-uuid'}
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            MockS2Message.from_dict_trusted(json_dict)
+
+    def test__to_json__json_codec(self):
+        # Arrange
+        message = example_message()
+
+        for codec in list(JSON_CODECS.values()):
+            # Act
+            json_str = message.to_json(codec)
+
+            # Assert
+            self.assertEqual(json.loads(json_str), json.loads(message.to_json()))
+            self.assertEqual(MockS2Message.from_json(json_str, codec), message)
+
+    def test__to_json_bytes__okay(self):
+        # Arrange
+        message = example_message()
+
+        for codec in [None] + list(JSON_CODECS.values()):
+            # Act
+            json_bytes = message.to_json_bytes(codec)
+
+            # Assert
+            self.assertIsInstance(json_bytes, bytes)
+            self.assertEqual(json_bytes, message.to_json(codec).encode("utf-8"))
+
+    def test__build__nested_dicts(self):
+        # Arrange
+        message_id = uuid.uuid4()
+        timestamp = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+        # Act
+        measurement = PowerMeasurement.build(
+            message_id=message_id,
+            measurement_timestamp=timestamp,
+            values=[{"commodity_quantity": "ELECTRIC.POWER.L1", "value": 10.0}],
+        )
+
+        # Assert
+        self.assertEqual(
+            measurement,
+            PowerMeasurement(
+                message_id=message_id,
+                measurement_timestamp=timestamp,
+                values=[PowerValue(commodity_quantity=CommodityQuantity.ELECTRIC_POWER_L1, value=10.0)],
+            ),
+        )
+        self.assertIsInstance(measurement.values[0], PowerValue)
+
+    def test__build__runs_validators(self):
+        # Arrange
+        value = {"commodity_quantity": "ELECTRIC.POWER.L1", "value": 10.0}
+
+        # Act / Assert
+        with self.assertRaises(S2ValidationError):
+            PowerMeasurement.build(
+                message_id=uuid.uuid4(),
+                measurement_timestamp=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+                values=[value, value],
+            )
@@ -0,0 +1,57 @@
+import json
+import uuid
+from unittest import TestCase, skipUnless
+
+from s2python.common import EnergyManagementRole, Handshake
+from s2python.s2_parser import S2Parser
+from s2python.s2_validation_error import S2ValidationError
+from s2python.wire_codec import WIRE_CODECS, get_wire_codec, select_wire_codec
+
+
+def example_handshake() -> Handshake:
+    return Handshake(
+        message_id=uuid.uuid4(), role=EnergyManagementRole.CEM, supported_protocol_versions=["0.0.2-beta"]
+    )
+
+
+class WireCodecTest(TestCase):
+    def test__encode__roundtrip(self):
+        for codec in WIRE_CODECS.values():
+            with self.subTest(codec=codec.name):
+                # Arrange
+                message = example_handshake()
+                parser = S2Parser(wire_codec=codec)
+
+                # Act
+                encoded = codec.encode(message)
+                parsed = parser.parse(encoded)
+
+                # Assert
+                self.assertIsInstance(encoded, bytes)
+                data = json.loads(message.to_json())
+                self.assertEqual(codec.loads(codec.dumps(data)), data)
+                self.assertEqual(parsed, message)
+
+    def test__decode__invalid_data(self):
+        for codec in WIRE_CODECS.values():
+            with self.subTest(codec=codec.name):
+                # Arrange
+                parser = S2Parser(wire_codec=codec)
+
+                # Act / Assert
+                with self.assertRaises(S2ValidationError):
+                    parser.parse(b"\xc1\xff\x00")
+                with self.assertRaises(S2ValidationError):
+                    parser.parse(example_handshake().to_json())
+
+    @skipUnless("msgpack" in WIRE_CODECS and "cbor" in WIRE_CODECS, "msgpack or cbor2 is not installed")
+    def test__select_wire_codec(self):
+        # Arrange
+        msgpack_codec = get_wire_codec("msgpack")
+        cbor_codec = get_wire_codec("cbor")
+
+        # Act / Assert
+        self.assertIs(select_wire_codec(["s2.cbor", "s2.msgpack"], [msgpack_codec, cbor_codec]), cbor_codec)
+        self.assertIs(select_wire_codec(["other", "s2.msgpack"], [msgpack_codec, cbor_codec]), msgpack_codec)
+        self.assertIsNone(select_wire_codec([None], [msgpack_codec, cbor_codec]))
+        self.assertIsNone(select_wire_codec(["s2.cbor"], [msgpack_codec]))